@@ -0,0 +1,201 @@
+"""
+Scaling benchmarks for the greedy algorithms.
+
+Each sweep varies one dimension of a generated instance (number of jobs,
+number of resource types, or horizon T) while the others stay at BASE.
+Run from the project root, for example:
+
+    python -m benchmarks.scaling --preset quick --output bench.json
+    python -m benchmarks.scaling --output new.json --compare bench.json
+"""
+import argparse
+import datetime
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+from src.algorithms import ALGORITHMS, engine_options
+from src.core.instance import Instance
+from src.utils.workloads import DISTRIBUTIONS, generate_instance
+
+# Instance parameters shared by all sweeps, unless a sweep overrides one
+BASE = {"num_jobs": 2000, "num_resource_types": 2, "T": 1000}
+
+PRESETS = {
+    "smoke": {
+        "num_jobs": [100, 200],
+        "num_resource_types": [1, 2],
+        "T": [100, 1000],
+    },
+    "quick": {
+        "num_jobs": [500, 1000, 2000, 4000, 8000],
+        "num_resource_types": [1, 2, 4, 8, 16],
+        "T": [100, 1_000, 10_000, 100_000],
+    },
+    "full": {
+        "num_jobs": [1000, 4000, 16_000, 64_000],
+        "num_resource_types": [1, 4, 16, 64],
+        "T": [100, 1_000, 10_000, 100_000, 1_000_000],
+    },
+}
+
+def run_case(instance: Instance, algorithm: str, engine: str,
+             repeat: int = 1, measure_memory: bool = True) -> Dict:
+    """
+    Time one algorithm on one instance.
+
+    Timing runs use fresh jobs and resources each repeat and keep the best
+    time; peak memory is measured in a separate run, because tracemalloc
+    slows down allocation-heavy code.
+
+    Args:
+        instance: Instance to schedule
+        algorithm: Key of ALGORITHMS
+        engine: Engine passed to the algorithm
+        repeat: Number of timed runs
+        measure_memory: Whether to do the extra tracemalloc run
+
+    Returns:
+        Dictionary of measurements
+    """
+    schedule = ALGORITHMS[algorithm]
+    best = float("inf")
+    for _ in range(repeat):
+        jobs, resources = instance.build()
+        start = time.perf_counter()
+        solution = schedule(jobs, resources, **engine_options(algorithm, engine))
+        best = min(best, time.perf_counter() - start)
+
+    tasks = len({(job_id, resource_type) for job_id, resource_type, _, _ in solution})
+    machines = {resource_type: len(resource.machines) for resource_type, resource in resources.items()}
+    result = {
+        "seconds": best,
+        "tasks": tasks,
+        "segments": len(solution),
+        "tasks_per_second": tasks / best if best > 0 else None,
+        "machines": machines,
+        "total_machines": sum(machines.values()),
+        "peak_memory_bytes": None,
+    }
+
+    if measure_memory:
+        jobs, resources = instance.build()
+        tracemalloc.start()
+        schedule(jobs, resources, **engine_options(algorithm, engine))
+        result["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return result
+
+def run_sweeps(preset: str, algorithms: List[str], engines: List[str], distribution: str,
+               seed: int, repeat: int, measure_memory: bool) -> List[Dict]:
+    """
+    Run every sweep of a preset for every algorithm and engine.
+
+    Returns:
+        One result dictionary per (sweep point, algorithm, engine)
+    """
+    results = []
+    for axis, values in PRESETS[preset].items():
+        for value in values:
+            params = dict(BASE, **{axis: value})
+            instance = generate_instance(distribution=distribution, seed=seed, **params)
+            for algorithm in algorithms:
+                for engine in engines:
+                    result = {"axis": axis, "value": value, "algorithm": algorithm, "engine": engine,
+                              "distribution": distribution, **params}
+                    result.update(run_case(instance, algorithm, engine, repeat, measure_memory))
+                    results.append(result)
+                    label = f"{axis}={value}"
+                    print(f"{label:<26} {algorithm:<16} {engine:<8} "
+                          f"{result['seconds']:8.3f}s {result['tasks_per_second'] or 0:12.0f} tasks/s "
+                          f"{result['total_machines']:6d} machines", flush=True)
+    return results
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def _key(result: Dict) -> tuple:
+    return (result["axis"], result["value"], result["algorithm"], result["engine"], result["distribution"])
+
+def compare(results: List[Dict], baseline_path: str, tolerance: float) -> int:
+    """
+    Print throughput relative to an earlier results file.
+
+    Args:
+        results: Current results
+        baseline_path: JSON file written by an earlier run
+        tolerance: Relative slowdown that counts as a regression
+
+    Returns:
+        Number of regressions found
+    """
+    with open(baseline_path) as f:
+        baseline = {_key(result): result for result in json.load(f)["results"]}
+
+    regressions = 0
+    for result in results:
+        old = baseline.get(_key(result))
+        if not old or not old["tasks_per_second"] or not result["tasks_per_second"]:
+            continue
+        ratio = result["tasks_per_second"] / old["tasks_per_second"]
+        flag = ""
+        if ratio < 1 - tolerance:
+            flag = "  REGRESSION"
+            regressions += 1
+        if result["total_machines"] != old["total_machines"]:
+            flag += f"  machines {old['total_machines']} -> {result['total_machines']}"
+        label = f"{result['axis']}={result['value']}"
+        print(f"{label:<26} {result['algorithm']:<16} {result['engine']:<8} "
+              f"x{ratio:5.2f}{flag}")
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Scaling benchmarks for the scheduling algorithms.")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="quick")
+    parser.add_argument("--algorithm", action="append", choices=sorted(ALGORITHMS),
+                        help="Algorithm to run (repeatable, default: all)")
+    parser.add_argument("--engine", action="append", choices=["interval", "grid", "auto"],
+                        help="Engine to run (repeatable, default: interval)")
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1, help="Timed runs per case, best is kept")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the peak memory run")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--compare", help="Compare against an earlier results file")
+    parser.add_argument("--tolerance", type=float, default=0.1,
+                        help="Relative throughput loss reported as a regression")
+    args = parser.parse_args(argv)
+
+    results = run_sweeps(args.preset, args.algorithm or sorted(ALGORITHMS), args.engine or ["interval"],
+                         args.distribution, args.seed, args.repeat, not args.no_memory)
+
+    if args.output:
+        report = {
+            "meta": {
+                "commit": _git_commit(),
+                "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "preset": args.preset,
+                "base": BASE,
+            },
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        return 1 if compare(results, args.compare, args.tolerance) else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+import time
+
+_STARTED = time.perf_counter()  # Before any other import, to measure startup
+
+import argparse
+import json
+import sys
+from typing import Optional, Sequence
+
+# Only light modules are imported here; NumPy and matplotlib are imported
+# by the options that need them (--analytics, --validate, --plot, --show)
+from .algorithms import ALGORITHMS, engine_options
+from .algorithms.grid import ENGINES
+from .core.resource import Resource
+from .core.solution import Solution
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Command-line interface of `python -m src`.
+
+    Returns:
+        Parser with the run and generate commands
+    """
+    parser = argparse.ArgumentParser(prog="python -m src", description="Scheduling algorithms simulator")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Schedule the jobs of an instance file")
+    run.add_argument("instance", help="Job file: .csv, .jsonl, or the binary format of job_files.write_binary")
+    run.add_argument("-a", "--algorithm", choices=sorted(ALGORITHMS), default="no_preemption")
+    run.add_argument("-T", type=int, help="Global time limit; required for CSV files, overrides the file otherwise")
+    run.add_argument("--engine", choices=ENGINES, default="interval", help="Engine of the greedy algorithms")
+    run.add_argument("--cost", action="append", default=[], metavar="TYPE=COST",
+                     help="Cost per machine of a resource type (default 1); repeatable")
+    run.add_argument("-o", "--output", help="Solution file: .csv, .json, .npz, or anything else for the binary format")
+    run.add_argument("-m", "--metrics", help="Write the metrics as JSON to this file instead of stdout")
+    run.add_argument("--analytics", action="store_true", help="Add utilization, idle gap and job statistics (NumPy)")
+    run.add_argument("--validate", action="store_true",
+                     help="Check the schedule and exit with status 1 if it is infeasible (NumPy)")
+    run.add_argument("--cache", metavar="DIR", help="Serve repeated runs from a result cache in this directory")
+    run.add_argument("--plot", metavar="IMAGE", help="Render the schedule to an image without a display (matplotlib)")
+    run.add_argument("--show", action="store_true", help="Open the schedule in an interactive window (matplotlib)")
+    run.set_defaults(handler=run_command)
+
+    generate = commands.add_parser("generate", help="Write a random instance file")
+    generate.add_argument("output", help="Job file to write: .csv, .jsonl, or binary for any other extension")
+    generate.add_argument("-n", "--jobs", type=int, required=True)
+    generate.add_argument("-r", "--resource-types", type=int, default=2)
+    generate.add_argument("-T", type=int, default=100)
+    generate.add_argument("--distribution", default="uniform")
+    generate.add_argument("--seed", type=int, default=0)
+    generate.set_defaults(handler=generate_command)
+    return parser
+
+def run_command(args: argparse.Namespace) -> int:
+    """
+    Load an instance, schedule it, and write the solution and metrics.
+
+    Args:
+        args: Parsed arguments of the run command
+
+    Returns:
+        Exit status
+    """
+    from .utils.job_files import load_jobs
+    from .utils.sweep import schedule_metrics
+
+    started = time.perf_counter()
+    table = load_jobs(args.instance, args.T)
+    resources = {resource_type: Resource(resource_type, table.T) for resource_type in table.resource_types}
+    for item in args.cost:
+        resource_type, _, cost = item.partition("=")
+        if resource_type not in resources or not cost.isdigit():
+            raise SystemExit(f"Invalid --cost {item!r}: expected TYPE=COST with TYPE one of {sorted(resources)}")
+        resources[resource_type].cost = int(cost)
+    loaded = time.perf_counter()
+
+    if args.cache:
+        from .utils.cache import ResultCache
+
+        cache = ResultCache(args.cache)
+        solution, cached = cache.run_with_status(args.algorithm, table, resources,
+                                                 **engine_options(args.algorithm, args.engine))
+    else:
+        cache = None
+        solution = ALGORITHMS[args.algorithm](table, resources, **engine_options(args.algorithm, args.engine))
+    scheduled = time.perf_counter()
+
+    metrics = {
+        "instance": args.instance,
+        "algorithm": args.algorithm,
+        "engine": args.engine,
+        "jobs": len(table),
+        "T": table.T,
+        "startup_seconds": started - _STARTED,
+        "load_seconds": loaded - started,
+        "seconds": scheduled - loaded,
+    }
+    metrics.update(schedule_metrics(solution, resources))
+    metrics["cost"] = sum(len(resource.machines) * resource.cost for resource in resources.values())
+    if cache is not None:
+        metrics["cached"] = cached
+
+    status = 0
+    if args.validate:
+        from .utils.validation import validate_schedule
+
+        violations = validate_schedule(solution, table, resources, complete=False, max_violations=100)
+        metrics["violations"] = [violation._asdict() for violation in violations]
+        status = 1 if violations else 0
+    if args.analytics:
+        from .utils.analytics import analyze
+
+        metrics["analytics"] = analyze(solution, resources, table)
+
+    if args.output:
+        _write_solution(solution, args.output)
+    if args.plot or args.show:
+        from .utils.visualization import plot_schedule
+
+        plot_schedule(solution, table.T, output=args.plot, show=args.show)
+
+    text = json.dumps(metrics, indent=2)
+    if args.metrics:
+        with open(args.metrics, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return status
+
+def generate_command(args: argparse.Namespace) -> int:
+    """
+    Write a random instance file.
+
+    Args:
+        args: Parsed arguments of the generate command
+
+    Returns:
+        Exit status
+    """
+    from .utils.job_files import write_binary, write_csv, write_jsonl
+    from .utils.workloads import generate_instance
+
+    instance = generate_instance(args.jobs, args.resource_types, args.T, distribution=args.distribution,
+                                 seed=args.seed)
+    if args.output.endswith(".csv"):
+        write_csv(instance, args.output)
+    elif args.output.endswith(".jsonl"):
+        write_jsonl(instance, args.output)
+    else:
+        write_binary(instance, args.output)
+    return 0
+
+def _write_solution(solution: Solution, path: str) -> None:
+    if path.endswith(".csv"):
+        with open(path, "w") as f:
+            f.write("job_id,resource_type,machine_id,start,end\n")
+            f.writelines(f"{job_id},{resource_type},{machine_id},{start},{end}\n"
+                         for job_id, resource_type, machine_id, (start, end) in solution)
+    elif path.endswith(".json"):
+        with open(path, "w") as f:
+            json.dump([[job_id, resource_type, machine_id, [start, end]]
+                       for job_id, resource_type, machine_id, (start, end) in solution], f)
+    else:
+        solution.save(path)
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Entry point of `python -m src`.
+
+    Args:
+        argv: Arguments without the program name (default: sys.argv[1:])
+
+    Returns:
+        Exit status
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        return args.handler(args)
+    except ImportError as error:  # An option needs NumPy or matplotlib
+        parser.error(str(error))
+    except (OSError, ValueError) as error:  # Unreadable or malformed files, e.g. a CSV without -T
+        parser.error(str(error))
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+from .greedy import greedy_no_preemption, greedy_weak_preemption
+from .full_preemption import first_fit_full_preemption
+
+# Algorithm entry points by name, as used by examples and benchmarks
+ALGORITHMS = {
+    "no_preemption": greedy_no_preemption,
+    "weak_preemption": greedy_weak_preemption,
+    "full_preemption": first_fit_full_preemption,
+}
+
+# Bumped whenever an algorithm's output changes, so cached schedules of older versions are not reused
+ALGORITHM_VERSIONS = {
+    "no_preemption": 1,
+    "weak_preemption": 1,
+    "full_preemption": 3,
+}
+
+# Algorithms that accept an engine argument (see grid.ENGINES)
+ENGINE_ALGORITHMS = {"no_preemption", "weak_preemption"}
+
+def engine_options(algorithm: str, engine: str) -> dict:
+    """
+    Keyword arguments selecting an engine for an algorithm of ALGORITHMS.
+    
+    Args:
+        algorithm: Key of ALGORITHMS
+        engine: One of grid.ENGINES
+        
+    Returns:
+        {"engine": engine}, or no options for algorithms with a single engine
+    """
+    return {"engine": engine} if algorithm in ENGINE_ALGORITHMS else {}
@@ -0,0 +1,304 @@
+import time
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+from ..core.interval_set import IntervalSet
+from ..core.job import Job
+from ..core.resource import Resource
+from ..core.solution import Solution
+from .greedy import greedy_no_preemption
+
+class BranchAndBoundResult(NamedTuple):
+    """
+    Outcome of branch_and_bound.
+
+    cost is the number of machines of the best schedule, each weighted by
+    its Resource.cost; lower_bound is a proven lower bound on that cost for
+    any schedule without preemption. optimal is True when the two are known
+    to coincide, either because the search finished or because the best
+    schedule meets the bound.
+    """
+    solution: Solution
+    cost: int
+    lower_bound: int
+    optimal: bool
+    nodes: int
+    seconds: float
+
+def machine_lower_bound(durations: List[int], T: int) -> int:
+    """
+    Lower bound on the machines one resource type needs: the total work
+    divided by T rounded up, and at least one machine per task longer than
+    T / 2, since no two of those fit on one machine.
+
+    Args:
+        durations: Positive task durations of the resource type
+        T: Global time limit
+
+    Returns:
+        Minimum number of machines
+    """
+    return max(-(-sum(durations) // T), sum(1 for duration in durations if 2 * duration > T))
+
+def branch_and_bound(jobs: List[Job], resources: Dict[str, Resource],
+                     time_limit: Optional[float] = 10.0, node_limit: Optional[int] = None,
+                     order_width: Optional[int] = None) -> BranchAndBoundResult:
+    """
+    Search for a schedule without preemption that uses the fewest machines.
+
+    Tasks are placed one at a time at the earliest time where both the job
+    and the machine are free. A node branches on which task to place next
+    and on the machine to put it on: any existing machine of its type where
+    it fits, or one new machine (empty machines are interchangeable, so one
+    suffices). Taking the tasks in their start order of an optimal schedule
+    rebuilds it, so the search is exact when it runs to completion.
+
+    Nodes are pruned with per-type bounds (work that does not fit in the
+    free time of the open machines needs new ones, tasks longer than T / 2
+    need a machine each) and with each job's remaining work against its
+    free time. States reached twice, up to a permutation of the machines of
+    a type, are explored once. The greedy schedule is the first incumbent
+    and the first dive follows the greedy order.
+
+    Like the greedy algorithms, the best schedule is applied to the jobs and
+    resources. Resources must not have machines yet.
+
+    Args:
+        jobs: List of jobs to schedule
+        resources: Dictionary mapping resource type to Resource objects
+        time_limit: Seconds to search before returning the best schedule so far, or None
+        node_limit: Nodes to expand before returning the best schedule so far, or None
+        order_width: Only branch on this many of the next tasks in job order,
+            which keeps large instances tractable but gives up exactness
+
+    Returns:
+        Best schedule, its cost, a proven lower bound and search statistics
+    """
+    started = time.perf_counter()
+    if any(resource.machines for resource in resources.values()):
+        raise ValueError("branch_and_bound needs resources without machines.")
+
+    types = list(resources)
+    type_index = {resource_type: r for r, resource_type in enumerate(types)}
+    horizon = [resources[resource_type].T for resource_type in types]
+    weight = [resources[resource_type].cost for resource_type in types]
+
+    # Tasks in greedy order: (job index, type index, duration)
+    tasks: List[Tuple[int, int, int]] = []
+    job_tasks: List[List[int]] = []
+    for j, job in enumerate(jobs):
+        job_tasks.append([])
+        for resource_type, duration in job.task_durations.items():
+            if duration > 0:
+                job_tasks[j].append(len(tasks))
+                tasks.append((j, type_index[resource_type], duration))
+
+    job_free = [job.available_time.copy() for job in jobs]
+    job_work = [sum(tasks[t][2] for t in job_tasks[j]) for j in range(len(jobs))]
+    for j, job in enumerate(jobs):
+        if job_work[j] > job_free[j].total or any(tasks[t][2] > job_free[j].max_length() for t in job_tasks[j]):
+            raise ValueError(f"Job {job.id} cannot fit all its tasks before T; no schedule exists.")
+
+    type_work = [0] * len(types)
+    type_durations: List[List[int]] = [[] for _ in types]
+    for _, r, duration in tasks:
+        type_work[r] += duration
+        type_durations[r].append(duration)
+    static_bound = [machine_lower_bound(type_durations[r], horizon[r]) for r in range(len(types))]
+    root_bound = sum(w * bound for w, bound in zip(weight, static_bound))
+
+    # Incumbent from the greedy algorithm, if it placed every task
+    best_cost, best_placements = _greedy_incumbent(jobs, resources, tasks, job_tasks, types)
+
+    machines: List[List[IntervalSet]] = [[] for _ in types]
+    free_time = [0] * len(types)  # Free time on the open machines of each type
+    remaining_work = list(type_work)
+    remaining = [True] * len(tasks)
+    remaining_count = len(tasks)
+    placements: List[Tuple[int, int, Tuple[int, int]]] = []  # (task, machine index, time range)
+    cost = 0
+    nodes = 0
+    seen = set()
+    complete = True
+
+    def bound() -> int:
+        total = 0
+        for r in range(len(types)):
+            extra = remaining_work[r] - free_time[r]
+            opened = len(machines[r])
+            needed = opened + (-(-extra // horizon[r]) if extra > 0 else 0)
+            total += weight[r] * max(needed, static_bound[r])
+        return total
+
+    def expand() -> Optional[Iterator[Tuple[int, int]]]:
+        nonlocal nodes, best_cost, best_placements
+        nodes += 1
+        if remaining_count == 0:
+            if cost < best_cost:
+                best_cost = cost
+                best_placements = list(placements)
+            return None
+        if bound() >= best_cost:
+            return None
+        if placements:
+            # A new machine can always take a task the job has room for, so
+            # a dead end shows as a job whose free gaps cannot hold its tasks
+            j = tasks[placements[-1][0]][0]
+            if job_work[j] and not _packs(job_free[j], [tasks[t][2] for t in job_tasks[j] if remaining[t]]):
+                return None
+
+        key = (
+            tuple(remaining),
+            tuple(tuple(sorted(tuple(machine) for machine in type_machines)) for type_machines in machines),
+            tuple(tuple(job_free[j]) for j in range(len(jobs)) if job_work[j]),
+        )
+        if key in seen:
+            return None
+        seen.add(key)
+
+        return children()
+
+    def children() -> Iterator[Tuple[int, int]]:
+        # Generated lazily: the state is restored before each resumption,
+        # and most nodes are pruned before their later children are needed
+        width = 0
+        for t, (j, r, duration) in enumerate(tasks):
+            if not remaining[t]:
+                continue
+            width += 1
+            if order_width is not None and width > order_width:
+                return
+            shapes = set()
+            for m, machine in enumerate(machines[r]):
+                shape = tuple(machine)
+                if shape in shapes:
+                    continue
+                shapes.add(shape)
+                if machine.first_common_fit(job_free[j], duration) is not None:
+                    yield (t, m)
+            if cost + weight[r] < best_cost:
+                yield (t, -1)
+
+    def apply(t: int, m: int) -> None:
+        nonlocal cost, remaining_count
+        j, r, duration = tasks[t]
+        if m < 0:
+            machines[r].append(IntervalSet([(0, horizon[r])]))
+            free_time[r] += horizon[r]
+            cost += weight[r]
+            m = len(machines[r]) - 1
+        machine = machines[r][m]
+        time_range = machine.first_common_fit(job_free[j], duration)
+        machine.split(time_range)
+        job_free[j].split(time_range)
+        free_time[r] -= duration
+        remaining_work[r] -= duration
+        job_work[j] -= duration
+        remaining[t] = False
+        remaining_count -= 1
+        placements.append((t, m, time_range))
+
+    def undo(opened: bool) -> None:
+        nonlocal cost, remaining_count
+        t, m, time_range = placements.pop()
+        j, r, duration = tasks[t]
+        machines[r][m].release(time_range)
+        job_free[j].release(time_range)
+        free_time[r] += duration
+        remaining_work[r] += duration
+        job_work[j] += duration
+        remaining[t] = True
+        remaining_count += 1
+        if opened:
+            machines[r].pop()
+            free_time[r] -= horizon[r]
+            cost -= weight[r]
+
+    stack = []  # Per open node: [children iterator, move applied from it or None]
+    node = expand()
+    if node is not None:
+        stack.append([node, None])
+    while stack:
+        if (node_limit is not None and nodes >= node_limit) or \
+                (time_limit is not None and nodes % 256 == 0 and time.perf_counter() - started > time_limit):
+            complete = False
+            break
+        frame = stack[-1]
+        if frame[1] is not None:
+            undo(frame[1] < 0)
+            frame[1] = None
+        move = next(frame[0], None)
+        if move is None:
+            stack.pop()
+            continue
+        apply(*move)
+        frame[1] = move[1]
+        node = expand()
+        if node is not None:
+            stack.append([node, None])
+
+    if best_placements is None:
+        raise ValueError("No schedule found within the search budget.")
+    solution = _apply(jobs, resources, types, tasks, best_placements)
+    exact = complete and order_width is None
+    lower_bound = best_cost if exact else root_bound
+    return BranchAndBoundResult(solution, best_cost, lower_bound, best_cost == lower_bound, nodes,
+                                time.perf_counter() - started)
+
+def _packs(free: IntervalSet, durations: List[int], exact_limit: int = 6) -> bool:
+    # Can the tasks run without overlap inside the free ranges? Exact for a
+    # few tasks; otherwise only the total and the longest task are checked.
+    if sum(durations) > free.total or max(durations) > free.max_length():
+        return False
+    if len(durations) > exact_limit:
+        return True
+    gaps = [end - start for start, end in free]
+    durations = sorted(durations, reverse=True)
+
+    def place(index: int) -> bool:
+        if index == len(durations):
+            return True
+        tried = set()
+        for g, gap in enumerate(gaps):
+            if gap >= durations[index] and gap not in tried:
+                tried.add(gap)
+                gaps[g] -= durations[index]
+                fits = place(index + 1)
+                gaps[g] += durations[index]
+                if fits:
+                    return True
+        return False
+
+    return place(0)
+
+def _greedy_incumbent(jobs: List[Job], resources: Dict[str, Resource], tasks: List[Tuple[int, int, int]],
+                      job_tasks: List[List[int]], types: List[str]):
+    copies = [job.copy() for job in jobs]
+    resource_copies = {resource_type: resource.copy() for resource_type, resource in resources.items()}
+    solution = greedy_no_preemption(copies, resource_copies)
+    if len(solution) != len(tasks):
+        return float("inf"), None
+
+    task_of = {}
+    for j, job in enumerate(jobs):
+        for t in job_tasks[j]:
+            task_of[(job.id, types[tasks[t][1]])] = t
+    placements = [
+        (task_of[(job_id, resource_type)], machine_id - 1, time_range)
+        for job_id, resource_type, machine_id, time_range in solution
+    ]
+    cost = sum(len(resource.machines) * resource.cost for resource in resource_copies.values())
+    return cost, placements
+
+def _apply(jobs: List[Job], resources: Dict[str, Resource], types: List[str],
+           tasks: List[Tuple[int, int, int]], placements: List[Tuple[int, int, Tuple[int, int]]]) -> Solution:
+    solution = Solution(resources)
+    for t, m, time_range in sorted(placements):
+        j, r, _ = tasks[t]
+        resource = resources[types[r]]
+        while len(resource.machines) <= m:
+            resource.add_machine()
+        machine = resource.machines[m]
+        machine.assign(time_range)
+        jobs[j].assign(time_range)
+        resource.update(machine)
+        solution.append((jobs[j].id, types[r], machine.id, time_range))
+    return solution
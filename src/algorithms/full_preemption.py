@@ -0,0 +1,111 @@
+from typing import Dict, Iterable, List, Optional
+from ..core.job import Job
+from ..core.machine import Machine
+from ..core.resource import Resource
+from ..core.solution import Solution
+from ..utils.scheduling_utils import iter_intersection
+from ..utils.tracing import ASSIGN, FAIL, OPEN_MACHINE, NULL_TRACER, TraceEvent, Tracer
+
+def first_fit_full_preemption(jobs: List[Job], resources: Dict[str, Resource],
+                              tracer: Optional[Tracer] = None) -> Solution:
+    """
+    Schedules tasks with full (migratory) preemption by a first-fit heuristic.
+
+    A task may be split into any number of pieces on any machines of its
+    type. Its pieces fill the earliest time that both the machine and the
+    job are free, taking the open machines in order and wrapping onto the
+    next one (a new one if needed) until the task is complete. The job's
+    free time is updated after every piece, so a job never runs in two
+    places at once, also across resource types.
+
+    When every job has a single task and is free over [0, T), this is
+    McNaughton's wrap-around rule and uses exactly machine_lower_bounds()
+    machines per resource type.
+    With several tasks per job the pieces of a job must not overlap, and
+    the heuristic can use more machines than that bound, or than the
+    greedy algorithms. Each task scans the open machines with free time,
+    so the running time grows with the number of machines.
+
+    A new machine is free whenever the job is, so a task is placed whenever
+    the job has enough free time left for it. Tasks that do not fit are
+    left out of the solution and reported as FAIL events, as the greedy
+    algorithms do; the job's other tasks are still placed.
+
+    Args:
+        jobs: List of jobs to schedule, or a JobTable
+        resources: Dictionary mapping resource type to Resource objects
+        tracer: Optional sink for assign/open-machine/fail events
+
+    Returns:
+        Solution of scheduled tasks; iterates as (job_id, resource_type, machine_id, (start_time, end_time))
+    """
+    solution = Solution(resources)
+    tracer = tracer or NULL_TRACER
+    trace = tracer.enabled
+
+    for job in jobs:
+        for resource_type, duration in job.task_durations.items():
+            if duration <= 0:
+                continue
+            if duration > job.available_time.total:
+                if trace:
+                    tracer.emit(TraceEvent(FAIL, job.id, resource_type, None, None))
+                continue
+
+            resource = resources[resource_type]
+            remaining = duration
+            for machine in resource.machines_with_free_time(1):
+                remaining = _wrap(job, resource, machine, resource_type, remaining, solution, tracer)
+                if remaining == 0:
+                    break
+            while remaining > 0:
+                resource.add_machine()
+                machine = resource.machines[-1]
+                if trace:
+                    tracer.emit(TraceEvent(OPEN_MACHINE, job.id, resource_type, machine.id, None))
+                remaining = _wrap(job, resource, machine, resource_type, remaining, solution, tracer)
+
+    tracer.flush()
+    return solution
+
+def _wrap(job: Job, resource: Resource, machine: Machine, resource_type: str, remaining: int,
+          solution: Solution, tracer: Tracer) -> int:
+    # Fill the earliest common free time of the job and the machine; returns the work left over
+    pieces = []
+    for start, end in iter_intersection(machine.available_time, job.available_time):
+        if end <= start:
+            continue  # Ranges that only touch
+        end = min(end, start + remaining)
+        pieces.append((start, end))
+        remaining -= end - start
+        if remaining == 0:
+            break
+    for time_range in pieces:
+        machine.assign(time_range)
+        job.assign(time_range)
+        solution.add(job.id, resource_type, machine.id, time_range[0], time_range[1])
+        if tracer.enabled:
+            tracer.emit(TraceEvent(ASSIGN, job.id, resource_type, machine.id, time_range))
+    if pieces:
+        resource.update(machine)
+    return remaining
+
+def machine_lower_bounds(jobs: Iterable[Job], T: int) -> Dict[str, int]:
+    """
+    Minimum number of machines per resource type under any schedule: the
+    total work of the type divided by T, rounded up. McNaughton's
+    wrap-around rule attains it when every job has a single task.
+
+    Args:
+        jobs: Jobs to schedule, or a JobTable
+        T: Global time limit
+
+    Returns:
+        Dictionary mapping resource type to its machine lower bound
+    """
+    totals: Dict[str, int] = {}
+    for job in jobs:
+        for resource_type, duration in job.task_durations.items():
+            if 0 < duration <= T:
+                totals[resource_type] = totals.get(resource_type, 0) + duration
+    return {resource_type: -(-total // T) for resource_type, total in totals.items()}
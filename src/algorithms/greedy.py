@@ -1,146 +1,283 @@
-from typing import Dict, List, Tuple
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
 from ..core.job import Job
 from ..core.machine import Machine
 from ..core.resource import Resource
-from ..utils.scheduling_utils import (
-    intersection_of_time_ranges, 
-    find_earliest_available,
-    find_earliest_availables
-)
+from ..core.solution import Solution
+from ..utils import metrics as m
+from ..utils.metrics import NULL_METRICS, Metrics
+from ..utils.scheduling_utils import first_units, iter_intersection
+from ..utils.tracing import ASSIGN, FAIL, OPEN_MACHINE, PROBE, NULL_TRACER, TraceEvent, Tracer
+from .grid import grid_no_preemption, grid_weak_preemption, use_grid
 
-def greedy_no_preemption(jobs: List[Job], resources: Dict[str, Resource]) -> List[Tuple[int, str, int, Tuple[int, int]]]:
+def place_no_preemption(job: Job, resource_type: str, duration: int, resource: Resource,
+                        solution: list, tracer: Tracer = NULL_TRACER,
+                        metrics: Metrics = NULL_METRICS) -> bool:
+    """
+    Place one task without preemption: first fit on the existing machines,
+    otherwise on a new machine.
+
+    Args:
+        job: Job the task belongs to
+        resource_type: Resource type of the task
+        duration: Required duration, must be positive
+        resource: Resource of that type
+        solution: Solution (or list) that the assignment is appended to
+        tracer: Sink for probe/assign/open-machine/fail events
+        metrics: Collector for counters, phase timers and histograms
+
+    Returns:
+        True if the task was placed
+    """
+    trace = tracer.enabled
+    measure = metrics.enabled
+    if measure:
+        probes = 0
+        metrics.observe(m.JOB_FRAGMENTS, len(job.available_time))
+        started = perf_counter()
+
+    # Try to assign to existing machines, skipping those without a large enough gap
+    if job.available_time.max_length() >= duration:
+        candidates = resource.machines_with_gap(duration)
+    else:
+        candidates = ()
+    for machine in candidates:
+        if measure:
+            probes += 1
+            metrics.observe(m.MACHINE_FRAGMENTS, len(machine.available_time))
+        try:
+            first_available = machine.available_time.first_common_fit(job.available_time, duration)
+            if trace:
+                tracer.emit(TraceEvent(PROBE, job.id, resource_type, machine.id, first_available))
+            if first_available is not None:
+                if measure:
+                    started = _end_phase(metrics, m.PHASE_PROBE, started)
+                machine.assign(first_available)
+                job.assign(first_available)
+                resource.update(machine)
+                solution.append((job.id, resource_type, machine.id, first_available))
+                if trace:
+                    tracer.emit(TraceEvent(ASSIGN, job.id, resource_type, machine.id, first_available))
+                if measure:
+                    _end_phase(metrics, m.PHASE_ASSIGN, started)
+                    _end_task(metrics, probes, 1)
+                return True
+        except ValueError:
+            if measure:
+                metrics.count(m.VALUE_ERRORS)
+            continue
+
+    # If no existing machine could handle the task, add a new one
+    if measure:
+        started = _end_phase(metrics, m.PHASE_PROBE, started)
+        metrics.count(m.MACHINES_OPENED)
+    resource.add_machine()
+    machine = resource.machines[-1]
+    if trace:
+        tracer.emit(TraceEvent(OPEN_MACHINE, job.id, resource_type, machine.id, None))
+    first_available = machine.available_time.first_common_fit(job.available_time, duration)
+    if first_available is not None:
+        solution.append((job.id, resource_type, machine.id, first_available))
+        machine.assign(first_available)
+        job.assign(first_available)
+        resource.update(machine)
+        if trace:
+            tracer.emit(TraceEvent(ASSIGN, job.id, resource_type, machine.id, first_available))
+        if measure:
+            _end_phase(metrics, m.PHASE_OPEN_MACHINE, started)
+            _end_task(metrics, probes, 1)
+        return True
+    if trace:
+        tracer.emit(TraceEvent(FAIL, job.id, resource_type, machine.id, None))
+    if measure:
+        _end_phase(metrics, m.PHASE_OPEN_MACHINE, started)
+        _end_task(metrics, probes, 0)
+    return False
+
+def place_weak_preemption(job: Job, resource_type: str, duration: int, resource: Resource,
+                          solution: list, tracer: Tracer = NULL_TRACER,
+                          metrics: Metrics = NULL_METRICS) -> bool:
+    """
+    Place one task with weak preemption: on the first existing machine with
+    enough common free time, split over the earliest slots, otherwise on a
+    new machine.
+
+    Args:
+        job: Job the task belongs to
+        resource_type: Resource type of the task
+        duration: Required duration, must be positive
+        resource: Resource of that type
+        solution: Solution (or list) that the assignments are appended to
+        tracer: Sink for probe/assign/open-machine/fail events
+        metrics: Collector for counters, phase timers and histograms
+
+    Returns:
+        True if the task was placed
+    """
+    trace = tracer.enabled
+    measure = metrics.enabled
+    if measure:
+        probes = 0
+        metrics.observe(m.JOB_FRAGMENTS, len(job.available_time))
+        started = perf_counter()
+
+    # Try to assign to existing machines, skipping those without enough free time
+    if job.available_time.total >= duration:
+        candidates = resource.machines_with_free_time(duration)
+        job_start = job.available_time[0][0]
+    else:
+        candidates = ()
+    for machine in candidates:
+        if measure:
+            probes += 1
+            metrics.observe(m.MACHINE_FRAGMENTS, len(machine.available_time))
+        try:
+            # Only the first duration units of common free time are read
+            time_slots = first_units(
+                iter_intersection(machine.available_time.iter_from(job_start), job.available_time),
+                duration
+            )
+            if trace:
+                tracer.emit(TraceEvent(PROBE, job.id, resource_type, machine.id,
+                                       time_slots[0] if time_slots else None))
+            if time_slots:  # Check if we got valid time slots
+                if measure:
+                    started = _end_phase(metrics, m.PHASE_PROBE, started)
+                for time_range in time_slots:
+                    machine.assign(time_range)
+                    job.assign(time_range)
+                    solution.append((job.id, resource_type, machine.id, time_range))
+                    if trace:
+                        tracer.emit(TraceEvent(ASSIGN, job.id, resource_type, machine.id, time_range))
+                resource.update(machine)
+                if measure:
+                    _end_phase(metrics, m.PHASE_ASSIGN, started)
+                    _end_task(metrics, probes, len(time_slots))
+                return True
+        except ValueError:
+            # Slots assigned before the failing one stay in place
+            resource.update(machine)
+            if measure:
+                metrics.count(m.VALUE_ERRORS)
+            continue
+
+    # If no existing machine could handle the task, add a new one
+    if measure:
+        started = _end_phase(metrics, m.PHASE_PROBE, started)
+        metrics.count(m.MACHINES_OPENED)
+    resource.add_machine()
+    machine = resource.machines[-1]
+    if trace:
+        tracer.emit(TraceEvent(OPEN_MACHINE, job.id, resource_type, machine.id, None))
+    time_slots = first_units(iter_intersection(machine.available_time, job.available_time), duration)
+    if time_slots:  # Check if we got valid time slots
+        for time_range in time_slots:
+            solution.append((job.id, resource_type, machine.id, time_range))
+            machine.assign(time_range)
+            job.assign(time_range)
+            if trace:
+                tracer.emit(TraceEvent(ASSIGN, job.id, resource_type, machine.id, time_range))
+        resource.update(machine)
+        if measure:
+            _end_phase(metrics, m.PHASE_OPEN_MACHINE, started)
+            _end_task(metrics, probes, len(time_slots))
+        return True
+    if trace:
+        tracer.emit(TraceEvent(FAIL, job.id, resource_type, machine.id, None))
+    if measure:
+        _end_phase(metrics, m.PHASE_OPEN_MACHINE, started)
+        _end_task(metrics, probes, 0)
+    return False
+
+def _end_phase(metrics: Metrics, phase: str, started: float) -> float:
+    now = perf_counter()
+    metrics.add_time(phase, now - started)
+    return now
+
+def _end_task(metrics: Metrics, probes: int, slots: int) -> None:
+    metrics.count(m.TASKS)
+    metrics.count(m.PROBES, probes)
+    metrics.count(m.ASSIGNS, slots)
+    if not slots:
+        metrics.count(m.FAILURES)
+    metrics.observe(m.PROBES_PER_TASK, probes)
+    metrics.observe(m.SLOTS_PER_TASK, slots)
+
+def greedy_no_preemption(jobs: List[Job], resources: Dict[str, Resource],
+                         tracer: Optional[Tracer] = None,
+                         engine: str = "interval",
+                         metrics: Optional[Metrics] = None) -> Solution:
     """
     Implements greedy algorithm without preemption.
     
     Args:
-        jobs: List of jobs to schedule
+        jobs: List of jobs to schedule, or a JobTable
         resources: Dictionary mapping resource type to Resource objects
+        tracer: Optional sink for probe/assign/open-machine/fail events
+        engine: "interval", "grid" (NumPy time grid) or "auto"; see grid.use_grid
+            for when the grid engine falls back to the interval engine
+        metrics: Optional collector for counters, phase timers and histograms;
+            the grid engine only records the overall schedule time
         
     Returns:
-        List of scheduled tasks in format (job_id, resource_type, machine_id, (start_time, end_time))
+        Solution of scheduled tasks; iterates as (job_id, resource_type, machine_id, (start_time, end_time))
     """
-    solution = []
+    metrics = metrics or NULL_METRICS
+    started = perf_counter()
+    if use_grid(engine, resources, jobs):
+        solution = grid_no_preemption(jobs, resources, tracer)
+        metrics.add_time(m.PHASE_SCHEDULE, perf_counter() - started, None)
+        return solution
     
-    # Debug print
-    print("\nInitial job requirements:")
-    for job in jobs:
-        print(f"Job {job.id}: {job.task_durations}")
+    solution = Solution(resources)
+    tracer = tracer or NULL_TRACER
     
     for job in jobs:
-        print(f"\nProcessing Job {job.id}")
         for resource_type, duration in job.task_durations.items():
             if duration <= 0:
                 continue
-                
-            print(f"  Resource {resource_type}, Duration {duration}")
-            assigned = False
-            resource = resources[resource_type]
-            
-            # Try to assign to existing machines
-            for machine in resource.machines:
-                try:
-                    available_slots = intersection_of_time_ranges(
-                        machine.available_time, 
-                        job.available_time
-                    )
-                    print(f"    Trying machine {machine.id}, Available slots: {available_slots}")
-                    
-                    first_available = find_earliest_available(available_slots, duration)
-                    if first_available is not None:
-                        machine.assign(first_available)
-                        job.assign(first_available)
-                        solution.append((job.id, resource_type, machine.id, first_available))
-                        print(f"    Assigned to machine {machine.id} at time {first_available}")
-                        assigned = True
-                        break
-                except ValueError:
-                    continue
-            
-            # If no existing machine could handle the task, add a new one
-            if not assigned:
-                resource.add_machine()
-                machine = resource.machines[-1]
-                print(f"    Added new machine {machine.id}")
-                first_available = find_earliest_available(
-                    intersection_of_time_ranges(machine.available_time, job.available_time),
-                    duration
-                )
-                if first_available is not None:
-                    solution.append((job.id, resource_type, machine.id, first_available))
-                    machine.assign(first_available)
-                    job.assign(first_available)
-                    print(f"    Assigned to new machine {machine.id} at time {first_available}")
+            place_no_preemption(job, resource_type, duration, resources[resource_type], solution, tracer, metrics)
     
+    tracer.flush()
+    metrics.add_time(m.PHASE_SCHEDULE, perf_counter() - started, None)
     return solution 
 
-def greedy_weak_preemption(jobs: List[Job], resources: Dict[str, Resource]) -> List[Tuple[int, str, int, Tuple[int, int]]]:
+def greedy_weak_preemption(jobs: List[Job], resources: Dict[str, Resource],
+                           tracer: Optional[Tracer] = None,
+                           engine: str = "interval",
+                           metrics: Optional[Metrics] = None) -> Solution:
     """
     Implements greedy algorithm with weak preemption.
     Tasks can be split but only if necessary to fit into available time slots.
     
     Args:
-        jobs: List of jobs to schedule
+        jobs: List of jobs to schedule, or a JobTable
         resources: Dictionary mapping resource type to Resource objects
+        tracer: Optional sink for probe/assign/open-machine/fail events
+        engine: "interval", "grid" (NumPy time grid) or "auto"; see grid.use_grid
+            for when the grid engine falls back to the interval engine
+        metrics: Optional collector for counters, phase timers and histograms;
+            the grid engine only records the overall schedule time
         
     Returns:
-        List of scheduled tasks in format (job_id, resource_type, machine_id, (start_time, end_time))
+        Solution of scheduled tasks; iterates as (job_id, resource_type, machine_id, (start_time, end_time))
     """
-    solution = []
+    metrics = metrics or NULL_METRICS
+    started = perf_counter()
+    if use_grid(engine, resources, jobs):
+        solution = grid_weak_preemption(jobs, resources, tracer)
+        metrics.add_time(m.PHASE_SCHEDULE, perf_counter() - started, None)
+        return solution
     
-    print("\nInitial job requirements:")
-    for job in jobs:
-        print(f"Job {job.id}: {job.task_durations}")
+    solution = Solution(resources)
+    tracer = tracer or NULL_TRACER
     
     for job in jobs:
-        print(f"\nProcessing Job {job.id}")
         for resource_type, duration in job.task_durations.items():
             if duration <= 0:
                 continue
-                
-            print(f"  Resource {resource_type}, Duration {duration}")
-            assigned = False
-            resource = resources[resource_type]
-            
-            # Try to assign to existing machines
-            for machine in resource.machines:
-                try:
-                    available_slots = intersection_of_time_ranges(
-                        machine.available_time, 
-                        job.available_time
-                    )
-                    print(f"    Trying machine {machine.id}, Available slots: {available_slots}")
-                    
-                    total_available_time = sum(end - start for start, end in available_slots)
-                    if total_available_time >= duration:
-                        # Found machine with enough total time
-                        time_slots = find_earliest_availables(available_slots, duration)
-                        if time_slots:  # Check if we got valid time slots
-                            for time_range in time_slots:
-                                machine.assign(time_range)
-                                job.assign(time_range)
-                                solution.append((job.id, resource_type, machine.id, time_range))
-                                print(f"    Assigned to machine {machine.id} at time {time_range}")
-                            assigned = True
-                            break
-                except ValueError:
-                    continue
-            
-            # If no existing machine could handle the task, add a new one
-            if not assigned:
-                resource.add_machine()
-                machine = resource.machines[-1]
-                print(f"    Added new machine {machine.id}")
-                time_slots = find_earliest_availables(
-                    intersection_of_time_ranges(machine.available_time, job.available_time),
-                    duration
-                )
-                if time_slots:  # Check if we got valid time slots
-                    for time_range in time_slots:
-                        solution.append((job.id, resource_type, machine.id, time_range))
-                        machine.assign(time_range)
-                        job.assign(time_range)
-                        print(f"    Assigned to new machine {machine.id} at time {time_range}")
-                else:
-                    print(f"    WARNING: Could not find valid time slots for job {job.id} on resource {resource_type}")
+            place_weak_preemption(job, resource_type, duration, resources[resource_type], solution, tracer, metrics)
     
+    tracer.flush()
+    metrics.add_time(m.PHASE_SCHEDULE, perf_counter() - started, None)
     return solution 
\ No newline at end of file
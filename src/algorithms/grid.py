@@ -0,0 +1,340 @@
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from ..core.job import Job
+from ..core.job_table import JobTable
+from ..core.machine import Machine
+from ..core.resource import Resource
+from ..core.solution import Solution
+from ..utils._numpy import load_numpy
+from ..utils.tracing import ASSIGN, FAIL, OPEN_MACHINE, PROBE, NULL_TRACER, TraceEvent, Tracer
+
+np = None  # NumPy, imported on the first grid run so that importing the algorithms stays fast
+
+ENGINES = ("interval", "grid", "auto")
+GRID_MAX_HORIZON = 1 << 16  # Longest horizon stored as a dense grid
+GRID_MEMORY_BUDGET = 1 << 28  # Bytes the occupancy matrices may be expected to take
+_FIRST_CHUNK = 32  # Machine rows probed together before widening the scan
+
+def use_grid(engine: str, resources: Dict[str, Resource], jobs: Iterable[Job] = ()) -> bool:
+    """
+    Decide whether a run should use the time-grid engine.
+
+    "auto" picks the faster engine. On every workload benchmarked so far
+    (uniform, exponential, Pareto and bimodal durations, T from 10 to 1000,
+    200 to 20000 jobs) the grid engine was 2.5-6x slower than the interval
+    engine, so "auto" currently resolves to the interval engine.
+
+    "grid" uses the grid engine when every resource has an integer horizon of
+    at most GRID_MAX_HORIZON and the estimated size of the occupancy matrices
+    fits in GRID_MEMORY_BUDGET; otherwise the run falls back to the interval
+    engine. The estimate counts one byte per machine and time unit, for the
+    existing machines plus the work of the jobs divided by T, doubled for the
+    matrices' growth.
+
+    Args:
+        engine: One of "interval", "grid" or "auto"
+        resources: Dictionary mapping resource type to Resource objects
+        jobs: Jobs the run will schedule, or a JobTable, for the memory estimate
+
+    Returns:
+        True if the grid engine should be used
+
+    Raises:
+        ValueError: If the engine name is unknown
+        ImportError: If "grid" is requested and NumPy is not installed
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine: {engine}")
+    if engine != "grid":
+        return False
+    global np
+    np = load_numpy()
+    if np is None:  # The grid engine is optional
+        raise ImportError("The grid engine requires NumPy.")
+    if not all(isinstance(resource.T, int) and 0 < resource.T <= GRID_MAX_HORIZON
+               for resource in resources.values()):
+        return False
+    return grid_memory_estimate(resources, jobs) <= GRID_MEMORY_BUDGET
+
+def grid_memory_estimate(resources: Dict[str, Resource], jobs: Iterable[Job] = ()) -> int:
+    """
+    Estimate the bytes the grid engine's occupancy matrices take for a run.
+
+    Args:
+        resources: Dictionary mapping resource type to Resource objects
+        jobs: Jobs the run will schedule, or a JobTable
+
+    Returns:
+        Estimated size in bytes
+    """
+    work = _work_per_type(jobs)
+    cells = 0
+    for resource_type, resource in resources.items():
+        rows = len(resource.machines) - (-work.get(resource_type, 0) // resource.T)
+        cells += 2 * rows * resource.T
+    return cells
+
+def _work_per_type(jobs: Iterable[Job]) -> Dict[str, int]:
+    work: Dict[str, int] = {}
+    if isinstance(jobs, JobTable):  # Sum the columns instead of building Job views
+        width = jobs.width
+        for column, resource_type in enumerate(jobs.resource_types):
+            work[resource_type] = sum(d for d in jobs.durations[column::width] if d > 0)
+        return work
+    if isinstance(jobs, Iterator):  # Summing would consume the jobs before the run
+        return work
+    for job in jobs:
+        for resource_type, duration in job.task_durations.items():
+            if duration > 0:
+                work[resource_type] = work.get(resource_type, 0) + duration
+    return work
+
+class _Grid:
+    """
+    Occupancy of all machines of one resource as a (machines x T) boolean matrix,
+    with each machine's largest free gap and total free time alongside.
+    """
+    def __init__(self, resource: Resource, horizon: int):
+        self.resource = resource
+        self.horizon = horizon
+        capacity = max(len(resource.machines), 4)
+        self.free = np.zeros((capacity, horizon), dtype=bool)
+        self.gap = np.zeros(capacity, dtype=np.int64)
+        self.total = np.zeros(capacity, dtype=np.int64)
+        self.count = 0
+        for machine in resource.machines:
+            self.add_row(machine)
+
+    def add_row(self, machine: Machine) -> None:
+        if self.count == len(self.free):
+            self.free = _grow(self.free, self.count)
+            self.gap = _grow(self.gap, self.count)
+            self.total = _grow(self.total, self.count)
+        self.free[self.count] = _row(machine.available_time, self.horizon)
+        self.count += 1
+        self.refresh(self.count - 1)
+
+    def refresh(self, row: int) -> None:
+        machine = self.resource.machines[row]
+        self.gap[row] = machine.available_time.max_length()
+        self.total[row] = machine.available_time.total
+        self.resource.update(machine)
+
+def _grow(array: "np.ndarray", count: int) -> "np.ndarray":
+    grown = np.zeros((2 * len(array),) + array.shape[1:], dtype=array.dtype)
+    grown[:count] = array[:count]
+    return grown
+
+def _row(available_time, horizon: int) -> "np.ndarray":
+    row = np.zeros(horizon, dtype=bool)
+    for start, end in available_time:
+        row[start:min(end, horizon)] = True
+    return row
+
+def _window(job_free: "np.ndarray") -> Tuple[int, int]:
+    free = np.flatnonzero(job_free)
+    if len(free) == 0:
+        return 0, 0
+    return int(free[0]), int(free[-1]) + 1
+
+def _first_run(row: "np.ndarray", duration: int) -> Optional[int]:
+    """Start of the first run of at least duration free cells in a row."""
+    sums = np.concatenate(([0], np.cumsum(row, dtype=np.int64)))
+    fits = np.flatnonzero(sums[duration:] - sums[:-duration] == duration)
+    return int(fits[0]) if len(fits) else None
+
+def _first_fitting_row(grid: _Grid, job_free: "np.ndarray", duration: int,
+                       lo: int, hi: int) -> Tuple[int, int]:
+    """
+    First machine row with a run of at least duration cells free for both the
+    machine and the job, and the run's start. Rows whose largest gap is too
+    small are skipped; the rest are scanned in chunks of growing size so that
+    an early fit does not pay for the whole matrix.
+    """
+    rows = np.flatnonzero(grid.gap[:grid.count] >= duration)
+    chunk = _FIRST_CHUNK
+    for offset in range(0, len(rows), chunk):
+        block = rows[offset:offset + chunk]
+        chunk *= 2
+        common = grid.free[block, lo:hi] & job_free[lo:hi]
+        sums = np.zeros((len(block), hi - lo + 1), dtype=np.int32)
+        np.cumsum(common, axis=1, dtype=np.int32, out=sums[:, 1:])
+        fits = sums[:, duration:] - sums[:, :-duration] == duration
+        hits = np.flatnonzero(fits.any(axis=1))
+        if len(hits):
+            return int(block[hits[0]]), lo + int(np.argmax(fits[hits[0]]))
+    return -1, -1
+
+def _earliest_slots(machine_free: "np.ndarray", job_free: "np.ndarray",
+                    duration: int) -> List[Tuple[int, int]]:
+    """
+    Earliest slots summing to duration, as find_earliest_availables would
+    pick them from intersection_of_time_ranges.
+
+    Besides the common free runs, that intersection reports a zero-length
+    range wherever a free range of one side ends exactly where a free range
+    of the other side starts; those are reproduced so the two engines agree.
+    """
+    common = machine_free & job_free
+    edges = np.flatnonzero(np.diff(np.concatenate(([False], common, [False])).view(np.int8)))
+    starts, ends = edges[0::2], edges[1::2]
+
+    m, j = machine_free, job_free
+    touches = np.flatnonzero((m[:-1] & ~m[1:] & ~j[:-1] & j[1:]) |
+                             (j[:-1] & ~j[1:] & ~m[:-1] & m[1:])) + 1
+    if len(touches):
+        starts = np.concatenate((starts, touches))
+        ends = np.concatenate((ends, touches))
+        order = np.argsort(starts, kind="stable")
+        starts, ends = starts[order], ends[order]
+
+    covered = np.cumsum(ends - starts)
+    last = int(np.searchsorted(covered, duration))
+    if last == len(covered):
+        return []
+
+    slots = [(int(start), int(end)) for start, end in zip(starts[:last + 1], ends[:last + 1])]
+    overflow = int(covered[last]) - duration
+    slots[-1] = (slots[-1][0], slots[-1][1] - overflow)
+    return slots
+
+def _place(grid: _Grid, row: int, job: Job, job_free: "np.ndarray", time_range: Tuple[int, int],
+           solution: Solution, resource_type: str, tracer: Tracer, trace: bool) -> None:
+    machine = grid.resource.machines[row]
+    machine.assign(time_range)
+    job.assign(time_range)
+    start, end = time_range
+    grid.free[row, start:end] = False
+    job_free[start:end] = False
+    solution.append((job.id, resource_type, machine.id, time_range))
+    if trace:
+        tracer.emit(TraceEvent(ASSIGN, job.id, resource_type, machine.id, time_range))
+
+def _open_machine(grid: _Grid, job: Job, resource_type: str, tracer: Tracer, trace: bool) -> int:
+    grid.resource.add_machine()
+    machine = grid.resource.machines[-1]
+    grid.add_row(machine)
+    if trace:
+        tracer.emit(TraceEvent(OPEN_MACHINE, job.id, resource_type, machine.id, None))
+    return grid.count - 1
+
+def grid_no_preemption(jobs: List[Job], resources: Dict[str, Resource],
+                       tracer: Optional[Tracer] = None) -> Solution:
+    """
+    Greedy without preemption on a dense time grid.
+
+    Produces the same schedule as greedy_no_preemption: first-fit over all
+    machines of a resource is a sliding-window sum over the common free cells
+    of every machine at once.
+
+    Args:
+        jobs: List of jobs to schedule, or a JobTable
+        resources: Dictionary mapping resource type to Resource objects
+        tracer: Optional sink for probe/assign/open-machine/fail events
+
+    Returns:
+        Solution of scheduled tasks; iterates as (job_id, resource_type, machine_id, (start_time, end_time))
+    """
+    solution = Solution(resources)
+    tracer = tracer or NULL_TRACER
+    trace = tracer.enabled
+    horizon = max(resource.T for resource in resources.values())
+    grids = {resource_type: _Grid(resource, horizon) for resource_type, resource in resources.items()}
+
+    for job in jobs:
+        job_free = _row(job.available_time, horizon)
+        for resource_type, duration in job.task_durations.items():
+            if duration <= 0:
+                continue
+
+            grid = grids[resource_type]
+            lo, hi = _window(job_free)
+            row = -1
+            if hi - lo >= duration:
+                row, start = _first_fitting_row(grid, job_free, duration, lo, hi)
+            if row >= 0:
+                time_range = (start, start + duration)
+                if trace:
+                    tracer.emit(TraceEvent(PROBE, job.id, resource_type, row + 1, time_range))
+                _place(grid, row, job, job_free, time_range, solution, resource_type, tracer, trace)
+                grid.refresh(row)
+                continue
+
+            # No existing machine can hold the task, add a new one
+            row = _open_machine(grid, job, resource_type, tracer, trace)
+            start = _first_run(grid.free[row] & job_free, duration)
+            if start is not None:
+                _place(grid, row, job, job_free, (start, start + duration), solution, resource_type, tracer, trace)
+                grid.refresh(row)
+            elif trace:
+                tracer.emit(TraceEvent(FAIL, job.id, resource_type, row + 1, None))
+
+    tracer.flush()
+    return solution
+
+def grid_weak_preemption(jobs: List[Job], resources: Dict[str, Resource],
+                         tracer: Optional[Tracer] = None) -> Solution:
+    """
+    Greedy with weak preemption on a dense time grid.
+
+    Produces the same schedule as greedy_weak_preemption: the machines with
+    enough common free time are found with one row sum over all machines.
+
+    Args:
+        jobs: List of jobs to schedule, or a JobTable
+        resources: Dictionary mapping resource type to Resource objects
+        tracer: Optional sink for probe/assign/open-machine/fail events
+
+    Returns:
+        Solution of scheduled tasks; iterates as (job_id, resource_type, machine_id, (start_time, end_time))
+    """
+    solution = Solution(resources)
+    tracer = tracer or NULL_TRACER
+    trace = tracer.enabled
+    horizon = max(resource.T for resource in resources.values())
+    grids = {resource_type: _Grid(resource, horizon) for resource_type, resource in resources.items()}
+
+    for job in jobs:
+        job_free = _row(job.available_time, horizon)
+        for resource_type, duration in job.task_durations.items():
+            if duration <= 0:
+                continue
+
+            grid = grids[resource_type]
+            lo, hi = _window(job_free)
+            candidates = []
+            if hi - lo >= duration:
+                rows = np.flatnonzero(grid.total[:grid.count] >= duration)
+                totals = np.count_nonzero(grid.free[rows, lo:hi] & job_free[lo:hi], axis=1)
+                candidates = rows[totals >= duration]
+
+            assigned = False
+            for row in candidates:
+                row = int(row)
+                time_slots = _earliest_slots(grid.free[row], job_free, duration)
+                if trace:
+                    tracer.emit(TraceEvent(PROBE, job.id, resource_type, row + 1,
+                                           time_slots[0] if time_slots else None))
+                try:
+                    for time_range in time_slots:
+                        _place(grid, row, job, job_free, time_range, solution, resource_type, tracer, trace)
+                except ValueError:
+                    # A zero-length slot; slots assigned before it stay in place
+                    continue
+                finally:
+                    grid.refresh(row)
+                if time_slots:
+                    assigned = True
+                    break
+
+            # If no existing machine could handle the task, add a new one
+            if not assigned:
+                row = _open_machine(grid, job, resource_type, tracer, trace)
+                time_slots = _earliest_slots(grid.free[row], job_free, duration)
+                for time_range in time_slots:
+                    _place(grid, row, job, job_free, time_range, solution, resource_type, tracer, trace)
+                grid.refresh(row)
+                if not time_slots and trace:
+                    tracer.emit(TraceEvent(FAIL, job.id, resource_type, row + 1, None))
+
+    tracer.flush()
+    return solution
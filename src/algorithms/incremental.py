@@ -0,0 +1,153 @@
+from collections import namedtuple
+from typing import Dict, List, Optional, Tuple
+from ..core.job import Job
+from ..core.resource import Resource
+from ..core.solution import Solution
+from ..utils.tracing import Tracer
+from .online import OnlineScheduler
+
+# Assignments that disappeared from and appeared in the schedule after one change
+ScheduleDiff = namedtuple("ScheduleDiff", ["removed", "added"])
+
+class IncrementalScheduler(OnlineScheduler):
+    """
+    Keeps a schedule up to date as jobs are inserted, removed or resized.
+
+    Insertions use the greedy placement rules, so inserting the jobs of a
+    list in order gives the same schedule as the greedy algorithm. Removing
+    a job gives its time from the committed horizon on back to its machines
+    (merged with neighbouring free time) and resizing re-places only the
+    tasks whose duration changed; other jobs never move. Each change costs
+    time in the number of affected tasks, not in the size of the schedule,
+    so after removals the schedule can differ from a full rerun.
+    """
+    def __init__(self, resources: Dict[str, Resource], algorithm: str = "no_preemption",
+                 tracer: Optional[Tracer] = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            resources: Dictionary mapping resource type to Resource objects
+            algorithm: "no_preemption" or "weak_preemption"
+            tracer: Optional sink for probe/assign/open-machine/fail events
+        """
+        super().__init__(resources, algorithm, tracer)
+        self.jobs: Dict[int, Job] = {}
+        self._assignments: Dict[int, List[Tuple[int, str, int, Tuple[int, int]]]] = {}
+
+    def submit(self, job: Job) -> List[Tuple[int, str, int, Tuple[int, int]]]:
+        """
+        Place all tasks of a new job and remember them.
+
+        Args:
+            job: Job to place; its id must not be scheduled already
+
+        Returns:
+            The job's scheduled tasks in format (job_id, resource_type, machine_id, (start_time, end_time))
+        """
+        if job.id in self.jobs:
+            raise ValueError(f"Job {job.id} is already scheduled.")
+        assignments = super().submit(job)
+        self.jobs[job.id] = job
+        self._assignments[job.id] = assignments
+        return list(assignments)
+
+    def insert(self, job: Job) -> ScheduleDiff:
+        """
+        Add a job to the schedule.
+
+        Args:
+            job: Job to place; its id must not be scheduled already
+
+        Returns:
+            Diff with the job's new assignments
+        """
+        return ScheduleDiff([], self.submit(job))
+
+    def remove(self, job_id: int) -> ScheduleDiff:
+        """
+        Cancel a job and free its time on every machine.
+
+        Args:
+            job_id: Identifier of a scheduled job
+
+        Returns:
+            Diff with the job's former assignments
+        """
+        job = self.jobs.pop(job_id)
+        assignments = self._assignments.pop(job_id)
+        self._release(job, assignments)
+        return ScheduleDiff(assignments, [])
+
+    def resize(self, job_id: int, task_durations: Dict[str, int]) -> ScheduleDiff:
+        """
+        Change a job's task durations and re-place the tasks that changed.
+
+        Tasks are re-placed in the order of task_durations, after their old
+        time has been released, so a task may move within the time it held.
+
+        Args:
+            job_id: Identifier of a scheduled job
+            task_durations: New dictionary mapping resource types to required duration
+
+        Returns:
+            Diff of the job's assignments; unchanged assignments are left out
+        """
+        job = self.jobs[job_id]
+        changed = {
+            resource_type
+            for resource_type in set(job.task_durations) | set(task_durations)
+            if job.task_durations.get(resource_type, 0) != task_durations.get(resource_type, 0)
+        }
+        kept = []
+        released = []
+        for assignment in self._assignments[job_id]:
+            (released if assignment[1] in changed else kept).append(assignment)
+        self._release(job, released)
+        job.task_durations = task_durations
+
+        added = []
+        for resource_type, duration in task_durations.items():
+            if resource_type in changed and duration > 0:
+                self._place(job, resource_type, duration, self.resources[resource_type], added, self._tracer)
+        self._assignments[job_id] = kept + added
+
+        unchanged = set(released) & set(added)
+        return ScheduleDiff([a for a in released if a not in unchanged],
+                            [a for a in added if a not in unchanged])
+
+    def assignments(self, job_id: int) -> List[Tuple[int, str, int, Tuple[int, int]]]:
+        """
+        Get the current assignments of a job.
+
+        Args:
+            job_id: Identifier of a scheduled job
+
+        Returns:
+            The job's scheduled tasks in format (job_id, resource_type, machine_id, (start_time, end_time))
+        """
+        return list(self._assignments[job_id])
+
+    def solution(self) -> Solution:
+        """
+        Collect the current schedule.
+
+        Returns:
+            All assignments, grouped by job in insertion order
+        """
+        solution = Solution(self.resources)
+        for assignments in self._assignments.values():
+            solution.extend(assignments)
+        return solution
+
+    def _release(self, job: Job, assignments: List[Tuple[int, str, int, Tuple[int, int]]]) -> None:
+        # Time before the committed horizon has passed, so only the rest is given back
+        for _, resource_type, machine_id, (start, end) in assignments:
+            start = max(start, self.horizon)
+            if start >= end:
+                continue
+            resource = self.resources[resource_type]
+            machine = resource.machines[machine_id - 1]
+            machine.release((start, end))
+            job.release((start, end))
+            resource.update(machine)
@@ -0,0 +1,218 @@
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+from ..core.interval_set import IntervalSet
+from ..core.job import Job
+from ..core.resource import Resource
+from ..core.solution import Solution
+from .online import PLACEMENT
+
+# A job as sent to worker processes: (job_id, free time ranges, ((resource_type, duration), ...))
+JobSpec = Tuple[int, Tuple[Tuple[int, int], ...], Tuple[Tuple[str, int], ...]]
+
+def local_search(jobs: List[Job], resources: Dict[str, Resource], algorithm: str = "no_preemption",
+                 time_limit: float = 10.0, restarts: Optional[int] = None,
+                 workers: Optional[int] = None, seed: int = 0,
+                 checkpoint_every: Optional[int] = None) -> Solution:
+    """
+    Improve a greedy schedule by searching over the order of jobs and of
+    each job's tasks.
+
+    Each restart starts from a seed order (the input order, longest job
+    first, longest task first, then random orders) and applies random swap,
+    insert and task-reorder moves, keeping a move unless it places fewer
+    tasks or opens more machines (weighted by Resource.cost); ties are
+    broken towards emptying the least loaded machine. A candidate is
+    evaluated by restoring a snapshot of the machines taken before the
+    first position the move changed and replaying only the rest of the
+    order, and it is abandoned as soon as it is worse than the current one.
+
+    Restarts run in parallel worker processes until the time budget is
+    spent; the best order is then replayed on the given jobs and resources,
+    so they end up in the same state as after a greedy run.
+
+    Args:
+        jobs: List of jobs to schedule
+        resources: Dictionary mapping resource type to Resource objects, without machines
+        algorithm: Placement rule, "no_preemption" or "weak_preemption"
+        time_limit: Time budget in seconds, measured with a monotonic clock
+        restarts: Number of independent restarts (default: one per worker)
+        workers: Number of worker processes (default: all CPUs); 0 or 1 runs in this process
+        seed: Random seed
+        checkpoint_every: Jobs between machine snapshots (default: about sqrt of the job count)
+
+    Returns:
+        Solution of scheduled tasks; iterates as (job_id, resource_type, machine_id, (start_time, end_time))
+    """
+    if algorithm not in PLACEMENT:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    # The monotonic clock is system-wide, so worker processes can compare against the same deadline
+    deadline = time.monotonic() + time_limit
+    specs = [
+        (job.id, tuple(job.available_time), tuple((rt, d) for rt, d in job.task_durations.items() if d > 0))
+        for job in jobs
+    ]
+    setup = {resource_type: (resource.T, resource.cost) for resource_type, resource in resources.items()}
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if restarts is None:
+        restarts = max(1, workers)
+    if checkpoint_every is None:
+        checkpoint_every = max(1, int(len(jobs) ** 0.5))
+
+    tasks = [(specs, setup, algorithm, kind, seed + kind, deadline, checkpoint_every) for kind in range(restarts)]
+    if workers <= 1 or restarts == 1:
+        # Run the restarts one after another, each with an equal share of the budget
+        results = []
+        for index, task in enumerate(tasks):
+            now = time.monotonic()
+            share = (deadline - now) / (restarts - index)
+            results.append(_search(task[:5] + (now + share,) + task[6:]))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, restarts)) as executor:
+            results = list(executor.map(_search, tasks))
+
+    _, order, task_orders = min(results, key=lambda result: result[0])
+    place = PLACEMENT[algorithm]
+    solution = Solution(resources)
+    for j in order:
+        job = jobs[j]
+        for resource_type, duration in task_orders[j]:
+            place(job, resource_type, duration, resources[resource_type], solution)
+    return solution
+
+def seed_order(specs: Sequence[JobSpec], kind: int, rng: random.Random) -> Tuple[List[int], List[Tuple]]:
+    """
+    Starting job order and task orders of a restart.
+
+    Args:
+        specs: Jobs as (job_id, free time ranges, ((resource_type, duration), ...))
+        kind: 0 for the input order, 1 for longest job first, 2 for longest
+            task first, anything else for a random order
+        rng: Random number generator for random orders
+
+    Returns:
+        Tuple of (job indexes in order, per job its (resource_type, duration) pairs in order)
+    """
+    order = list(range(len(specs)))
+    if kind == 0:
+        return order, [spec[2] for spec in specs]
+
+    task_orders = [tuple(sorted(spec[2], key=lambda task: -task[1])) for spec in specs]
+    if kind == 1:
+        order.sort(key=lambda j: -sum(d for _, d in specs[j][2]))
+    elif kind == 2:
+        order.sort(key=lambda j: -max((d for _, d in specs[j][2]), default=0))
+    else:
+        rng.shuffle(order)
+    return order, task_orders
+
+class _Evaluator:
+    """
+    Replays the greedy placement for an order from machine snapshots.
+    """
+    def __init__(self, specs: Sequence[JobSpec], setup: Dict[str, Tuple[int, int]], algorithm: str,
+                 checkpoint_every: int):
+        self.specs = specs
+        self.setup = setup
+        self.place = PLACEMENT[algorithm]
+        self.every = checkpoint_every
+
+    def fresh(self) -> Tuple[Dict[str, Resource], int]:
+        resources = {}
+        for resource_type, (T, cost) in self.setup.items():
+            resources[resource_type] = Resource(resource_type, T)
+            resources[resource_type].cost = cost
+        return resources, 0
+
+    def run(self, order: List[int], task_orders: List[Tuple], snapshots: List, start: int,
+            limit: Optional[Tuple] = None):
+        """
+        Evaluate an order that matches the snapshotted one before position start.
+
+        Returns:
+            Tuple of (objective, snapshots for this order), or None if the
+            order became worse than limit during the replay
+        """
+        index = start // self.every
+        resources, failures = snapshots[index]
+        resources = {resource_type: resource.copy() for resource_type, resource in resources.items()}
+        snapshots = snapshots[:index + 1]
+        place = self.place
+        specs = self.specs
+
+        for position in range(index * self.every, len(order)):
+            if position % self.every == 0 and position > index * self.every:
+                snapshots.append(({rt: r.copy() for rt, r in resources.items()}, failures))
+                if limit is not None and (failures, _cost(resources)) > limit[:2]:
+                    return None
+            j = order[position]
+            job_id, free, _ = specs[j]
+            job = Job(job_id, None, 0)
+            job.available_time = IntervalSet(free)
+            for resource_type, duration in task_orders[j]:
+                if not place(job, resource_type, duration, resources[resource_type], _Discard):
+                    failures += 1
+
+        objective = (failures, _cost(resources), _lightest(resources))
+        return objective, snapshots
+
+class _DiscardList:
+    # Placement functions append assignments; local search only needs the machines
+    @staticmethod
+    def append(_) -> None:
+        pass
+
+_Discard = _DiscardList()
+
+def _cost(resources: Dict[str, Resource]) -> int:
+    return sum(len(resource.machines) * resource.cost for resource in resources.values())
+
+def _lightest(resources: Dict[str, Resource]) -> int:
+    # Busy time of the least loaded machine; lower means a machine is closer to being freed
+    busy = [resource.T - machine.available_time.total
+            for resource in resources.values() for machine in resource.machines]
+    return min(busy, default=0)
+
+def _search(task) -> Tuple[Tuple, List[int], List[Tuple]]:
+    specs, setup, algorithm, kind, seed, deadline, checkpoint_every = task
+    rng = random.Random(seed)
+    evaluator = _Evaluator(specs, setup, algorithm, checkpoint_every)
+    order, task_orders = seed_order(specs, kind, rng)
+
+    objective, snapshots = evaluator.run(order, task_orders, [evaluator.fresh()], 0)
+    best = (objective, list(order), list(task_orders))
+    n = len(order)
+    multi_task = [j for j in range(n) if len(specs[j][2]) > 1]
+
+    while time.monotonic() < deadline and n > 1:
+        candidate = list(order)
+        candidate_tasks = task_orders
+        move = rng.random()
+        if move < 0.4:
+            a, b = rng.sample(range(n), 2)
+            candidate[a], candidate[b] = candidate[b], candidate[a]
+            start = min(a, b)
+        elif move < 0.8 or not multi_task:
+            a, b = rng.sample(range(n), 2)
+            candidate.insert(b, candidate.pop(a))
+            start = min(a, b)
+        else:
+            j = rng.choice(multi_task)
+            reordered = list(task_orders[j])
+            rng.shuffle(reordered)
+            candidate_tasks = list(task_orders)
+            candidate_tasks[j] = tuple(reordered)
+            start = candidate.index(j)
+
+        result = evaluator.run(candidate, candidate_tasks, snapshots, start, objective)
+        if result is None or result[0] > objective:
+            continue
+        objective, snapshots = result
+        order, task_orders = candidate, candidate_tasks
+        if objective < best[0]:
+            best = (objective, list(order), list(task_orders))
+
+    return best
@@ -0,0 +1,117 @@
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from ..core.job import Job
+from ..core.resource import Resource
+from ..utils.tracing import NULL_TRACER, Tracer
+from .greedy import place_no_preemption, place_weak_preemption
+
+# Per-task placement rule of each greedy algorithm
+PLACEMENT = {
+    "no_preemption": place_no_preemption,
+    "weak_preemption": place_weak_preemption,
+}
+
+class OnlineScheduler:
+    """
+    Places jobs one at a time as they arrive, with the placement rules of the
+    greedy algorithms. Submitting the jobs of a list in order gives the same
+    schedule as running the greedy algorithm on that list.
+    """
+    def __init__(self, resources: Dict[str, Resource], algorithm: str = "no_preemption",
+                 tracer: Optional[Tracer] = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            resources: Dictionary mapping resource type to Resource objects
+            algorithm: "no_preemption" or "weak_preemption"
+            tracer: Optional sink for probe/assign/open-machine/fail events
+        """
+        if algorithm not in PLACEMENT:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        self.resources = resources
+        self.horizon = 0
+        self._place = PLACEMENT[algorithm]
+        self._tracer = tracer or NULL_TRACER
+
+    def submit(self, job: Job) -> List[Tuple[int, str, int, Tuple[int, int]]]:
+        """
+        Place all tasks of a job.
+
+        Args:
+            job: Job to place; its free time must not start before the horizon
+
+        Returns:
+            The job's scheduled tasks in format (job_id, resource_type, machine_id, (start_time, end_time))
+
+        Raises:
+            ValueError: If the job is free before the committed horizon
+        """
+        if self.horizon and job.available_time and job.available_time[0][0] < self.horizon:
+            raise ValueError(f"Job {job.id} is free from {job.available_time[0][0]}, "
+                             f"before the committed horizon {self.horizon}")
+        assignments = []
+        for resource_type, duration in job.task_durations.items():
+            if duration <= 0:
+                continue
+            self._place(job, resource_type, duration, self.resources[resource_type], assignments, self._tracer)
+        return assignments
+
+    def advance(self, horizon: int) -> None:
+        """
+        Commit all time before horizon. Free time before it is dropped from
+        every machine, so memory depends on the open part of the schedule
+        only. Jobs submitted afterwards must not be free before horizon.
+
+        Args:
+            horizon: New committed horizon; earlier values are ignored
+        """
+        if horizon <= self.horizon:
+            return
+        self.horizon = horizon
+        for resource in self.resources.values():
+            resource.advance(horizon)
+
+    def flush(self) -> None:
+        """Flush the tracer."""
+        self._tracer.flush()
+
+def schedule_stream(jobs: Iterable[Job], resources: Dict[str, Resource],
+                    algorithm: str = "no_preemption",
+                    horizon: Optional[Callable[[Job], int]] = None,
+                    compact_every: int = 1024,
+                    tracer: Optional[Tracer] = None) -> Iterator[Tuple[int, str, int, Tuple[int, int]]]:
+    """
+    Schedule a stream of jobs, yielding each job's assignments as soon as it is placed.
+
+    Jobs are not kept after they are placed. If horizon is given, it is
+    called with each placed job and returns the committed horizon, i.e. a
+    time before which no later job is free (for jobs arriving in release
+    order, `lambda job: job.release_time`). Every compact_every jobs, the
+    scheduler advances to the latest committed horizon. Compaction does not
+    change no_preemption schedules; with weak_preemption, the batch greedy
+    skips a machine whose free time ends exactly where a job's free time
+    begins, and once that free time lies before the horizon it is gone, so
+    such a job may be placed on that machine instead.
+
+    Args:
+        jobs: Iterable of jobs, consumed lazily
+        resources: Dictionary mapping resource type to Resource objects
+        algorithm: "no_preemption" or "weak_preemption"
+        horizon: Optional function from a placed job to the committed horizon
+        compact_every: Number of jobs between horizon advances
+        tracer: Optional sink for probe/assign/open-machine/fail events
+
+    Returns:
+        Iterator over scheduled tasks in format (job_id, resource_type, machine_id, (start_time, end_time))
+    """
+    scheduler = OnlineScheduler(resources, algorithm, tracer)
+    committed = 0
+    try:
+        for count, job in enumerate(jobs, 1):
+            yield from scheduler.submit(job)
+            if horizon is not None:
+                committed = max(committed, horizon(job))
+                if count % compact_every == 0:
+                    scheduler.advance(committed)
+    finally:
+        scheduler.flush()
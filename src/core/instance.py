@@ -0,0 +1,110 @@
+from array import array
+from typing import Dict, List, Sequence, Tuple
+from .job import Job
+from .job_table import JobTable
+from .resource import Resource
+
+class Instance:
+    """
+    Compact description of a scheduling problem: the horizon, the resource
+    types, and one row of task durations per job.
+
+    Algorithms mutate Job and Resource objects, so an Instance is the
+    reusable form of a workload; build() creates fresh objects for each run.
+    """
+    def __init__(self, T: int, resource_types: Sequence[str],
+                 job_ids: Sequence[int], durations: Sequence[Sequence[int]]):
+        """
+        Initialize an instance.
+
+        Args:
+            T: Global time limit
+            resource_types: Resource type names, in the column order of durations
+            job_ids: Job identifiers, one per row of durations
+            durations: Per job, the required duration on each resource type
+        """
+        if len(job_ids) != len(durations):
+            raise ValueError("Expected one row of durations per job.")
+        self.T = T
+        self.resource_types: Tuple[str, ...] = tuple(resource_types)
+        self.job_ids: List[int] = list(job_ids)
+        self.durations: List[Tuple[int, ...]] = [tuple(row) for row in durations]
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+    def __getstate__(self):
+        # Pickle as two flat int64 buffers rather than a list of tuples, so
+        # sending an instance to a worker process stays cheap.
+        flat = array('q')
+        for row in self.durations:
+            flat.extend(row)
+        return (self.T, self.resource_types, array('q', self.job_ids), flat)
+
+    def __setstate__(self, state) -> None:
+        T, resource_types, job_ids, flat = state
+        width = len(resource_types)
+        self.T = T
+        self.resource_types = tuple(resource_types)
+        self.job_ids = job_ids.tolist()
+        if width:
+            self.durations = [tuple(flat[i:i + width]) for i in range(0, len(flat), width)]
+        else:
+            self.durations = [() for _ in self.job_ids]
+
+    @property
+    def num_tasks(self) -> int:
+        """Number of tasks with a positive duration."""
+        return sum(1 for row in self.durations for duration in row if duration > 0)
+
+    def total_work(self) -> Dict[str, int]:
+        """
+        Total required duration per resource type.
+
+        Returns:
+            Dictionary mapping resource type to summed task durations
+        """
+        totals = [0] * len(self.resource_types)
+        for row in self.durations:
+            for index, duration in enumerate(row):
+                totals[index] += duration
+        return dict(zip(self.resource_types, totals))
+
+    def build_jobs(self) -> List[Job]:
+        """
+        Create fresh Job objects.
+
+        Returns:
+            List of jobs in instance order
+        """
+        return [
+            Job(job_id, dict(zip(self.resource_types, row)), self.T)
+            for job_id, row in zip(self.job_ids, self.durations)
+        ]
+
+    def build_table(self) -> JobTable:
+        """
+        Create a compact JobTable of the jobs, for large instances.
+
+        Returns:
+            Table with one row per job, in instance order
+        """
+        return JobTable.from_instance(self)
+
+    def build_resources(self) -> Dict[str, Resource]:
+        """
+        Create fresh Resource objects without machines.
+
+        Returns:
+            Dictionary mapping resource type to Resource objects
+        """
+        return {resource_type: Resource(resource_type, self.T) for resource_type in self.resource_types}
+
+    def build(self) -> Tuple[List[Job], Dict[str, Resource]]:
+        """
+        Create fresh jobs and resources for one algorithm run.
+
+        Returns:
+            Tuple of (jobs, resources)
+        """
+        return self.build_jobs(), self.build_resources()
@@ -0,0 +1,315 @@
+from bisect import bisect_left, bisect_right
+from heapq import heapify, heappop, heappush
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+class IntervalSet:
+    """
+    Sorted collection of disjoint free time ranges [start, end).
+
+    Starts and ends are kept in two parallel sorted lists, so locating the
+    range that covers a point is a bisect instead of a scan. The lengths of
+    all ranges are counted in a lazily-pruned max-heap, which keeps the
+    largest free gap available without walking the list.
+
+    copy() is copy-on-write: the copy shares the lists with the original
+    until either of them is modified.
+    """
+    __slots__ = ("_starts", "_ends", "_total", "_length_counts", "_length_heap", "_shared")
+
+    def __init__(self, intervals: Iterable[Tuple[int, int]] = ()):
+        """
+        Initialize the set from time ranges.
+
+        Args:
+            intervals: Disjoint, non-adjacent (start, end) ranges, in any order
+        """
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self._total = 0
+        self._length_counts: Dict[int, int] = {}
+        self._length_heap: List[int] = []  # Negated lengths
+        self._shared = False  # Lists may be referenced by a copy
+
+        for start, end in sorted(intervals):
+            if start >= end:
+                continue
+            if self._ends and start <= self._ends[-1]:
+                raise ValueError("Time ranges must be disjoint and non-adjacent.")
+            self._starts.append(start)
+            self._ends.append(end)
+            self._add_length(end - start)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return zip(self._starts, self._ends)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(zip(self._starts[index], self._ends[index]))
+        return (self._starts[index], self._ends[index])
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, IntervalSet):
+            return self._starts == other._starts and self._ends == other._ends
+        try:
+            return list(self) == [tuple(interval) for interval in other]
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)})"
+
+    def copy(self) -> "IntervalSet":
+        """
+        Copy the set in O(1); the lists are only duplicated on the first write.
+
+        Returns:
+            New set with the same ranges
+        """
+        result = IntervalSet.__new__(IntervalSet)
+        result._starts = self._starts
+        result._ends = self._ends
+        result._total = self._total
+        result._length_counts = self._length_counts
+        result._length_heap = self._length_heap
+        result._shared = self._shared = True
+        return result
+
+    def shares_storage(self, other: "IntervalSet") -> bool:
+        """
+        Check whether two sets still read the same lists, which means neither
+        was written since one was copied from the other.
+
+        Args:
+            other: Set to compare with
+
+        Returns:
+            True if the sets share their lists
+        """
+        return self._starts is other._starts and self._ends is other._ends
+
+    @property
+    def total(self) -> int:
+        """Total free time over all ranges."""
+        return self._total
+
+    def max_length(self) -> int:
+        """
+        Length of the largest free range.
+
+        Returns:
+            Largest range length, or 0 if the set is empty
+        """
+        heap = self._length_heap
+        counts = self._length_counts
+        while heap and counts.get(-heap[0], 0) == 0:
+            heappop(heap)
+        return -heap[0] if heap else 0
+
+    def iter_from(self, time: int) -> Iterator[Tuple[int, int]]:
+        """
+        Iterate over the ranges that end at or after a point in time.
+
+        Ranges ending before time cannot touch anything that starts at time,
+        so they are skipped with a bisect rather than read.
+
+        Args:
+            time: Point in time
+
+        Returns:
+            Iterator over (start, end) ranges, in order
+        """
+        starts, ends = self._starts, self._ends
+        for index in range(bisect_left(ends, time), len(ends)):
+            yield (starts[index], ends[index])
+
+    def covering(self, time: int) -> int:
+        """
+        Find the range that contains a point in time.
+
+        Args:
+            time: Point in time to look up
+
+        Returns:
+            Index of the range with start <= time < end, or -1 if none
+        """
+        index = bisect_right(self._starts, time) - 1
+        if index >= 0 and time < self._ends[index]:
+            return index
+        return -1
+
+    def split(self, time_range: Tuple[int, int]) -> None:
+        """
+        Remove a time range from the free time, splitting the range that holds it.
+
+        Args:
+            time_range: Tuple of (start_time, end_time)
+
+        Raises:
+            ValueError: If the range is not contained in a single free range
+        """
+        start, end = time_range
+        index = self.covering(start)
+        if index < 0 or not start < end <= self._ends[index]:
+            raise ValueError("Task cannot be assigned within the available time ranges.")
+        if self._shared:
+            self._unshare()
+
+        range_start = self._starts[index]
+        range_end = self._ends[index]
+        self._remove_length(range_end - range_start)
+
+        if range_start < start and end < range_end:
+            self._ends[index] = start
+            self._starts.insert(index + 1, end)
+            self._ends.insert(index + 1, range_end)
+        elif range_start < start:
+            self._ends[index] = start
+        elif end < range_end:
+            self._starts[index] = end
+        else:
+            del self._starts[index]
+            del self._ends[index]
+
+        if range_start < start:
+            self._add_length(start - range_start)
+        if end < range_end:
+            self._add_length(range_end - end)
+
+    def release(self, time_range: Tuple[int, int]) -> None:
+        """
+        Return a time range to the free time, merging it with adjacent free ranges.
+
+        Args:
+            time_range: Tuple of (start_time, end_time)
+
+        Raises:
+            ValueError: If the range is empty or overlaps free time
+        """
+        start, end = time_range
+        starts, ends = self._starts, self._ends
+        index = bisect_right(starts, start)
+        if start >= end or (index > 0 and ends[index - 1] > start) or (index < len(starts) and starts[index] < end):
+            raise ValueError("Time range cannot be released: it is empty or already free.")
+        if self._shared:
+            self._unshare()
+            starts, ends = self._starts, self._ends
+
+        merge_left = index > 0 and ends[index - 1] == start
+        merge_right = index < len(starts) and starts[index] == end
+        if merge_left:
+            self._remove_length(ends[index - 1] - starts[index - 1])
+        if merge_right:
+            self._remove_length(ends[index] - starts[index])
+
+        if merge_left and merge_right:
+            ends[index - 1] = ends[index]
+            del starts[index]
+            del ends[index]
+            index -= 1
+        elif merge_left:
+            ends[index - 1] = end
+            index -= 1
+        elif merge_right:
+            starts[index] = start
+        else:
+            starts.insert(index, start)
+            ends.insert(index, end)
+        self._add_length(ends[index] - starts[index])
+
+    def discard_before(self, time: int) -> None:
+        """
+        Drop free time that lies before a point in time.
+
+        Ranges ending at or before time are removed, and a range that
+        contains time is cut to start at it.
+
+        Args:
+            time: Earliest point in time that is still needed
+        """
+        if self._shared:
+            self._unshare()
+        starts, ends = self._starts, self._ends
+        index = bisect_right(ends, time)
+        for start, end in zip(starts[:index], ends[:index]):
+            self._remove_length(end - start)
+        del starts[:index]
+        del ends[:index]
+
+        if starts and starts[0] < time:
+            self._remove_length(ends[0] - starts[0])
+            starts[0] = time
+            self._add_length(ends[0] - starts[0])
+
+    def first_common_fit(self, other: "IntervalSet", duration: int) -> Optional[Tuple[int, int]]:
+        """
+        Find the earliest slot of the required duration that is free in both sets.
+
+        Leapfrogs between the two sets with bisects, so the cost depends on
+        how many common ranges are inspected rather than on the set sizes.
+        The slot starts at the beginning of the first common range that is
+        long enough, as with find_earliest_available on the intersection.
+
+        Args:
+            other: Second set of free time ranges
+            duration: Required duration, must be positive
+
+        Returns:
+            Tuple of (start_time, end_time) or None if no suitable slot found
+        """
+        if not self._starts or not other._starts:
+            return None
+        if self.max_length() < duration or other.max_length() < duration:
+            return None
+
+        starts1, ends1 = self._starts, self._ends
+        starts2, ends2 = other._starts, other._ends
+        time = max(starts1[0], starts2[0])
+
+        while True:
+            i = bisect_right(ends1, time)
+            if i == len(ends1):
+                return None
+            time = max(time, starts1[i])
+
+            j = bisect_right(ends2, time)
+            if j == len(ends2):
+                return None
+            if starts2[j] > time:
+                time = starts2[j]
+                continue
+
+            end = min(ends1[i], ends2[j])
+            if end - time >= duration:
+                return (time, time + duration)
+            time = end
+
+    def _unshare(self) -> None:
+        self._starts = self._starts[:]
+        self._ends = self._ends[:]
+        self._length_counts = dict(self._length_counts)
+        self._length_heap = self._length_heap[:]
+        self._shared = False
+
+    def _add_length(self, length: int) -> None:
+        count = self._length_counts.get(length, 0)
+        self._length_counts[length] = count + 1
+        self._total += length
+        if count == 0:
+            heappush(self._length_heap, -length)
+            if len(self._length_heap) > 2 * len(self._length_counts) + 16:
+                self._compact_heap()
+
+    def _remove_length(self, length: int) -> None:
+        count = self._length_counts[length] - 1
+        if count:
+            self._length_counts[length] = count
+        else:
+            del self._length_counts[length]
+        self._total -= length
+
+    def _compact_heap(self) -> None:
+        self._length_heap = [-length for length in self._length_counts]
+        heapify(self._length_heap)
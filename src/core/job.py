@@ -1,11 +1,13 @@
 from typing import Dict, List, Tuple
-from ..utils.scheduling_utils import assign
+from .interval_set import IntervalSet
 
 class Job:
     """
     Represents a job that needs to be scheduled with its resource requirements.
     """
-    def __init__(self, job_id: int, task_durations: Dict[str, int], T: int):
+    __slots__ = ("id", "task_durations", "release_time", "available_time")
+
+    def __init__(self, job_id: int, task_durations: Dict[str, int], T: int, release_time: int = 0):
         """
         Initialize a job with its requirements.
         
@@ -13,10 +15,12 @@ class Job:
             job_id: Unique identifier for the job
             task_durations: Dictionary mapping resource types to required duration
             T: Global time limit
+            release_time: Earliest time the job may run
         """
         self.id = job_id
         self.task_durations = task_durations
-        self.available_time = [(0, T)]
+        self.release_time = release_time
+        self.available_time = IntervalSet([(release_time, T)])
 
     def assign(self, time_range: Tuple[int, int]) -> None:
         """
@@ -25,4 +29,27 @@ class Job:
         Args:
             time_range: Tuple of (start_time, end_time)
         """
-        self.available_time = assign(self.available_time, time_range) 
\ No newline at end of file
+        self.available_time.split(time_range)
+
+    def release(self, time_range: Tuple[int, int]) -> None:
+        """
+        Give an assigned time range back to this job's available time.
+        
+        Args:
+            time_range: Tuple of (start_time, end_time)
+        """
+        self.available_time.release(time_range)
+
+    def copy(self) -> "Job":
+        """
+        Copy the job; its available time is copied on write.
+        
+        Returns:
+            New job with the same id, durations and available time
+        """
+        job = Job.__new__(Job)
+        job.id = self.id
+        job.task_durations = self.task_durations
+        job.release_time = self.release_time
+        job.available_time = self.available_time.copy()
+        return job
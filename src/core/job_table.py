@@ -0,0 +1,156 @@
+from array import array
+from typing import Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple
+from .job import Job
+
+class JobTable:
+    """
+    Jobs stored as typed columns: ids, release times, and one row of
+    durations per job with resource types interned to column indexes.
+
+    A job costs 8 bytes per column instead of a Job object with its own
+    durations dict and free-time set. Iterating or indexing the table
+    creates Job objects on demand, so the greedy algorithms accept a table
+    wherever they accept a list of jobs, and only the job being placed is
+    materialized at any time.
+    """
+    __slots__ = ("T", "resource_types", "_resource_index", "job_ids", "release_times", "durations")
+
+    def __init__(self, T: int, resource_types: Sequence[str]):
+        """
+        Initialize an empty table.
+
+        Args:
+            T: Global time limit
+            resource_types: Resource type names, in column order
+        """
+        self.T = T
+        self.resource_types: Tuple[str, ...] = tuple(resource_types)
+        self._resource_index: Dict[str, int] = {name: i for i, name in enumerate(self.resource_types)}
+        self.job_ids = array('q')
+        self.release_times = array('q')
+        self.durations = array('q')  # Row-major, len(resource_types) values per job
+
+    @classmethod
+    def from_instance(cls, instance) -> "JobTable":
+        """
+        Create a table holding the jobs of an Instance.
+
+        Args:
+            instance: Instance to copy
+
+        Returns:
+            Table with one row per job, in instance order
+        """
+        table = cls(instance.T, instance.resource_types)
+        table.job_ids.extend(instance.job_ids)
+        table.release_times.extend([0] * len(instance.job_ids))
+        for row in instance.durations:
+            table.durations.extend(row)
+        return table
+
+    @classmethod
+    def from_jobs(cls, jobs: Iterable[Job], T: int, resource_types: Sequence[str]) -> "JobTable":
+        """
+        Create a table from Job objects.
+
+        Args:
+            jobs: Jobs to copy; only their ids, durations and release times are kept
+            T: Global time limit
+            resource_types: Resource type names; durations of other types are an error
+
+        Returns:
+            Table with one row per job
+        """
+        table = cls(T, resource_types)
+        for job in jobs:
+            table.add_job(job.id, job.task_durations, job.release_time)
+        return table
+
+    @property
+    def width(self) -> int:
+        """Number of resource types, i.e. durations per job."""
+        return len(self.resource_types)
+
+    def intern(self, resource_type: str) -> int:
+        """
+        Get the column index of a resource type.
+
+        Args:
+            resource_type: Resource type name
+
+        Returns:
+            Index of the type's duration within a row
+        """
+        try:
+            return self._resource_index[resource_type]
+        except KeyError:
+            raise ValueError(f"Unknown resource type: {resource_type}") from None
+
+    def add(self, job_id: int, durations: Sequence[int], release_time: int = 0) -> None:
+        """
+        Append a job given one duration per resource type, in column order.
+
+        Args:
+            job_id: Unique identifier for the job
+            durations: Required duration on each resource type
+            release_time: Earliest time the job may run
+        """
+        if len(durations) != self.width:
+            raise ValueError(f"Expected {self.width} durations, got {len(durations)}.")
+        self.job_ids.append(job_id)
+        self.release_times.append(release_time)
+        self.durations.extend(durations)
+
+    def add_job(self, job_id: int, task_durations: Mapping[str, int], release_time: int = 0) -> None:
+        """
+        Append a job given a mapping of resource type to duration.
+
+        Args:
+            job_id: Unique identifier for the job
+            task_durations: Dictionary mapping resource types to required duration
+            release_time: Earliest time the job may run
+        """
+        row = [0] * self.width
+        for resource_type, duration in task_durations.items():
+            row[self.intern(resource_type)] = duration
+        self.add(job_id, row, release_time)
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+    def row(self, index: int) -> Sequence[int]:
+        """
+        Get the durations of one job without creating a Job.
+
+        Args:
+            index: Row index
+
+        Returns:
+            Durations in column order
+        """
+        width = self.width
+        return self.durations[index * width:(index + 1) * width]
+
+    def __getitem__(self, index: int) -> Job:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("JobTable index out of range")
+        return Job(self.job_ids[index], dict(zip(self.resource_types, self.row(index))),
+                   self.T, self.release_times[index])
+
+    def __iter__(self) -> Iterator[Job]:
+        resource_types, T, width = self.resource_types, self.T, self.width
+        durations = self.durations
+        for index, (job_id, release_time) in enumerate(zip(self.job_ids, self.release_times)):
+            row = durations[index * width:(index + 1) * width]
+            yield Job(job_id, dict(zip(resource_types, row)), T, release_time)
+
+    def to_jobs(self) -> List[Job]:
+        """
+        Materialize every row as a Job.
+
+        Returns:
+            List of jobs in table order
+        """
+        return list(self)
@@ -1,10 +1,12 @@
 from typing import List, Tuple
-from ..utils.scheduling_utils import assign
+from .interval_set import IntervalSet
 
 class Machine:
     """
     Represents a single machine that can process jobs.
     """
+    __slots__ = ("id", "available_time")
+
     def __init__(self, machine_id: int, T: int):
         """
         Initialize a machine.
@@ -14,7 +16,7 @@ class Machine:
             T: Global time limit
         """
         self.id = machine_id
-        self.available_time = [(0, T)]
+        self.available_time = IntervalSet([(0, T)])
 
     def assign(self, task_to_assign: Tuple[int, int]) -> None:
         """
@@ -23,4 +25,25 @@ class Machine:
         Args:
             task_to_assign: Tuple of (start_time, end_time)
         """
-        self.available_time = assign(self.available_time, task_to_assign) 
\ No newline at end of file
+        self.available_time.split(task_to_assign)
+
+    def release(self, task_to_release: Tuple[int, int]) -> None:
+        """
+        Remove a task from this machine, merging its time with adjacent free slots.
+        
+        Args:
+            task_to_release: Tuple of (start_time, end_time)
+        """
+        self.available_time.release(task_to_release)
+
+    def copy(self) -> "Machine":
+        """
+        Copy the machine; its available time is copied on write.
+        
+        Returns:
+            New machine with the same id and available time
+        """
+        machine = Machine.__new__(Machine)
+        machine.id = self.id
+        machine.available_time = self.available_time.copy()
+        return machine
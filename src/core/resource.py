@@ -1,10 +1,16 @@
-from typing import List
+from typing import Iterator, List
 from .machine import Machine
+from ..utils.segment_tree import MaxSegmentTree
 
 class Resource:
     """
     Represents a resource type that can have multiple machines.
+
+    Machines are indexed by their largest free gap and their total free time,
+    so first-fit probes can skip machines that cannot hold a task at all.
     """
+    __slots__ = ("resource_type", "machines", "T", "cost", "horizon", "_gap_index", "_free_index")
+
     def __init__(self, resource_type: str, T: int):
         """
         Initialize a resource.
@@ -17,7 +23,87 @@ class Resource:
         self.machines: List[Machine] = []
         self.T = T
         self.cost = 1  # Cost per machine of this type
+        self.horizon = 0  # Time before which no more work will be placed
+        self._gap_index = MaxSegmentTree()  # Largest free gap per machine
+        self._free_index = MaxSegmentTree()  # Total free time per machine
 
     def add_machine(self) -> None:
         """Add a new machine of this resource type."""
-        self.machines.append(Machine(machine_id=len(self.machines) + 1, T=self.T)) 
\ No newline at end of file
+        machine = Machine(machine_id=len(self.machines) + 1, T=self.T)
+        if self.horizon:
+            machine.available_time.discard_before(self.horizon)
+        self.machines.append(machine)
+        self._gap_index.append(machine.available_time.max_length())
+        self._free_index.append(machine.available_time.total)
+
+    def copy(self) -> "Resource":
+        """
+        Copy the resource and its machines, sharing free time lists until they change.
+        
+        Returns:
+            New resource in the same state
+        """
+        resource = Resource.__new__(Resource)
+        resource.resource_type = self.resource_type
+        resource.machines = [machine.copy() for machine in self.machines]
+        resource.T = self.T
+        resource.cost = self.cost
+        resource.horizon = self.horizon
+        resource._gap_index = self._gap_index.copy()
+        resource._free_index = self._free_index.copy()
+        return resource
+
+    def advance(self, horizon: int) -> None:
+        """
+        Commit all time before horizon: drop it from every machine's free time.
+        
+        Args:
+            horizon: Time before which no more work will be placed
+        """
+        if horizon <= self.horizon:
+            return
+        self.horizon = horizon
+        for machine in self.machines:
+            machine.available_time.discard_before(horizon)
+            self.update(machine)
+
+    def update(self, machine: Machine) -> None:
+        """
+        Refresh the index after a machine's available time changed.
+        
+        Args:
+            machine: Machine of this resource that was assigned to
+        """
+        index = machine.id - 1
+        self._gap_index.update(index, machine.available_time.max_length())
+        self._free_index.update(index, machine.available_time.total)
+
+    def machines_with_gap(self, duration: int) -> Iterator[Machine]:
+        """
+        Iterate, in order, over the machines that have a free gap of at least duration.
+        
+        Args:
+            duration: Required contiguous duration
+            
+        Returns:
+            Iterator over candidate machines
+        """
+        return self._candidates(self._gap_index, duration)
+
+    def machines_with_free_time(self, duration: int) -> Iterator[Machine]:
+        """
+        Iterate, in order, over the machines that have at least duration of free time in total.
+        
+        Args:
+            duration: Required total duration
+            
+        Returns:
+            Iterator over candidate machines
+        """
+        return self._candidates(self._free_index, duration)
+
+    def _candidates(self, index: MaxSegmentTree, threshold: int) -> Iterator[Machine]:
+        position = index.find_first(threshold)
+        while position >= 0:
+            yield self.machines[position]
+            position = index.find_first(threshold, position + 1)
@@ -0,0 +1,226 @@
+import struct
+from array import array
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+from ..utils.binary import open_buffer, pack_names, read_columns, read_header, read_names, write_columns
+
+_MAGIC = b"SCHDSOL1"
+_HEADER = struct.Struct("<8sQQ")  # magic, number of tasks, length of the resource names block
+
+class Solution:
+    """
+    Schedule stored as parallel typed columns: job_ids, resources (an index
+    into resource_types), machine_ids, starts and ends.
+
+    Behaves like the list of (job_id, resource_type, machine_id, (start_time,
+    end_time)) tuples the algorithms used to return: it supports append,
+    len, indexing, iteration and comparison with such a list. Resource names
+    are interned, so each task costs five machine integers. copy() shares
+    the columns until either side appends.
+    """
+    def __init__(self, resource_types: Sequence[str] = ()):
+        """
+        Initialize an empty solution.
+
+        Args:
+            resource_types: Resource type names to intern up front, in index order
+        """
+        self.resource_types: List[str] = []
+        self._resource_index: Dict[str, int] = {}
+        self.job_ids = array('q')
+        self.resources = array('i')
+        self.machine_ids = array('q')
+        self.starts = array('q')
+        self.ends = array('q')
+        self._shared = False  # Columns may be referenced by a copy
+        for resource_type in resource_types:
+            self.intern(resource_type)
+
+    def intern(self, resource_type: str) -> int:
+        """
+        Get the column index of a resource type, adding it if needed.
+
+        Args:
+            resource_type: Resource type name
+
+        Returns:
+            Index stored in the resources column
+        """
+        index = self._resource_index.get(resource_type)
+        if index is None:
+            index = len(self.resource_types)
+            self._resource_index[resource_type] = index
+            self.resource_types.append(resource_type)
+        return index
+
+    def add(self, job_id: int, resource_type: str, machine_id: int, start: int, end: int) -> None:
+        """
+        Append one scheduled task without building a tuple.
+
+        Args:
+            job_id: Job identifier
+            resource_type: Resource type name
+            machine_id: Machine identifier within the resource
+            start: Start time
+            end: End time
+        """
+        index = self._resource_index.get(resource_type)
+        if index is None:
+            index = self.intern(resource_type)
+        if self._shared:
+            self._unshare()
+        self.job_ids.append(job_id)
+        self.resources.append(index)
+        self.machine_ids.append(machine_id)
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def append(self, task: Tuple[int, str, int, Tuple[int, int]]) -> None:
+        """
+        Append one scheduled task.
+
+        Args:
+            task: Tuple of (job_id, resource_type, machine_id, (start_time, end_time))
+        """
+        job_id, resource_type, machine_id, (start, end) = task
+        self.add(job_id, resource_type, machine_id, start, end)
+
+    def extend(self, tasks: Iterable[Tuple[int, str, int, Tuple[int, int]]]) -> None:
+        """
+        Append scheduled tasks.
+
+        Args:
+            tasks: Iterable of (job_id, resource_type, machine_id, (start_time, end_time))
+        """
+        for task in tasks:
+            self.append(task)
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+    def __iter__(self) -> Iterator[Tuple[int, str, int, Tuple[int, int]]]:
+        names = self.resource_types
+        for job_id, resource, machine_id, start, end in zip(
+                self.job_ids, self.resources, self.machine_ids, self.starts, self.ends):
+            yield (job_id, names[resource], machine_id, (start, end))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return (self.job_ids[index], self.resource_types[self.resources[index]],
+                self.machine_ids[index], (self.starts[index], self.ends[index]))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Solution):
+            return len(self) == len(other) and list(self) == list(other)
+        try:
+            return len(self) == len(other) and list(self) == [
+                (job_id, resource_type, machine_id, tuple(time_range))
+                for job_id, resource_type, machine_id, time_range in other
+            ]
+        except (TypeError, ValueError):
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Solution({len(self)} tasks, resource_types={self.resource_types})"
+
+    def copy(self) -> "Solution":
+        """
+        Make an independent, appendable copy (also of a memory-mapped solution)
+        in O(1); the columns are only duplicated on the first append.
+
+        Returns:
+            New solution with the same tasks
+        """
+        result = Solution(self.resource_types)
+        result.job_ids = self.job_ids
+        result.resources = self.resources
+        result.machine_ids = self.machine_ids
+        result.starts = self.starts
+        result.ends = self.ends
+        result._shared = self._shared = True
+        return result
+
+    def _unshare(self) -> None:
+        self.job_ids = array('q', self.job_ids)
+        self.resources = array('i', self.resources)
+        self.machine_ids = array('q', self.machine_ids)
+        self.starts = array('q', self.starts)
+        self.ends = array('q', self.ends)
+        self._shared = False
+
+    def to_numpy(self) -> Dict[str, "np.ndarray"]:
+        """
+        View the columns as NumPy arrays, without copying.
+
+        Returns:
+            Dictionary of job_ids, resources, machine_ids, starts and ends arrays
+        """
+        import numpy as np
+
+        return {
+            "job_ids": np.frombuffer(self.job_ids, dtype=np.int64),
+            "resources": np.frombuffer(self.resources, dtype=np.int32),
+            "machine_ids": np.frombuffer(self.machine_ids, dtype=np.int64),
+            "starts": np.frombuffer(self.starts, dtype=np.int64),
+            "ends": np.frombuffer(self.ends, dtype=np.int64),
+        }
+
+    def save(self, path: str) -> None:
+        """
+        Write the solution to disk.
+
+        Paths ending in .npz are written with NumPy; anything else uses the
+        fixed-layout binary format that load() can memory-map: a header, the
+        resource names as JSON, then the job_ids, machine_ids, starts, ends
+        (little-endian int64) and resources (little-endian int32) columns.
+
+        Args:
+            path: Output file
+        """
+        if path.endswith(".npz"):
+            import numpy as np
+
+            np.savez(path, resource_types=np.array(self.resource_types, dtype=str), **self.to_numpy())
+            return
+
+        names = pack_names(self.resource_types)
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, len(self), len(names)))
+            f.write(names)
+            write_columns(f, [('q', self.job_ids), ('q', self.machine_ids), ('q', self.starts), ('q', self.ends),
+                              ('i', self.resources)])
+
+    @classmethod
+    def load(cls, path: str, mmap_mode: bool = True) -> "Solution":
+        """
+        Read a solution written by save().
+
+        With mmap_mode, the columns of a binary file are read-only views of a
+        memory-mapped file and no task data is copied; use copy() to append.
+
+        Args:
+            path: File written by save()
+            mmap_mode: Memory-map binary files instead of reading them
+
+        Returns:
+            Loaded solution
+        """
+        if path.endswith(".npz"):
+            import numpy as np
+
+            with np.load(path) as data:
+                solution = cls([str(name) for name in data["resource_types"]])
+                solution.job_ids = array('q', data["job_ids"].astype(np.int64).tobytes())
+                solution.resources = array('i', data["resources"].astype(np.int32).tobytes())
+                solution.machine_ids = array('q', data["machine_ids"].astype(np.int64).tobytes())
+                solution.starts = array('q', data["starts"].astype(np.int64).tobytes())
+                solution.ends = array('q', data["ends"].astype(np.int64).tobytes())
+            return solution
+
+        buffer = open_buffer(path, mmap_mode)
+        count, names_length = read_header(buffer, _HEADER, _MAGIC, path, "solution file")
+        solution = cls(read_names(buffer, _HEADER.size, names_length))
+        layout = [('q', count)] * 4 + [('i', count)]
+        columns = read_columns(buffer, _HEADER.size + names_length, layout, mmap_mode, path)
+        solution.job_ids, solution.machine_ids, solution.starts, solution.ends, solution.resources = columns
+        return solution
@@ -0,0 +1,100 @@
+from typing import Dict, Iterable, List, Optional
+from .instance import Instance
+from .job import Job
+from .resource import Resource
+from .solution import Solution
+
+class SchedulerState:
+    """
+    The mutable state of a scheduling run: jobs, resources and the schedule so far.
+
+    fork() gives an independent copy. The algorithms write to jobs and
+    machines in place, so it still makes a new shell per job and machine,
+    but their free time lists and the solution columns are shared with the
+    original until either side writes to them. reset() returns to the state
+    the object was created in, rewinding only the jobs whose free time
+    changed since.
+    """
+    def __init__(self, jobs: Iterable[Job], resources: Dict[str, Resource],
+                 solution: Optional[Solution] = None):
+        """
+        Initialize the state and remember it as the initial state.
+
+        Args:
+            jobs: Jobs to schedule
+            resources: Dictionary mapping resource type to Resource objects
+            solution: Schedule built so far, empty by default
+        """
+        self.jobs: List[Job] = list(jobs)
+        self.resources = resources
+        self.solution = solution if solution is not None else Solution(resources)
+        self._initial: Optional[SchedulerState] = None
+        self._initial = self.fork()
+
+    @classmethod
+    def from_instance(cls, instance: Instance) -> "SchedulerState":
+        """
+        Create a fresh state for an instance.
+
+        Args:
+            instance: Instance to schedule
+
+        Returns:
+            State with fresh jobs and machine-less resources
+        """
+        jobs, resources = instance.build()
+        return cls(jobs, resources, Solution(instance.resource_types))
+
+    def fork(self) -> "SchedulerState":
+        """
+        Make a copy-on-write copy of the state.
+
+        Returns:
+            Independent state; changes to either side do not affect the other
+        """
+        state = SchedulerState.__new__(SchedulerState)
+        state.jobs = [job.copy() for job in self.jobs]
+        state.resources = {resource_type: resource.copy() for resource_type, resource in self.resources.items()}
+        state.solution = self.solution.copy()
+        state._initial = self._initial
+        return state
+
+    def snapshot(self) -> "SchedulerState":
+        """
+        Capture the current state so it can be restored later.
+
+        Returns:
+            Snapshot to pass to restore()
+        """
+        return self.fork()
+
+    def restore(self, snapshot: "SchedulerState") -> None:
+        """
+        Return to a snapshot. The snapshot stays valid and can be restored again.
+
+        Args:
+            snapshot: State returned by snapshot() or fork()
+        """
+        state = snapshot.fork()
+        self.jobs = state.jobs
+        self.resources = state.resources
+        self.solution = state.solution
+
+    def reset(self) -> None:
+        """
+        Return to the state this object (or the state it was forked from) was
+        created in.
+
+        Jobs are reset in place, and only those whose free time was written
+        since they were copied from the initial state; resources are copied
+        from the initial state, which is cheap while it has few machines.
+        """
+        initial = self._initial
+        if len(self.jobs) != len(initial.jobs):
+            self.jobs = [job.copy() for job in initial.jobs]
+        else:
+            for job, initial_job in zip(self.jobs, initial.jobs):
+                if not job.available_time.shares_storage(initial_job.available_time):
+                    job.available_time = initial_job.available_time.copy()
+        self.resources = {resource_type: resource.copy() for resource_type, resource in initial.resources.items()}
+        self.solution = initial.solution.copy()
@@ -0,0 +1,24 @@
+from typing import Optional
+
+def load_numpy(caller: Optional[str] = None):
+    """
+    Import NumPy when it is first needed, so that importing the modules that
+    use it stays fast and works without it.
+
+    Args:
+        caller: Name of the feature that needs NumPy, for the error message;
+            None returns None instead of raising
+
+    Returns:
+        The numpy module, or None if it is not installed and no caller is given
+
+    Raises:
+        ImportError: If NumPy is not installed and a caller is given
+    """
+    try:
+        import numpy
+    except ImportError:
+        if caller is None:
+            return None
+        raise ImportError(f"{caller} needs NumPy.") from None
+    return numpy
@@ -0,0 +1,227 @@
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from ..core.instance import Instance
+from ..core.job import Job
+from ..core.job_table import JobTable
+from ..core.resource import Resource
+from ..core.solution import Solution
+from ._numpy import load_numpy
+
+np = None  # Loaded on the first analysis, keeping imports of this module cheap
+
+PERCENTILES = (50, 90, 99)
+
+# Keys of sweep and benchmark results that label a run rather than measure it
+RUN_KEYS = ("case", "params", "seed", "T", "axis", "value")
+
+def analyze(solution: Union[Solution, Iterable[Tuple[int, str, int, Tuple[int, int]]]],
+            resources: Dict[str, Resource],
+            jobs: Optional[Union[List[Job], JobTable, Instance]] = None,
+            per_machine: bool = False, per_job: bool = False) -> Dict:
+    """
+    Compute utilization, cost and job statistics of a schedule.
+
+    Everything is derived from the solution columns with one sort by
+    (resource type, machine, start) and a few NumPy reductions:
+
+    - makespan: latest end, overall and per resource type
+    - utilization: busy time over machines x T, per resource type and
+      overall, and the distribution over machines
+    - idle gaps: free time between consecutive tasks on a machine (the time
+      before the first and after the last task is not a gap)
+    - cost: machines x Resource.cost, per resource type and in total
+    - completion: latest end of each job, and stretch, the time from the
+      job's release to its completion divided by its scheduled work
+
+    Distributions are summarized as count, mean, min, percentiles and max,
+    so the result is small and JSON-serializable.
+
+    Args:
+        solution: Schedule as returned by an algorithm
+        resources: Dictionary mapping resource type to Resource objects after the run
+        jobs: The scheduled jobs, for release times (default: all released at 0)
+        per_machine: Also return the busy time and utilization of every machine
+        per_job: Also return the completion time and stretch of every job
+
+    Returns:
+        Dictionary of schedule statistics
+    """
+    global np
+    np = load_numpy("analyze")
+    if not isinstance(solution, Solution):
+        tasks = solution
+        solution = Solution(resources)
+        solution.extend(tasks)
+
+    names = solution.resource_types
+    columns = solution.to_numpy()
+    job_ids = columns["job_ids"]
+    resource_index = columns["resources"].astype(np.int64)
+    machine_ids = columns["machine_ids"]
+    starts = columns["starts"]
+    ends = columns["ends"]
+    lengths = ends - starts
+
+    # One slot per machine: the machines of each resource type, in solution
+    # resource order, then any resource types the solution does not use
+    types = list(names) + [resource_type for resource_type in resources if resource_type not in names]
+    used_ids = np.zeros(len(types), dtype=np.int64)
+    if len(solution):
+        np.maximum.at(used_ids, resource_index, machine_ids)
+    counts = np.array([max(len(resources[resource_type].machines) if resource_type in resources else 0,
+                           int(used_ids[r])) for r, resource_type in enumerate(types)], dtype=np.int64)
+    offsets = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.int64)
+    horizon = np.array([resources[resource_type].T if resource_type in resources else 0
+                        for resource_type in types], dtype=np.int64)
+    unit_cost = np.array([resources[resource_type].cost if resource_type in resources else 0
+                          for resource_type in types], dtype=np.int64)
+
+    slot = offsets[resource_index] + machine_ids - 1
+    busy = np.bincount(slot, weights=lengths, minlength=int(counts.sum())) if len(slot) else np.zeros(int(counts.sum()))
+    slot_type = np.repeat(np.arange(len(types)), counts)
+    machine_utilization = busy / np.maximum(horizon[slot_type], 1)
+
+    type_busy = np.bincount(slot_type, weights=busy, minlength=len(types))
+    type_capacity = counts * horizon
+    type_makespan = np.zeros(len(types), dtype=np.int64)
+    if len(solution):
+        np.maximum.at(type_makespan, resource_index, ends)
+    makespan = int(ends.max()) if len(ends) else 0
+
+    # Idle gaps between consecutive tasks on the same machine
+    order = np.lexsort((starts, slot))
+    sorted_slot = slot[order]
+    gaps = starts[order][1:] - ends[order][:-1]
+    keep = (sorted_slot[1:] == sorted_slot[:-1]) & (gaps > 0)
+    gaps = gaps[keep]
+    gap_type = slot_type[sorted_slot[1:][keep]]
+
+    resource_stats = {}
+    for r, resource_type in enumerate(types):
+        capacity = int(type_capacity[r])
+        in_type = slot_type == r
+        resource_stats[resource_type] = {
+            "machines": int(counts[r]),
+            "cost": int(counts[r] * unit_cost[r]),
+            "busy": int(type_busy[r]),
+            "makespan": int(type_makespan[r]),
+            "utilization": float(type_busy[r] / capacity) if capacity else 0.0,
+            "machine_utilization": _distribution(machine_utilization[in_type]),
+            "idle_gaps": _distribution(gaps[gap_type == r]),
+        }
+
+    capacity = int(type_capacity.sum())
+    report = {
+        "tasks": len(solution),
+        "machines": int(counts.sum()),
+        "cost": int((counts * unit_cost).sum()),
+        "makespan": makespan,
+        "busy": int(lengths.sum()),
+        "utilization": float(lengths.sum() / capacity) if capacity else 0.0,
+        "machine_utilization": _distribution(machine_utilization),
+        "idle_gaps": _distribution(gaps),
+        "resources": resource_stats,
+    }
+
+    # Completion and stretch per job
+    unique_jobs, job_index = np.unique(job_ids, return_inverse=True)
+    completion = np.zeros(len(unique_jobs), dtype=np.int64)
+    if len(unique_jobs):
+        np.maximum.at(completion, job_index, ends)
+    work = np.bincount(job_index, weights=lengths, minlength=len(unique_jobs))
+    release = _release_times(jobs, unique_jobs)
+    stretch = (completion - release) / np.maximum(work, 1)
+    report["jobs"] = len(unique_jobs)
+    report["completion"] = _distribution(completion)
+    report["stretch"] = _distribution(stretch)
+
+    if per_machine:
+        report["per_machine"] = [
+            {"resource_type": types[int(slot_type[i])], "machine_id": int(i - offsets[slot_type[i]] + 1),
+             "busy": int(busy[i]), "utilization": float(machine_utilization[i])}
+            for i in range(len(busy))
+        ]
+    if per_job:
+        report["per_job"] = {
+            int(job_id): {"completion": int(completion[i]), "stretch": float(stretch[i])}
+            for i, job_id in enumerate(unique_jobs.tolist())
+        }
+    return report
+
+def aggregate(reports: Iterable[Dict], by: Union[str, Sequence[str]] = "algorithm",
+              exclude: Sequence[str] = RUN_KEYS) -> Dict:
+    """
+    Combine reports of many runs, e.g. the results of a sweep run with analytics.
+
+    Nested dictionaries are flattened to dotted keys ("resources.A.cost");
+    every numeric value is then summarized over the runs of a group as its
+    count, mean, min, percentiles and max. The grouping keys and the keys in
+    exclude are not metrics and are left out.
+
+    Args:
+        reports: Dictionaries from analyze(), run_case() or sweep()
+        by: Key or keys whose values define the groups; missing keys group as None
+        exclude: Top-level keys that identify a run, such as the sweep's case index
+
+    Returns:
+        Dictionary mapping each group (a value, or a tuple of values for
+        several keys) to its number of runs and per-metric summaries
+    """
+    global np
+    np = load_numpy("aggregate")
+    keys = (by,) if isinstance(by, str) else tuple(by)
+    skipped = set(keys) | set(exclude)
+    groups: Dict = {}
+    for report in reports:
+        group = tuple(report.get(key) for key in keys)
+        group = group[0] if len(keys) == 1 else group
+        values = groups.setdefault(group, {"runs": 0, "metrics": {}})
+        values["runs"] += 1
+        for name, value in _flatten({key: value for key, value in report.items() if key not in skipped}):
+            values["metrics"].setdefault(name, []).append(value)
+
+    return {
+        group: {
+            "runs": values["runs"],
+            "metrics": {name: _distribution(np.asarray(series, dtype=float))
+                        for name, series in values["metrics"].items()},
+        }
+        for group, values in groups.items()
+    }
+
+def _flatten(report: Dict, prefix: str = "") -> Iterable[Tuple[str, float]]:
+    for key, value in report.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            yield from _flatten(value, name + ".")
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield name, value
+
+def _distribution(values: "np.ndarray") -> Dict:
+    if len(values) == 0:
+        return {"count": 0}
+    result = {
+        "count": int(len(values)),
+        "mean": float(values.mean()),
+        "min": values.min().item(),
+    }
+    for q, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+        result[f"p{q}"] = float(value)
+    result["max"] = values.max().item()
+    return result
+
+def _release_times(jobs: Optional[Union[List[Job], JobTable, Instance]], job_ids: "np.ndarray") -> "np.ndarray":
+    release = np.zeros(len(job_ids), dtype=np.int64)
+    if jobs is None or isinstance(jobs, Instance):
+        return release  # Instances have no release times
+    if isinstance(jobs, JobTable):
+        table_ids = np.frombuffer(jobs.job_ids, dtype=np.int64) if len(jobs) else np.zeros(0, dtype=np.int64)
+        table_release = np.frombuffer(jobs.release_times, dtype=np.int64) if len(jobs) else table_ids
+    else:
+        table_ids = np.array([job.id for job in jobs], dtype=np.int64)
+        table_release = np.array([job.release_time for job in jobs], dtype=np.int64)
+    order = np.argsort(table_ids, kind="stable")
+    position = np.searchsorted(table_ids[order], job_ids)
+    found = position < len(order)
+    found[found] = table_ids[order][position[found]] == job_ids[found]
+    release[found] = table_release[order][position[found]]
+    return release
@@ -0,0 +1,125 @@
+import json
+import mmap
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Iterable, List, Sequence, Tuple
+
+# The binary formats store little-endian columns; on such machines they are used in place
+NATIVE_LITTLE_ENDIAN = sys.byteorder == "little"
+
+def pack_names(names: Sequence[str]) -> bytes:
+    """
+    Encode resource type names as JSON, padded so the columns after them stay 8-byte aligned.
+
+    Args:
+        names: Names to encode
+
+    Returns:
+        Encoded names block
+    """
+    block = json.dumps(list(names)).encode()
+    return block + b" " * (-len(block) % 8)
+
+def write_columns(f: BinaryIO, columns: Iterable[Tuple[str, Sequence[int]]]) -> None:
+    """
+    Write integer columns back to back as little-endian values.
+
+    Args:
+        f: File opened for binary writing
+        columns: (typecode, values) pairs, e.g. ('q', job_ids); values may
+            be arrays, memoryviews or any sequence of integers
+    """
+    for typecode, column in columns:
+        if not isinstance(column, array) or column.typecode != typecode or not NATIVE_LITTLE_ENDIAN:
+            column = array(typecode, column)
+            if not NATIVE_LITTLE_ENDIAN:
+                column.byteswap()
+        f.write(memoryview(column).cast('B'))
+
+def open_buffer(path: str, mmap_mode: bool) -> memoryview:
+    """
+    Get the bytes of a binary file, memory-mapped where the columns can be used in place.
+
+    Args:
+        path: File to open
+        mmap_mode: Memory-map the file instead of reading it
+
+    Returns:
+        Read-only view of the file's contents
+    """
+    with open(path, "rb") as f:
+        if mmap_mode and NATIVE_LITTLE_ENDIAN and f.seek(0, 2) > 0:
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        f.seek(0)
+        return memoryview(f.read())
+
+def read_header(buffer: memoryview, header: struct.Struct, magic: bytes, path: str, kind: str) -> tuple:
+    """
+    Unpack and check the header of a binary file.
+
+    Args:
+        buffer: File contents
+        header: Layout of the header; its first field is the magic
+        magic: Expected magic
+        path: File name, for error messages
+        kind: What the file should hold, for error messages (e.g. "job file")
+
+    Returns:
+        The header fields after the magic
+
+    Raises:
+        ValueError: If the file is too short or has another magic
+    """
+    if len(buffer) < header.size or header.unpack_from(buffer)[0] != magic:
+        raise ValueError(f"{path} is not a {kind}.")
+    return header.unpack_from(buffer)[1:]
+
+def read_names(buffer: memoryview, offset: int, length: int) -> List[str]:
+    """
+    Decode a names block written by pack_names().
+
+    Args:
+        buffer: File contents
+        offset: Start of the block
+        length: Length of the block in bytes
+
+    Returns:
+        The names
+    """
+    return json.loads(bytes(buffer[offset:offset + length]))
+
+def read_columns(buffer: memoryview, offset: int, layout: Iterable[Tuple[str, int]],
+                 mmap_mode: bool, path: str) -> List:
+    """
+    Read integer columns written by write_columns().
+
+    With mmap_mode on a little-endian machine, the columns are read-only
+    views of the buffer; otherwise they are arrays that own their data.
+
+    Args:
+        buffer: File contents, from open_buffer()
+        offset: Start of the first column
+        layout: (typecode, length) of every column, in file order
+        mmap_mode: Return views of the buffer where possible
+        path: File name, for error messages
+
+    Returns:
+        One column per layout entry
+
+    Raises:
+        ValueError: If the file ends before the last column
+    """
+    columns = []
+    for typecode, length in layout:
+        size = length * array(typecode).itemsize
+        if offset + size > len(buffer):
+            raise ValueError(f"{path} is truncated.")
+        column = buffer[offset:offset + size].cast(typecode)
+        if not mmap_mode or not NATIVE_LITTLE_ENDIAN:
+            column = array(typecode, column)
+            if not NATIVE_LITTLE_ENDIAN:
+                column.byteswap()
+        columns.append(column)
+        offset += size
+    return columns
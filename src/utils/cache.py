@@ -0,0 +1,319 @@
+import hashlib
+import json
+import os
+from array import array
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+from ..algorithms import ALGORITHMS, ALGORITHM_VERSIONS
+from ..core.job import Job
+from ..core.job_table import JobTable
+from ..core.resource import Resource
+from ..core.solution import Solution
+
+# Cache entry: the schedule and the number of machines per resource type after the run
+Entry = Tuple[Solution, Dict[str, int]]
+
+def instance_key(jobs: Iterable[Job], resources: Dict[str, Resource], algorithm: str,
+                 version: Optional[int] = None) -> str:
+    """
+    Stable hash of a scheduling run's inputs.
+
+    Covers the algorithm name and version, each resource type with its T,
+    and every job's id, tasks and free time. Job order and the task order
+    within a job are kept, since the greedy algorithms depend on both;
+    resource types are sorted, and tasks with no duration are left out, as
+    the algorithms skip them. The jobs are encoded as integers and hashed
+    in large chunks, so hashing is cheap next to scheduling.
+
+    Args:
+        jobs: Jobs to schedule, or a JobTable
+        resources: Dictionary mapping resource type to Resource objects
+        algorithm: Key of ALGORITHMS
+        version: Algorithm version (default: ALGORITHM_VERSIONS)
+
+    Returns:
+        Hexadecimal BLAKE2b digest
+    """
+    if version is None:
+        version = ALGORITHM_VERSIONS.get(algorithm, 0)
+    types = sorted(resources)
+    type_index = {resource_type: r for r, resource_type in enumerate(types)}
+    header = {
+        "algorithm": algorithm,
+        "version": version,
+        "resources": [[resource_type, resources[resource_type].T] for resource_type in types],
+    }
+    digest = hashlib.blake2b(json.dumps(header, sort_keys=True).encode(), digest_size=20)
+
+    values = array('q')
+    for job in jobs:
+        tasks = [(type_index[resource_type], duration)
+                 for resource_type, duration in job.task_durations.items() if duration > 0]
+        values.append(job.id)
+        values.append(len(tasks))
+        for task in tasks:
+            values.extend(task)
+        free = job.available_time
+        values.append(len(free))
+        for time_range in free:
+            values.extend(time_range)
+        if len(values) >= 65536:
+            digest.update(values)
+            del values[:]
+    digest.update(values)
+    return digest.hexdigest()
+
+class ResultCache:
+    """
+    Memoizes algorithm runs by instance_key.
+
+    Schedules are kept in an in-memory LRU, bounded by entries and by bytes,
+    and, given a directory, in an on-disk store of Solution files that is
+    shared between processes (e.g. sweep workers). The store is bounded by
+    total size; the least recently used files are removed first.
+
+    A cached run returns a copy of the stored schedule and restores the
+    resources and jobs as the algorithm left them: the machines and their
+    free time, and the free time of every Job. Jobs given as a JobTable
+    have no free time to update.
+    """
+    def __init__(self, directory: Optional[str] = None, max_items: int = 128,
+                 max_memory_bytes: int = 256 << 20, max_disk_bytes: int = 1 << 30):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory of the on-disk store, created if needed; None keeps schedules in memory only
+            max_items: Maximum schedules in memory
+            max_memory_bytes: Maximum size of the schedules in memory
+            max_disk_bytes: Maximum size of the on-disk store
+        """
+        self.directory = directory
+        self.max_items = max_items
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0  # Served from memory
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._memory: "OrderedDict[str, Entry]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk: "OrderedDict[str, int]" = OrderedDict()  # Key to file size, least recently used first
+        self._disk_bytes = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self._scan()
+
+    def run(self, algorithm: str, jobs, resources: Dict[str, Resource], **kwargs) -> Solution:
+        """
+        Run an algorithm of ALGORITHMS, or serve its schedule from the cache.
+
+        Resources that already have machines are not cached, since their
+        state is not part of the key, and neither are lists of jobs with
+        repeated ids, whose schedules cannot be replayed onto the jobs.
+
+        Args:
+            algorithm: Key of ALGORITHMS
+            jobs: Jobs to schedule, or a JobTable
+            resources: Dictionary mapping resource type to Resource objects
+            **kwargs: Passed to the algorithm; they must not change the schedule (e.g. engine, tracer)
+
+        Returns:
+            Solution of scheduled tasks, as the algorithm returns it
+        """
+        return self.run_with_status(algorithm, jobs, resources, **kwargs)[0]
+
+    def run_with_status(self, algorithm: str, jobs, resources: Dict[str, Resource],
+                        **kwargs) -> Tuple[Solution, bool]:
+        """
+        Like run(), also telling whether the schedule came from the cache.
+
+        Args:
+            algorithm: Key of ALGORITHMS
+            jobs: Jobs to schedule, or a JobTable
+            resources: Dictionary mapping resource type to Resource objects
+            **kwargs: Passed to the algorithm
+
+        Returns:
+            The solution, and True if it was served from memory or disk,
+            False if the algorithm ran (also when the run bypassed the cache)
+        """
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        jobs_by_id = None if isinstance(jobs, JobTable) else {job.id: job for job in jobs}
+        if (any(resource.machines or resource.horizon for resource in resources.values())
+                or (jobs_by_id is not None and len(jobs_by_id) != len(jobs))):
+            return ALGORITHMS[algorithm](jobs, resources, **kwargs), False
+
+        key = instance_key(jobs, resources, algorithm)
+        entry = self.get(key)
+        if entry is not None:
+            solution, machines = entry
+            _restore(solution, machines, resources, jobs_by_id)
+            return solution, True
+
+        solution = ALGORITHMS[algorithm](jobs, resources, **kwargs)
+        self.put(key, solution, {resource_type: len(resource.machines)
+                                 for resource_type, resource in resources.items()})
+        return solution, False
+
+    def get(self, key: str) -> Optional[Entry]:
+        """
+        Look up a schedule.
+
+        Args:
+            key: instance_key of the run
+
+        Returns:
+            A copy of the stored schedule and the machine counts, or None
+        """
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return entry[0].copy(), dict(entry[1])
+
+        entry = self._load(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.disk_hits += 1
+        self._remember(key, entry)
+        return entry[0].copy(), dict(entry[1])
+
+    def put(self, key: str, solution: Solution, machines: Dict[str, int]) -> None:
+        """
+        Store a schedule in memory and, if the cache has a directory, on disk.
+
+        Args:
+            key: instance_key of the run
+            solution: Schedule to store; a copy is kept
+            machines: Number of machines per resource type after the run
+        """
+        if not isinstance(solution, Solution):
+            tasks = solution
+            solution = Solution()
+            solution.extend(tasks)
+        entry = (solution.copy(), dict(machines))
+        self._remember(key, entry)
+        if self.directory is not None:
+            self._store(key, entry)
+
+    def clear(self) -> None:
+        """Remove every schedule from memory and from the on-disk store."""
+        self._memory.clear()
+        self._memory_bytes = 0
+        for key in list(self._disk):
+            self._remove(key)
+
+    def stats(self) -> Dict:
+        """
+        Hit counts and sizes.
+
+        Returns:
+            Dictionary of hits, disk_hits, misses, evictions, and the entries and bytes in memory and on disk
+        """
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "memory_items": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "disk_items": len(self._disk),
+            "disk_bytes": self._disk_bytes,
+        }
+
+    def _remember(self, key: str, entry: Entry) -> None:
+        if key in self._memory:
+            self._memory_bytes -= _size(self._memory.pop(key)[0])
+        self._memory[key] = entry
+        self._memory_bytes += _size(entry[0])
+        while self._memory and (len(self._memory) > self.max_items or self._memory_bytes > self.max_memory_bytes):
+            _, (solution, _) = self._memory.popitem(last=False)
+            self._memory_bytes -= _size(solution)
+            self.evictions += 1
+
+    def _paths(self, key: str) -> Tuple[str, str]:
+        base = os.path.join(self.directory, key)
+        return base + ".sol", base + ".json"
+
+    def _scan(self) -> None:
+        # Index the store, oldest first; other processes may add files later
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".sol"):
+                key = name[:-4]
+                try:
+                    size = sum(os.path.getsize(path) for path in self._paths(key))
+                    entries.append((os.path.getmtime(self._paths(key)[0]), key, size))
+                except OSError:
+                    continue
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self._disk_bytes += size
+
+    def _load(self, key: str) -> Optional[Entry]:
+        if self.directory is None:
+            return None
+        solution_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path) as f:
+                machines = json.load(f)["machines"]
+            solution = Solution.load(solution_path, mmap_mode=False)
+            os.utime(solution_path)  # Mark as recently used for the eviction order
+        except (OSError, ValueError, KeyError):
+            return None
+        size = os.path.getsize(solution_path) + os.path.getsize(meta_path)
+        self._disk_bytes += size - self._disk.pop(key, 0)
+        self._disk[key] = size
+        return solution, machines
+
+    def _store(self, key: str, entry: Entry) -> None:
+        solution, machines = entry
+        solution_path, meta_path = self._paths(key)
+        suffix = f".{os.getpid()}.tmp"
+        # Write the schedule before its metadata, so a reader never finds metadata without a schedule
+        solution.save(solution_path + suffix)
+        os.replace(solution_path + suffix, solution_path)
+        with open(meta_path + suffix, "w") as f:
+            json.dump({"machines": machines, "tasks": len(solution)}, f)
+        os.replace(meta_path + suffix, meta_path)
+
+        size = os.path.getsize(solution_path) + os.path.getsize(meta_path)
+        self._disk_bytes += size - self._disk.pop(key, 0)
+        self._disk[key] = size
+        while self._disk_bytes > self.max_disk_bytes and len(self._disk) > 1:
+            self._remove(next(iter(self._disk)))
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        self._disk_bytes -= self._disk.pop(key)
+        for path in reversed(self._paths(key)):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass  # Already evicted by another process
+
+def _size(solution: Solution) -> int:
+    return sum(len(column) * column.itemsize for column in (
+        solution.job_ids, solution.resources, solution.machine_ids, solution.starts, solution.ends))
+
+def _restore(solution: Solution, machines: Dict[str, int], resources: Dict[str, Resource],
+             jobs_by_id: Optional[Dict[int, Job]]) -> None:
+    # Recreate the machines the run opened and take the scheduled time out of
+    # the free time of the machines and jobs
+    for resource_type, count in machines.items():
+        resource = resources[resource_type]
+        while len(resource.machines) < count:
+            resource.add_machine()
+    touched = set()
+    for job_id, resource_type, machine_id, time_range in solution:
+        machine = resources[resource_type].machines[machine_id - 1]
+        machine.assign(time_range)
+        touched.add((resource_type, machine_id))
+        if jobs_by_id is not None:
+            jobs_by_id[job_id].assign(time_range)
+    for resource_type, machine_id in touched:
+        resource = resources[resource_type]
+        resource.update(resource.machines[machine_id - 1])
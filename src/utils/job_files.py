@@ -0,0 +1,257 @@
+import json
+import struct
+from array import array
+from typing import Iterator, Optional, Sequence, Union
+from ..core.instance import Instance
+from ..core.job import Job
+from ..core.job_table import JobTable
+from .binary import open_buffer, pack_names, read_columns, read_header, read_names, write_columns
+
+_MAGIC = b"SCHDJOB1"
+_HEADER = struct.Struct("<8sqQQQ")  # magic, T, number of jobs, number of resource types, length of the names block
+
+def _as_table(jobs: Union[JobTable, Instance]) -> JobTable:
+    return jobs.build_table() if isinstance(jobs, Instance) else jobs
+
+def write_csv(jobs: Union[JobTable, Instance], path: str) -> None:
+    """
+    Write jobs as CSV: a header of job_id, release_time and the resource
+    types, then one row of integers per job.
+
+    Args:
+        jobs: Table or instance to write
+        path: Output file
+    """
+    table = _as_table(jobs)
+    width = table.width
+    with open(path, "w") as f:
+        f.write(",".join(("job_id", "release_time") + table.resource_types) + "\n")
+        for start in range(0, len(table), 65536):
+            lines = []
+            for index in range(start, min(start + 65536, len(table))):
+                row = table.durations[index * width:(index + 1) * width]
+                lines.append(f"{table.job_ids[index]},{table.release_times[index]},{','.join(map(str, row))}\n")
+            f.write("".join(lines))
+
+def iter_csv(path: str, T: int, chunk_size: int = 65536) -> Iterator[JobTable]:
+    """
+    Stream a CSV job file as JobTables of up to chunk_size jobs.
+
+    Each chunk of lines is parsed in one pass into integer arrays; no
+    per-job dict or list is kept.
+
+    Args:
+        path: File written by write_csv, or any CSV with the same header
+        T: Global time limit
+        chunk_size: Maximum number of jobs per table
+
+    Returns:
+        Iterator over tables, in file order; one empty table if the file has no rows
+    """
+    with open(path) as f:
+        header = f.readline().strip().split(",")
+        if header[:2] != ["job_id", "release_time"]:
+            raise ValueError(f"{path}: expected a header starting with job_id,release_time")
+        resource_types = header[2:]
+        columns = len(header)
+
+        empty = True
+        while True:
+            lines = []
+            for line in f:
+                line = line.strip()
+                if line:
+                    lines.append(line)
+                    if len(lines) == chunk_size:
+                        break
+            if not lines:
+                if empty:
+                    yield JobTable(T, resource_types)
+                return
+            empty = False
+            values = array('q', map(int, ",".join(lines).split(",")))
+            if len(values) != len(lines) * columns:
+                raise ValueError(f"{path}: every row needs {columns} values")
+            yield _table_from_rows(values, T, resource_types, columns)
+            if len(lines) < chunk_size:
+                return
+
+def write_jsonl(jobs: Union[JobTable, Instance], path: str) -> None:
+    """
+    Write jobs as JSON Lines: a header object with T and the resource
+    types, then one [job_id, release_time, durations...] array per job.
+
+    Args:
+        jobs: Table or instance to write
+        path: Output file
+    """
+    table = _as_table(jobs)
+    width = table.width
+    with open(path, "w") as f:
+        f.write(json.dumps({"T": table.T, "resource_types": list(table.resource_types)}) + "\n")
+        for start in range(0, len(table), 65536):
+            lines = []
+            for index in range(start, min(start + 65536, len(table))):
+                row = table.durations[index * width:(index + 1) * width]
+                lines.append(f"[{table.job_ids[index]},{table.release_times[index]},{','.join(map(str, row))}]\n")
+            f.write("".join(lines))
+
+def iter_jsonl(path: str, chunk_size: int = 65536, T: Optional[int] = None) -> Iterator[JobTable]:
+    """
+    Stream a JSON Lines job file as JobTables of up to chunk_size jobs.
+
+    Job lines are arrays, so each chunk is decoded as one JSON array of rows.
+
+    Args:
+        path: File written by write_jsonl
+        chunk_size: Maximum number of jobs per table
+        T: Global time limit, overriding the one in the header
+
+    Returns:
+        Iterator over tables, in file order; one empty table if the file has no rows
+    """
+    with open(path) as f:
+        line = f.readline()
+        header = json.loads(line) if line.strip() else None
+        if not isinstance(header, dict) or "resource_types" not in header or "T" not in header:
+            raise ValueError(f'{path}: expected a header object with "T" and "resource_types"')
+        resource_types = header["resource_types"]
+        T = header["T"] if T is None else T
+        columns = len(resource_types) + 2
+
+        empty = True
+        while True:
+            lines = []
+            for line in f:
+                line = line.strip()
+                if line:
+                    lines.append(line)
+                    if len(lines) == chunk_size:
+                        break
+            if not lines:
+                if empty:
+                    yield JobTable(T, resource_types)
+                return
+            empty = False
+            values = array('q')
+            for row in json.loads("[" + ",".join(lines) + "]"):
+                if len(row) != columns:
+                    raise ValueError(f"{path}: every row needs {columns} values")
+                values.extend(row)
+            yield _table_from_rows(values, T, resource_types, columns)
+            if len(lines) < chunk_size:
+                return
+
+def write_binary(jobs: Union[JobTable, Instance], path: str) -> None:
+    """
+    Write jobs in the fixed-width binary format that load_binary() can memory-map.
+
+    Layout: a header (magic, T, job count, resource type count, names
+    length), the resource type names as JSON padded to 8 bytes, then the
+    job_ids and release_times columns and the row-major durations, all
+    little-endian int64.
+
+    Args:
+        jobs: Table or instance to write
+        path: Output file
+    """
+    table = _as_table(jobs)
+    names = pack_names(table.resource_types)
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, table.T, len(table), table.width, len(names)))
+        f.write(names)
+        write_columns(f, [('q', table.job_ids), ('q', table.release_times), ('q', table.durations)])
+
+def load_binary(path: str, mmap_mode: bool = True) -> JobTable:
+    """
+    Read a job file written by write_binary().
+
+    With mmap_mode, the table's columns are read-only views of the
+    memory-mapped file, so loading costs no time or memory per job until
+    the jobs are read; such a table cannot be appended to.
+
+    Args:
+        path: File written by write_binary()
+        mmap_mode: Memory-map the file instead of reading it
+
+    Returns:
+        Table of the file's jobs
+    """
+    buffer = open_buffer(path, mmap_mode)
+    T, count, width, names_length = read_header(buffer, _HEADER, _MAGIC, path, "job file")
+    table = JobTable(T, read_names(buffer, _HEADER.size, names_length))
+    layout = [('q', count), ('q', count), ('q', count * width)]
+    table.job_ids, table.release_times, table.durations = read_columns(
+        buffer, _HEADER.size + names_length, layout, mmap_mode, path)
+    return table
+
+def iter_tables(path: str, T: Optional[int] = None, chunk_size: int = 65536) -> Iterator[JobTable]:
+    """
+    Stream a job file as JobTables, choosing the format by extension.
+
+    .csv and .jsonl files are parsed in chunks; other files are read as the
+    binary format and yielded as one memory-mapped table.
+
+    Args:
+        path: Job file
+        T: Global time limit; required for CSV, optional otherwise
+        chunk_size: Maximum number of jobs per table for text formats
+
+    Returns:
+        Iterator over tables, in file order
+    """
+    if path.endswith(".csv"):
+        if T is None:
+            raise ValueError("T is required to load a CSV job file.")
+        return iter_csv(path, T, chunk_size)
+    if path.endswith(".jsonl"):
+        return iter_jsonl(path, chunk_size, T)
+    table = load_binary(path)
+    if T is not None:
+        table.T = T
+    return iter([table])
+
+def load_jobs(path: str, T: Optional[int] = None) -> JobTable:
+    """
+    Load a whole job file into one JobTable.
+
+    Args:
+        path: Job file (.csv, .jsonl, or binary)
+        T: Global time limit; required for CSV, optional otherwise
+
+    Returns:
+        Table of all jobs in the file
+    """
+    tables = iter_tables(path, T)
+    table = next(tables)
+    for chunk in tables:
+        table.job_ids.extend(chunk.job_ids)
+        table.release_times.extend(chunk.release_times)
+        table.durations.extend(chunk.durations)
+    return table
+
+def iter_jobs(path: str, T: Optional[int] = None, chunk_size: int = 65536) -> Iterator[Job]:
+    """
+    Stream the jobs of a file one at a time, e.g. into schedule_stream or a greedy algorithm.
+
+    Args:
+        path: Job file (.csv, .jsonl, or binary)
+        T: Global time limit; required for CSV, optional otherwise
+        chunk_size: Jobs parsed at once for text formats
+
+    Returns:
+        Iterator over jobs, in file order
+    """
+    for table in iter_tables(path, T, chunk_size):
+        yield from table
+
+def _table_from_rows(values: Sequence[int], T: int, resource_types: Sequence[str], columns: int) -> JobTable:
+    table = JobTable(T, resource_types)
+    table.job_ids = values[0::columns]
+    table.release_times = values[1::columns]
+    if columns > 2:
+        durations = array('q', values)
+        del durations[0::columns]  # Drop the job ids, leaving rows of columns - 1 values
+        del durations[0::columns - 1]  # Drop the release times
+        table.durations = durations
+    return table
@@ -0,0 +1,206 @@
+import marshal
+import sys
+import time
+from typing import IO, Dict, List, Optional
+
+# Counter names used by the greedy algorithms
+TASKS = "tasks"
+PROBES = "probes"
+ASSIGNS = "assigns"
+VALUE_ERRORS = "value_errors"
+MACHINES_OPENED = "machines_opened"
+FAILURES = "failures"
+
+# Histogram names used by the greedy algorithms
+PROBES_PER_TASK = "probes_per_task"
+MACHINE_FRAGMENTS = "machine_fragments"
+JOB_FRAGMENTS = "job_fragments"
+SLOTS_PER_TASK = "slots_per_task"
+
+# Phase timer names used by the greedy algorithms
+PHASE_SCHEDULE = "schedule"
+PHASE_PROBE = "probe"
+PHASE_ASSIGN = "assign"
+PHASE_OPEN_MACHINE = "open_machine"
+
+class Metrics:
+    """
+    Counters, phase timers and histograms for a scheduling run.
+
+    Like a Tracer, the base class records nothing and has enabled = False;
+    algorithms check `enabled` once per task before taking any measurement,
+    so passing no metrics costs one attribute test per task.
+    """
+    enabled = False
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """
+        Add to a counter.
+
+        Args:
+            name: Counter name
+            amount: Amount to add
+        """
+
+    def observe(self, name: str, value: int) -> None:
+        """
+        Add a value to a histogram.
+
+        Args:
+            name: Histogram name
+            value: Non-negative value
+        """
+
+    def add_time(self, name: str, seconds: float, parent: Optional[str] = PHASE_SCHEDULE) -> None:
+        """
+        Add one timed call of a phase.
+
+        Args:
+            name: Phase name
+            seconds: Time spent in the call
+            parent: Enclosing phase, used when exporting as profiler stats
+        """
+
+    def timed(self, name: str, parent: Optional[str] = None) -> "_Timer":
+        """
+        Time a block of code as one call of a phase.
+
+        Args:
+            name: Phase name
+            parent: Enclosing phase
+
+        Returns:
+            Context manager that records the elapsed time on exit
+        """
+        return _Timer(self, name, parent)
+
+NULL_METRICS = Metrics()
+
+class RunMetrics(Metrics):
+    """
+    Collects counters, phase timers and power-of-two histograms in memory.
+
+    Results are available with as_dict(), as a printed table with report(),
+    or as a pstats file with dump_stats(), in which each phase appears as a
+    function so the usual profile viewers can open it.
+    """
+    enabled = True
+
+    def __init__(self):
+        """Initialize empty counters, timers and histograms."""
+        self.counters: Dict[str, int] = {}
+        self.timers: Dict[str, List[float]] = {}  # name -> [calls, seconds]
+        self.histograms: Dict[str, Dict[int, int]] = {}  # name -> bit length of value -> count
+        self._parents: Dict[str, Optional[str]] = {}
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe(self, name: str, value: int) -> None:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = {}
+        bucket = value.bit_length()
+        histogram[bucket] = histogram.get(bucket, 0) + 1
+
+    def add_time(self, name: str, seconds: float, parent: Optional[str] = PHASE_SCHEDULE) -> None:
+        timer = self.timers.get(name)
+        if timer is None:
+            timer = self.timers[name] = [0, 0.0]
+            self._parents[name] = parent if parent != name else None
+        timer[0] += 1
+        timer[1] += seconds
+
+    def as_dict(self) -> Dict:
+        """
+        Export all measurements.
+
+        Histogram buckets are labelled with the value range they hold:
+        "0", "1", "2-3", "4-7" and so on. Per-task averages of the main
+        counters are added when tasks were counted.
+
+        Returns:
+            Dictionary with counters, timers (calls and seconds), histograms and ratios
+        """
+        histograms = {}
+        for name, histogram in self.histograms.items():
+            histograms[name] = {_bucket_label(bucket): histogram[bucket] for bucket in sorted(histogram)}
+        result = {
+            "counters": dict(self.counters),
+            "timers": {name: {"calls": calls, "seconds": seconds} for name, (calls, seconds) in self.timers.items()},
+            "histograms": histograms,
+        }
+        tasks = self.counters.get(TASKS)
+        if tasks:
+            result["per_task"] = {
+                name: self.counters.get(name, 0) / tasks
+                for name in (PROBES, ASSIGNS, VALUE_ERRORS, MACHINES_OPENED)
+            }
+        return result
+
+    def report(self, stream: Optional[IO[str]] = None) -> None:
+        """
+        Print counters, timers and histograms as a table.
+
+        Args:
+            stream: Output stream, defaults to stdout
+        """
+        stream = stream or sys.stdout
+        data = self.as_dict()
+        for name, value in sorted(data["counters"].items()):
+            print(f"{name:<24} {value:>14}", file=stream)
+        for name, timer in sorted(data["timers"].items(), key=lambda item: -item[1]["seconds"]):
+            print(f"{name:<24} {timer['calls']:>14} calls {timer['seconds']:>12.6f}s", file=stream)
+        for name, histogram in sorted(data["histograms"].items()):
+            print(f"{name}:", file=stream)
+            for label, count in histogram.items():
+                print(f"  {label:>22} {count:>14}", file=stream)
+
+    def dump_stats(self, path: str) -> None:
+        """
+        Write the phase timers in the format of cProfile's dump_stats.
+
+        Each phase is a pseudo-function ("<scheduling>", 0, name) whose
+        cumulative time is its measured time and whose own time excludes its
+        child phases, so pstats, snakeviz and similar tools can load the file.
+
+        Args:
+            path: Output file
+        """
+        children: Dict[str, float] = {}
+        for name, parent in self._parents.items():
+            if parent in self.timers:
+                children[parent] = children.get(parent, 0.0) + self.timers[name][1]
+
+        stats = {}
+        for name, (calls, seconds) in self.timers.items():
+            own = max(0.0, seconds - children.get(name, 0.0))
+            parent = self._parents.get(name)
+            callers = {}
+            if parent in self.timers:
+                callers[_function(parent)] = (calls, calls, own, seconds)
+            stats[_function(name)] = (calls, calls, own, seconds, callers)
+        with open(path, "wb") as f:
+            marshal.dump(stats, f)
+
+class _Timer:
+    def __init__(self, metrics: Metrics, name: str, parent: Optional[str]):
+        self._metrics = metrics
+        self._name = name
+        self._parent = parent
+
+    def __enter__(self) -> "_Timer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._metrics.add_time(self._name, time.perf_counter() - self._start, self._parent)
+
+def _function(name: str) -> tuple:
+    return ("<scheduling>", 0, name)
+
+def _bucket_label(bucket: int) -> str:
+    if bucket <= 1:
+        return str(bucket)
+    low = 1 << (bucket - 1)
+    return f"{low}-{2 * low - 1}"
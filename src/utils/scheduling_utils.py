@@ -1,46 +1,117 @@
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple
 
-def intersection_of_time_ranges(arr1: List[Tuple[int, int]], 
-                              arr2: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+def _sorted(time_ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Return time_ranges if it is already ordered by start time, else a sorted copy."""
+    for i in range(1, len(time_ranges)):
+        if time_ranges[i][0] < time_ranges[i - 1][0]:
+            return sorted(time_ranges, key=lambda x: x[0])
+    return time_ranges
+
+def iter_intersection(ranges1: Iterable[Tuple[int, int]],
+                      ranges2: Iterable[Tuple[int, int]]) -> Iterator[Tuple[int, int]]:
     """
-    Find the intersection of two lists of time ranges.
+    Lazily intersect two sequences of time ranges that are sorted by start time.
+
+    Yields the same ranges as intersection_of_time_ranges, one at a time,
+    reading each input only as far as needed for the next range. Inputs are
+    neither sorted nor modified; any iterable works, including an IntervalSet.
     
     Args:
-        arr1: First list of time ranges
-        arr2: Second list of time ranges
+        ranges1: First sorted sequence of time ranges
+        ranges2: Second sorted sequence of time ranges
         
     Returns:
-        List of intersecting time ranges
+        Iterator over intersecting time ranges
     """
-    result = []
-    arr1.sort(key=lambda x: x[0])
-    arr2.sort(key=lambda x: x[0])
+    it1, it2 = iter(ranges1), iter(ranges2)
+    range1, range2 = next(it1, None), next(it2, None)
+    pending = None  # Last range found; the next one may still extend it
 
-    i, j = 0, 0
-    while i < len(arr1) and j < len(arr2):
-        start1, end1 = arr1[i]
-        start2, end2 = arr2[j]
+    while range1 is not None and range2 is not None:
+        start1, end1 = range1
+        start2, end2 = range2
 
         if end1 < start2:
-            i += 1
+            range1 = next(it1, None)
         elif end2 < start1:
-            j += 1
+            range2 = next(it2, None)
         else:
             intersection_start = max(start1, start2)
             intersection_end = min(end1, end2)
 
-            if result and result[-1][1] >= intersection_start:
-                result[-1] = (result[-1][0], max(result[-1][1], intersection_end))
+            if pending is not None and pending[1] >= intersection_start:
+                pending = (pending[0], max(pending[1], intersection_end))
             else:
-                result.append((intersection_start, intersection_end))
+                if pending is not None:
+                    yield pending
+                pending = (intersection_start, intersection_end)
 
             if end1 < end2:
-                i += 1
+                range1 = next(it1, None)
             else:
-                j += 1
+                range2 = next(it2, None)
+
+    if pending is not None:
+        yield pending
+
+def first_available(time_ranges: Iterable[Tuple[int, int]], duration: int) -> Optional[Tuple[int, int]]:
+    """
+    Find the earliest slot of required duration, stopping at the first range that fits.
+    
+    Args:
+        time_ranges: Time ranges sorted by start time, e.g. from iter_intersection
+        duration: Required duration
+        
+    Returns:
+        Tuple of (start_time, end_time) or None if no suitable slot found
+    """
+    for start, end in time_ranges:
+        if end - start >= duration:
+            return (start, start + duration)
+    return None
+
+def first_units(time_ranges: Iterable[Tuple[int, int]], duration: int) -> List[Tuple[int, int]]:
+    """
+    Take the first duration units of free time, stopping once they are covered.
+
+    Gives the same slots as find_earliest_availables, but does not need the
+    total free time up front and reads no further than the last slot.
+    
+    Args:
+        time_ranges: Time ranges sorted by start time, e.g. from iter_intersection
+        duration: Total required duration
+        
+    Returns:
+        List of (start_time, end_time) tuples that sum to duration,
+        or empty list if there is not enough free time
+    """
+    result = []
+    remaining_duration = duration
+    for start, end in time_ranges:
+        if remaining_duration <= 0:
+            break
+        slot_duration = min(end - start, remaining_duration)
+        result.append((start, start + slot_duration))
+        remaining_duration -= slot_duration
 
+    if remaining_duration > 0:
+        return []
     return result
 
+def intersection_of_time_ranges(arr1: List[Tuple[int, int]], 
+                              arr2: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Find the intersection of two lists of time ranges.
+    
+    Args:
+        arr1: First list of time ranges
+        arr2: Second list of time ranges
+        
+    Returns:
+        List of intersecting time ranges
+    """
+    return list(iter_intersection(_sorted(arr1), _sorted(arr2)))
+
 def find_earliest_available(time_ranges: List[Tuple[int, int]], 
                           duration: int) -> Tuple[int, int]:
     """
@@ -53,13 +124,7 @@ def find_earliest_available(time_ranges: List[Tuple[int, int]],
     Returns:
         Tuple of (start_time, end_time) or None if no suitable slot found
     """
-    time_ranges.sort(key=lambda x: x[0])
-    
-    for start, end in time_ranges:
-        if end - start >= duration:
-            return (start, start + duration)
-            
-    return None 
+    return first_available(_sorted(time_ranges), duration)
 
 def assign(available_time: List[Tuple[int, int]], task_to_assign: Tuple[int, int]) -> List[Tuple[int, int]]:
     """
@@ -110,20 +175,4 @@ def find_earliest_availables(time_ranges: List[Tuple[int, int]], duration: int)
         List of (start_time, end_time) tuples that sum to duration,
         or empty list if cannot find enough slots
     """
-    result = []
-    remaining_duration = duration
-    time_ranges.sort(key=lambda x: x[0])  # Sort by start time
-
-    for start, end in time_ranges:
-        if remaining_duration <= 0:
-            break
-            
-        slot_duration = min(end - start, remaining_duration)
-        result.append((start, start + slot_duration))
-        remaining_duration -= slot_duration
-
-    # Return empty list instead of None if we couldn't find enough slots
-    if remaining_duration > 0:
-        return []
-        
-    return result
\ No newline at end of file
+    return first_units(_sorted(time_ranges), duration)
@@ -0,0 +1,107 @@
+from typing import List
+
+class MaxSegmentTree:
+    """
+    Array-backed max segment tree over a growable list of non-negative values.
+
+    Supports appending, point updates and "leftmost index whose value is at
+    least x" queries, each in O(log n).
+    """
+    __slots__ = ("_capacity", "_count", "_tree")
+
+    def __init__(self):
+        """Initialize an empty tree."""
+        self._capacity = 1
+        self._count = 0
+        self._tree: List[int] = [-1, -1]  # Empty leaves hold -1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> int:
+        if not 0 <= index < self._count:
+            raise IndexError("MaxSegmentTree index out of range")
+        return self._tree[self._capacity + index]
+
+    def copy(self) -> "MaxSegmentTree":
+        """
+        Copy the tree.
+
+        Returns:
+            New tree with the same values
+        """
+        tree = MaxSegmentTree.__new__(MaxSegmentTree)
+        tree._capacity = self._capacity
+        tree._count = self._count
+        tree._tree = self._tree[:]
+        return tree
+
+    def append(self, value: int) -> None:
+        """
+        Add a value at the end.
+
+        Args:
+            value: Non-negative value to store
+        """
+        if self._count == self._capacity:
+            self._grow()
+        self._count += 1
+        self.update(self._count - 1, value)
+
+    def update(self, index: int, value: int) -> None:
+        """
+        Replace the value at an index.
+
+        Args:
+            index: Position to update
+            value: Non-negative value to store
+        """
+        tree = self._tree
+        node = self._capacity + index
+        tree[node] = value
+        node >>= 1
+        while node:
+            best = max(tree[2 * node], tree[2 * node + 1])
+            if tree[node] == best:
+                break
+            tree[node] = best
+            node >>= 1
+
+    def find_first(self, threshold: int, start: int = 0) -> int:
+        """
+        Find the leftmost index at or after start whose value is at least threshold.
+
+        Args:
+            threshold: Minimum value, must be non-negative
+            start: First index to consider
+
+        Returns:
+            Matching index, or -1 if none
+        """
+        if start >= self._count:
+            return -1
+
+        tree = self._tree
+        capacity = self._capacity
+        node = capacity + start
+        while tree[node] < threshold:
+            # Climb while we are a right child, then step to the right sibling
+            while node & 1:
+                node >>= 1
+            if node == 0:
+                return -1
+            node += 1
+
+        while node < capacity:
+            node *= 2
+            if tree[node] < threshold:
+                node += 1
+        return node - capacity
+
+    def _grow(self) -> None:
+        leaves = self._tree[self._capacity:self._capacity + self._count]
+        self._capacity *= 2
+        self._tree = [-1] * (2 * self._capacity)
+        self._tree[self._capacity:self._capacity + len(leaves)] = leaves
+        for node in range(self._capacity - 1, 0, -1):
+            self._tree[node] = max(self._tree[2 * node], self._tree[2 * node + 1])
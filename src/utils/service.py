@@ -0,0 +1,411 @@
+import asyncio
+import json
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+from ..algorithms.online import OnlineScheduler
+from ..core.job import Job
+from ..core.resource import Resource
+from .tracing import Tracer
+
+Assignment = Tuple[int, str, int, Tuple[int, int]]
+
+class ServiceOverloaded(RuntimeError):
+    """
+    Raised by SchedulingService.submit when the queue is full and the
+    service rejects instead of waiting.
+    """
+
+class ServiceStopped(RuntimeError):
+    """
+    Raised by SchedulingService.submit once the service is stopping, and
+    set on the jobs that were still queued when it stopped.
+    """
+
+class ServiceStats:
+    """
+    Counters and recent latency samples of a SchedulingService.
+
+    Samples are kept for the last `window` requests and batches, so the
+    percentiles describe recent load.
+    """
+    def __init__(self, window: int = 10000):
+        """
+        Initialize empty statistics.
+
+        Args:
+            window: Number of recent samples kept per series
+        """
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.batches = 0
+        self.max_queue_depth = 0
+        self.backpressure: Deque[float] = deque(maxlen=window)  # Seconds a submit waited for queue space
+        self.queue_wait: Deque[float] = deque(maxlen=window)  # Seconds from enqueue to batch start
+        self.latency: Deque[float] = deque(maxlen=window)  # Seconds from submit to result
+        self.batch_sizes: Deque[int] = deque(maxlen=window)
+        self.batch_seconds: Deque[float] = deque(maxlen=window)  # Scheduling time per batch
+
+    def as_dict(self, queue_depth: int = 0) -> Dict:
+        """
+        Summarize the statistics.
+
+        Args:
+            queue_depth: Current number of queued requests
+
+        Returns:
+            Dictionary of counters and, per series, count, mean, p50, p90, p99 and max
+        """
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "batches": self.batches,
+            "queue_depth": queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "backpressure_seconds": _summary(self.backpressure),
+            "queue_wait_seconds": _summary(self.queue_wait),
+            "latency_seconds": _summary(self.latency),
+            "batch_size": _summary(self.batch_sizes),
+            "batch_seconds": _summary(self.batch_seconds),
+        }
+
+class SchedulingService:
+    """
+    Asyncio front end that places jobs submitted concurrently by many callers.
+
+    Submissions go into a bounded queue. One worker takes them in
+    micro-batches: it waits for a first job, lingers batch_window seconds
+    for more (up to max_batch), and places the batch in submission order
+    with an OnlineScheduler. Scheduling runs on a single dedicated thread
+    that owns the Resource and Machine state, so the event loop keeps
+    accepting submissions meanwhile and no locking is needed. Each caller
+    gets its job's assignments.
+
+    When the queue is full, submit() waits for space (backpressure) or,
+    with reject_when_full, raises ServiceOverloaded. Both are visible in
+    stats(), along with queue wait, end-to-end latency and batch sizes.
+
+    Use as `async with SchedulingService(resources) as service:`, or call
+    start() and stop(). serve() adds a local HTTP endpoint.
+    """
+    def __init__(self, resources: Dict[str, Resource], algorithm: str = "no_preemption",
+                 batch_window: float = 0.002, max_batch: int = 256, max_pending: int = 10000,
+                 reject_when_full: bool = False, tracer: Optional[Tracer] = None,
+                 stats_window: int = 10000):
+        """
+        Initialize the service.
+
+        Args:
+            resources: Dictionary mapping resource type to Resource objects; owned by the service from now on
+            algorithm: "no_preemption" or "weak_preemption"
+            batch_window: Seconds to wait for more jobs after the first job of a batch; 0 takes only queued jobs
+            max_batch: Maximum jobs per batch
+            max_pending: Maximum queued jobs before submissions wait or are rejected
+            reject_when_full: Raise ServiceOverloaded instead of waiting when the queue is full
+            tracer: Optional sink for probe/assign/open-machine/fail events
+            stats_window: Number of recent samples kept for the latency statistics
+        """
+        self.scheduler = OnlineScheduler(resources, algorithm, tracer)
+        self.T = max((resource.T for resource in resources.values()), default=0)
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.max_pending = max_pending
+        self.reject_when_full = reject_when_full
+        self._stats = ServiceStats(stats_window)
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._stopping = False
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._servers: List[asyncio.AbstractServer] = []
+
+    async def __aenter__(self) -> "SchedulingService":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        """Start the batching worker on the running event loop."""
+        if self._worker is not None:
+            return
+        self._queue = asyncio.Queue(self.max_pending)
+        self._stopping = False
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scheduler")
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Close the endpoints, finish the queued jobs and stop the worker.
+
+        Submissions made from now on raise ServiceStopped; so do jobs that
+        reach the queue after the stop marker, e.g. from a submit() that was
+        waiting for queue space.
+        """
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self._servers = []
+        if self._worker is None:
+            return
+        self._stopping = True
+        await self._queue.put(None)  # Queued after every job accepted so far
+        await self._worker
+        self._fail_queued()
+        self._worker = None
+        self._executor.shutdown()
+        self._executor = None
+        self.scheduler.flush()
+
+    async def submit(self, job: Job) -> List[Assignment]:
+        """
+        Schedule a job and wait for its assignments.
+
+        Args:
+            job: Job to place
+
+        Returns:
+            The job's scheduled tasks in format (job_id, resource_type, machine_id, (start_time, end_time))
+
+        Raises:
+            ServiceOverloaded: If the queue is full and the service rejects when full
+            ServiceStopped: If the service is stopping
+        """
+        if self._worker is None:
+            raise RuntimeError("The service is not running; call start() first.")
+        if self._stopping:
+            raise ServiceStopped("The service is stopping.")
+        stats = self._stats
+        future = asyncio.get_running_loop().create_future()
+        submitted = time.perf_counter()
+        request = (job, future, submitted)
+        try:
+            self._queue.put_nowait(request)
+        except asyncio.QueueFull:
+            if self.reject_when_full:
+                stats.rejected += 1
+                raise ServiceOverloaded(f"{self._queue.qsize()} jobs are already queued.")
+            await self._queue.put(request)
+            if self._worker is None or self._worker.done():
+                self._fail_queued()  # Queued after the worker stopped
+        queued = time.perf_counter()
+        stats.submitted += 1
+        stats.backpressure.append(queued - submitted)
+        stats.max_queue_depth = max(stats.max_queue_depth, self._queue.qsize())
+        return await future
+
+    async def submit_many(self, jobs: Iterable[Job], return_exceptions: bool = False) -> List:
+        """
+        Schedule several jobs concurrently and wait for all of them.
+
+        Args:
+            jobs: Jobs to place
+            return_exceptions: Return the exception of a failing job in its
+                place instead of raising it; the other jobs are placed either way
+
+        Returns:
+            Per job, its scheduled tasks (or exception)
+        """
+        return list(await asyncio.gather(*(self.submit(job) for job in jobs), return_exceptions=return_exceptions))
+
+    async def advance(self, horizon: int) -> None:
+        """
+        Commit all time before horizon on the scheduler thread; see OnlineScheduler.advance.
+
+        Args:
+            horizon: New committed horizon
+        """
+        await asyncio.get_running_loop().run_in_executor(self._executor, self.scheduler.advance, horizon)
+
+    def stats(self) -> Dict:
+        """
+        Current counters and latency statistics.
+
+        Returns:
+            Dictionary as described in ServiceStats.as_dict
+        """
+        return self._stats.as_dict(self._queue.qsize() if self._queue is not None else 0)
+
+    async def _run(self) -> None:
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            request = await queue.get()
+            if request is None:
+                break
+            batch = [request]
+            stopping = self._drain(batch)
+            if not stopping and len(batch) < self.max_batch and self.batch_window > 0:
+                await asyncio.sleep(self.batch_window)
+                stopping = self._drain(batch)
+
+            started = time.perf_counter()
+            for _, _, submitted in batch:
+                self._stats.queue_wait.append(started - submitted)
+            results = await loop.run_in_executor(self._executor, self._schedule, [job for job, _, _ in batch])
+            finished = time.perf_counter()
+            self._record_batch(batch, results, started, finished)
+
+    def _drain(self, batch: List) -> bool:
+        # Move queued requests into the batch; True if the stop marker was reached
+        queue = self._queue
+        while len(batch) < self.max_batch and not queue.empty():
+            request = queue.get_nowait()
+            if request is None:
+                return True
+            batch.append(request)
+        return False
+
+    def _fail_queued(self) -> None:
+        # Fail the requests left behind the stop marker
+        queue = self._queue
+        while not queue.empty():
+            request = queue.get_nowait()
+            if request is not None and not request[1].done():
+                self._stats.failed += 1
+                request[1].set_exception(ServiceStopped("The service stopped before the job was scheduled."))
+
+    def _schedule(self, jobs: List[Job]) -> List:
+        # Runs on the scheduler thread; a failing job does not affect the rest of the batch
+        results = []
+        for job in jobs:
+            try:
+                results.append(self.scheduler.submit(job))
+            except Exception as error:
+                results.append(error)
+        return results
+
+    def _record_batch(self, batch: List, results: List, started: float, finished: float) -> None:
+        stats = self._stats
+        stats.batches += 1
+        stats.batch_sizes.append(len(batch))
+        stats.batch_seconds.append(finished - started)
+        for (_, future, submitted), result in zip(batch, results):
+            stats.latency.append(finished - submitted)
+            if isinstance(result, Exception):
+                stats.failed += 1
+                if not future.done():
+                    future.set_exception(result)
+            else:
+                stats.completed += 1
+                if not future.done():
+                    future.set_result(result)
+
+    def job_from_dict(self, data: Dict) -> Job:
+        """
+        Build a job from its JSON form: {"id": 1, "durations": {"A": 3}, "release_time": 0}.
+
+        Args:
+            data: Decoded JSON object; release_time is optional
+
+        Returns:
+            New job over [release_time, T)
+        """
+        durations = data["durations"]
+        unknown = [resource_type for resource_type in durations if resource_type not in self.scheduler.resources]
+        if unknown:
+            raise ValueError(f"Unknown resource types: {unknown}")
+        return Job(int(data["id"]), {key: int(value) for key, value in durations.items()}, self.T,
+                   int(data.get("release_time", 0)))
+
+    async def serve(self, host: str = "127.0.0.1", port: Optional[int] = None,
+                    path: Optional[str] = None) -> asyncio.AbstractServer:
+        """
+        Accept submissions over HTTP/1.1 on a local TCP port or Unix socket.
+
+        POST /jobs takes a job object (see job_from_dict) and answers with
+        {"assignments": ...} once it is placed, or with an error status. It
+        also takes a list of jobs, which are placed independently: the answer
+        is {"results": [...]} with, per job, {"assignments": ...} or
+        {"error": ...}. GET /stats returns stats(). Connections are kept
+        alive between requests.
+
+        Args:
+            host: Address to listen on, for TCP
+            port: TCP port (0 picks a free one)
+            path: Unix socket path, used instead of TCP when given
+
+        Returns:
+            The listening server; stop() closes it
+        """
+        await self.start()
+        if path is not None:
+            server = await asyncio.start_unix_server(self._handle, path=path)
+        else:
+            server = await asyncio.start_server(self._handle, host, port or 0)
+        self._servers.append(server)
+        return server
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                try:
+                    status, payload = await self._route(method, target, body)
+                except Exception as error:
+                    status, payload = "500 Internal Server Error", {"error": f"{type(error).__name__}: {error}"}
+                data = json.dumps(payload).encode()
+                writer.write(f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+                             f"Content-Length: {len(data)}\r\n\r\n".encode() + data)
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method: str, target: str, body: bytes) -> Tuple[str, object]:
+        if method == "GET" and target == "/stats":
+            return "200 OK", self.stats()
+        if target != "/jobs":
+            return "404 Not Found", {"error": f"No route for {method} {target}"}
+        if method != "POST":
+            return "405 Method Not Allowed", {"error": "Use POST /jobs"}
+        try:
+            data = json.loads(body)
+            jobs = [self.job_from_dict(item) for item in (data if isinstance(data, list) else [data])]
+        except (ValueError, KeyError, TypeError) as error:
+            return "400 Bad Request", {"error": f"Invalid job: {error}"}
+        if isinstance(data, list):
+            results = await self.submit_many(jobs, return_exceptions=True)
+            return "200 OK", {"results": [{"error": str(result)} if isinstance(result, Exception)
+                                          else {"assignments": result} for result in results]}
+        try:
+            return "200 OK", {"assignments": await self.submit(jobs[0])}
+        except (ServiceOverloaded, ServiceStopped) as error:
+            return "503 Service Unavailable", {"error": str(error)}
+        except Exception as error:
+            return "422 Unprocessable Entity", {"error": str(error)}
+
+def _summary(samples: Iterable[float]) -> Dict:
+    values = sorted(samples)
+    if not values:
+        return {"count": 0}
+    last = len(values) - 1
+    return {
+        "count": len(values),
+        "mean": sum(values) / len(values),
+        "p50": values[last * 50 // 100],
+        "p90": values[last * 90 // 100],
+        "p99": values[last * 99 // 100],
+        "max": values[last],
+    }
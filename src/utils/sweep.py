@@ -0,0 +1,166 @@
+import os
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from ..algorithms import ALGORITHMS, engine_options
+from ..core.instance import Instance
+from .analytics import analyze
+from .cache import ResultCache
+from .workloads import generate_instance
+
+# A sweep case is either an Instance or the keyword arguments of generate_instance
+Case = Union[Instance, Dict]
+
+def schedule_metrics(solution, resources: Dict) -> Dict:
+    """
+    Summarize a schedule without keeping it.
+
+    Args:
+        solution: Schedule as returned by an algorithm
+        resources: Dictionary mapping resource type to Resource objects after the run
+
+    Returns:
+        Dictionary with machines per resource type, total machines, makespan and number of segments
+    """
+    machines = {resource_type: len(resource.machines) for resource_type, resource in resources.items()}
+    makespan = 0
+    for _, _, _, (_, end) in solution:
+        if end > makespan:
+            makespan = end
+    return {
+        "machines": machines,
+        "total_machines": sum(machines.values()),
+        "makespan": makespan,
+        "segments": len(solution),
+    }
+
+def run_case(case: Case, algorithm: str, engine: str = "interval",
+             keep_solution: bool = False, analytics: bool = False,
+             cache: Optional[Union[ResultCache, str]] = None) -> Dict:
+    """
+    Build one instance, schedule it, and measure the run.
+
+    Args:
+        case: Instance, or keyword arguments for generate_instance
+        algorithm: Key of ALGORITHMS
+        engine: Engine passed to the algorithm
+        keep_solution: Also return the schedule as a list of tuples
+        analytics: Also return analyze() of the schedule under "analytics" (needs NumPy)
+        cache: ResultCache, or directory of one, to serve repeated runs from; the
+            result's "cached" tells whether it did
+
+    Returns:
+        Dictionary of metrics, including the runtime in seconds
+    """
+    instance = generate_instance(**case) if isinstance(case, dict) else case
+    jobs, resources = instance.build()
+    if isinstance(cache, str):
+        cache = _cache_for(cache)
+    start = time.perf_counter()
+    if cache is None:
+        solution = ALGORITHMS[algorithm](jobs, resources, **engine_options(algorithm, engine))
+    else:
+        solution, cached = cache.run_with_status(algorithm, jobs, resources, **engine_options(algorithm, engine))
+    seconds = time.perf_counter() - start
+
+    result = {"algorithm": algorithm, "engine": engine, "jobs": len(instance), "T": instance.T,
+              "seconds": seconds}
+    if cache is not None:
+        result["cached"] = cached
+    result.update(schedule_metrics(solution, resources))
+    if analytics:
+        result["analytics"] = analyze(solution, resources, jobs)
+    if keep_solution:
+        result["solution"] = list(solution)
+    return result
+
+_caches: Dict[str, ResultCache] = {}  # Per process, by directory
+
+def _cache_for(directory: str) -> ResultCache:
+    cache = _caches.get(directory)
+    if cache is None:
+        cache = _caches[directory] = ResultCache(directory)
+    return cache
+
+def _run_indexed(task: Tuple[int, Case, str, str, bool, bool, Optional[str]]) -> Dict:
+    index, case, algorithm, engine, keep_solution, analytics, cache = task
+    result = run_case(case, algorithm, engine, keep_solution, analytics, cache)
+    result["case"] = index
+    if isinstance(case, dict):
+        result["params"] = case
+    return result
+
+def sweep(cases: Iterable[Case], algorithms: Sequence[str] = ("no_preemption", "weak_preemption"),
+          engine: str = "interval", workers: Optional[int] = None,
+          chunksize: Optional[int] = None, keep_solutions: bool = False,
+          analytics: bool = False, cache_dir: Optional[str] = None) -> List[Dict]:
+    """
+    Run every algorithm on every case, spread over a pool of worker processes.
+
+    Work is sent to the workers in chunks of (case, algorithm) pairs.
+    Instances pickle as flat integer buffers, and passing generate_instance
+    arguments instead of an Instance sends only the parameters; the worker
+    generates the instance itself. Only the metrics come back unless
+    keep_solutions is set.
+
+    Args:
+        cases: Instances, or keyword arguments for generate_instance
+        algorithms: Keys of ALGORITHMS to run on each case
+        engine: Engine passed to the algorithms
+        workers: Number of worker processes (default: all CPUs); 0 or 1 runs in this process
+        chunksize: Pairs per batch sent to a worker (default: about four batches per worker)
+        keep_solutions: Also return each schedule as a list of tuples
+        analytics: Also return analyze() of each schedule; combine them with analytics.aggregate()
+        cache_dir: Directory of a ResultCache shared by the workers, so repeated cases are not rescheduled
+
+    Returns:
+        One metrics dictionary per (case, algorithm), in input order
+    """
+    for algorithm in algorithms:
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+
+    tasks = [
+        (index, case, algorithm, engine, keep_solutions, analytics, cache_dir)
+        for index, case in enumerate(cases)
+        for algorithm in algorithms
+    ]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(tasks) <= 1:
+        return [_run_indexed(task) for task in tasks]
+
+    from concurrent.futures import ProcessPoolExecutor  # Only parallel sweeps pay for multiprocessing
+
+    workers = min(workers, len(tasks))
+    if chunksize is None:
+        chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_run_indexed, tasks, chunksize=chunksize))
+
+def summarize(results: Iterable[Dict]) -> Dict[str, Dict]:
+    """
+    Aggregate sweep results per algorithm.
+
+    Args:
+        results: Dictionaries returned by sweep() or run_case()
+
+    Returns:
+        Dictionary mapping algorithm name to the number of runs, total and
+        mean runtime, mean machines and mean makespan
+    """
+    summary = {}
+    for result in results:
+        entry = summary.setdefault(result["algorithm"], {
+            "runs": 0, "seconds": 0.0, "total_machines": 0, "makespan": 0,
+        })
+        entry["runs"] += 1
+        entry["seconds"] += result["seconds"]
+        entry["total_machines"] += result["total_machines"]
+        entry["makespan"] += result["makespan"]
+
+    for entry in summary.values():
+        runs = entry["runs"]
+        entry["mean_seconds"] = entry["seconds"] / runs
+        entry["mean_machines"] = entry.pop("total_machines") / runs
+        entry["mean_makespan"] = entry.pop("makespan") / runs
+    return summary
@@ -0,0 +1,134 @@
+import json
+import sys
+from collections import deque
+from typing import IO, List, NamedTuple, Optional, Tuple
+
+PROBE = "probe"
+ASSIGN = "assign"
+OPEN_MACHINE = "open_machine"
+FAIL = "fail"
+
+class TraceEvent(NamedTuple):
+    """
+    A single scheduling event.
+
+    kind is one of PROBE (an existing machine was tried; time_range is the
+    slot found, or the first of the slots found under weak preemption, or
+    None), ASSIGN (time_range was assigned), OPEN_MACHINE
+    (a new machine was added) or FAIL (the task could not be placed even
+    on a new machine).
+    """
+    kind: str
+    job_id: int
+    resource_type: str
+    machine_id: Optional[int]
+    time_range: Optional[Tuple[int, int]]
+
+class Tracer:
+    """
+    Event sink for the scheduling algorithms. The base class discards events.
+
+    Algorithms check `enabled` before building an event, so a disabled tracer
+    costs one attribute test per call site and nothing else.
+    """
+    enabled = False
+
+    def emit(self, event: TraceEvent) -> None:
+        """
+        Record one event.
+
+        Args:
+            event: Event to record
+        """
+
+    def flush(self) -> None:
+        """Write out any buffered events."""
+
+    def close(self) -> None:
+        """Flush and release any underlying resources."""
+        self.flush()
+
+    def __enter__(self) -> "Tracer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+NULL_TRACER = Tracer()
+
+class RingBufferTracer(Tracer):
+    """
+    Keeps the most recent events in memory.
+    """
+    enabled = True
+
+    def __init__(self, capacity: int = 100_000):
+        """
+        Initialize the buffer.
+
+        Args:
+            capacity: Number of most recent events to keep
+        """
+        self.events: deque = deque(maxlen=capacity)
+        self.emit = self.events.append
+
+class FileTracer(Tracer):
+    """
+    Writes events as JSON Lines, in batches.
+    """
+    enabled = True
+
+    def __init__(self, path: str, batch_size: int = 4096):
+        """
+        Initialize the tracer and open its output file.
+
+        Args:
+            path: File to write events to
+            batch_size: Number of events buffered between writes
+        """
+        self._file: IO[str] = open(path, "w")
+        self._batch_size = batch_size
+        self._buffer: List[TraceEvent] = []
+
+    def emit(self, event: TraceEvent) -> None:
+        self._buffer.append(event)
+        if len(self._buffer) >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            self._file.write("".join(json.dumps(event._asdict()) + "\n" for event in self._buffer))
+            self._buffer.clear()
+        self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+class PrintTracer(Tracer):
+    """
+    Writes a human-readable line per event, for debugging small instances.
+    """
+    enabled = True
+
+    def __init__(self, stream: IO[str] = None):
+        """
+        Initialize the tracer.
+
+        Args:
+            stream: Output stream, defaults to stdout
+        """
+        self._stream = stream
+
+    def emit(self, event: TraceEvent) -> None:
+        kind, job_id, resource_type, machine_id, time_range = event
+        if kind == PROBE:
+            line = f"Job {job_id} {resource_type}: tried machine {machine_id}, found {time_range}"
+        elif kind == ASSIGN:
+            line = f"Job {job_id} {resource_type}: assigned to machine {machine_id} at time {time_range}"
+        elif kind == OPEN_MACHINE:
+            line = f"Job {job_id} {resource_type}: added new machine {machine_id}"
+        else:
+            line = f"Job {job_id} {resource_type}: WARNING could not place task on machine {machine_id}"
+        print(line, file=self._stream or sys.stdout)
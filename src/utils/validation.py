@@ -0,0 +1,228 @@
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+from ..core.instance import Instance
+from ..core.job import Job
+from ..core.job_table import JobTable
+from ..core.resource import Resource
+from ..core.solution import Solution
+from ._numpy import load_numpy
+
+np = None  # Loaded on the first validation
+
+# Violation kinds
+BOUNDS = "bounds"  # Empty range, or outside [release_time, T)
+MACHINE_OVERLAP = "machine_overlap"
+JOB_OVERLAP = "job_overlap"
+DURATION = "duration"  # Assigned time differs from the task duration
+UNKNOWN_JOB = "unknown_job"
+
+class Violation(NamedTuple):
+    """
+    One infeasibility in a schedule.
+
+    tasks are indexes into the solution: the offending task, for overlaps
+    preceded by the earlier task it overlaps, and for durations every piece
+    of the job's task on the resource type (empty if none was scheduled).
+    """
+    kind: str
+    tasks: Tuple[int, ...]
+    job_id: int
+    resource_type: Optional[str]
+    machine_id: Optional[int]
+    message: str
+
+class ScheduleError(ValueError):
+    """
+    Raised by check_schedule for an infeasible schedule.
+    """
+    def __init__(self, violations: List[Violation]):
+        self.violations = violations
+        shown = "; ".join(violation.message for violation in violations[:5])
+        more = f" (and {len(violations) - 5} more)" if len(violations) > 5 else ""
+        super().__init__(f"{len(violations)} schedule violations: {shown}{more}")
+
+def validate_schedule(solution: Union[Solution, Iterable[Tuple[int, str, int, Tuple[int, int]]]],
+                      jobs: Union[List[Job], JobTable, Instance],
+                      resources: Optional[Dict[str, Resource]] = None,
+                      complete: bool = True,
+                      max_violations: Optional[int] = None) -> List[Violation]:
+    """
+    Check that a schedule is feasible.
+
+    Checks that every range is non-empty and within [release_time, T) of
+    its job and resource type, that no two ranges on a machine overlap, that
+    no two ranges of a job overlap (across all resource types), and that the
+    time assigned to each (job, resource type) equals its task duration.
+
+    Each check sorts the solution columns with NumPy and sweeps them with
+    cumulative maxima, so the cost is O(n log n) without a Python loop per
+    task; only violations are turned into Python objects.
+
+    Args:
+        solution: Schedule to check, a Solution or a list of task tuples
+        jobs: The scheduled jobs, as a list, JobTable or Instance
+        resources: Resources the schedule ran on, for per-type horizons;
+            required when jobs is a list
+        complete: Require every task to be scheduled; when False, tasks
+            missing from the solution are accepted (the greedy algorithms
+            skip tasks they cannot place)
+        max_violations: Stop reporting after this many violations per check
+
+    Returns:
+        List of violations, empty for a feasible schedule
+    """
+    global np
+    np = load_numpy("validate_schedule")
+    if not isinstance(solution, Solution):
+        tasks = solution
+        solution = Solution()
+        solution.extend(tasks)
+    table = _as_table(jobs, resources)
+    names = solution.resource_types
+    columns = solution.to_numpy()
+    job_ids = columns["job_ids"]
+    resource_index = columns["resources"]
+    machine_ids = columns["machine_ids"]
+    starts = columns["starts"]
+    ends = columns["ends"]
+    violations: List[Violation] = []
+
+    def report(kind: str, task_lists: List[Tuple[int, ...]], message) -> None:
+        if max_violations is not None:
+            task_lists = task_lists[:max_violations]
+        for tasks in task_lists:
+            i = tasks[-1] if tasks else None
+            job_id, resource_type, machine_id = (
+                (int(job_ids[i]), names[resource_index[i]], int(machine_ids[i])) if i is not None else (None, None, None)
+            )
+            violation = Violation(kind, tuple(int(t) for t in tasks), job_id, resource_type, machine_id, "")
+            violations.append(violation._replace(message=message(violation)))
+
+    def v_range(i: int) -> Tuple[int, int]:
+        return int(starts[i]), int(ends[i])
+
+    # Map solution rows to table rows and columns
+    table_ids = np.frombuffer(table.job_ids, dtype=np.int64) if len(table) else np.zeros(0, dtype=np.int64)
+    id_order = np.argsort(table_ids, kind="stable")
+    sorted_ids = table_ids[id_order]
+    position = np.searchsorted(sorted_ids, job_ids)
+    found = position < len(sorted_ids)
+    found[found] = sorted_ids[position[found]] == job_ids[found]
+    row = np.where(found, id_order[np.minimum(position, len(sorted_ids) - 1)] if len(sorted_ids) else 0, -1)
+    column_of = np.array([table.resource_types.index(name) if name in table.resource_types else -1
+                          for name in names] or [0], dtype=np.int64)
+    column = column_of[resource_index] if len(resource_index) else np.zeros(0, dtype=np.int64)
+    known = found & (column >= 0)
+    unknown = np.nonzero(~known)[0]
+    report(UNKNOWN_JOB, [(i,) for i in unknown.tolist()],
+           lambda v: f"Task {v.tasks[0]} of job {v.job_id} on {v.resource_type} is not in the jobs")
+
+    # Bounds
+    horizon = np.array([resources[name].T if resources is not None and name in resources else table.T
+                        for name in names] or [0], dtype=np.int64)
+    release = np.frombuffer(table.release_times, dtype=np.int64) if len(table) else np.zeros(1, dtype=np.int64)
+    earliest = np.where(known, release[np.maximum(row, 0)] if len(release) else 0, 0)
+    latest = horizon[resource_index] if len(resource_index) else np.zeros(0, dtype=np.int64)
+    outside = np.nonzero((starts >= ends) | (starts < earliest) | (ends > latest))[0]
+    report(BOUNDS, [(i,) for i in outside.tolist()],
+           lambda v: f"Task {v.tasks[0]} of job {v.job_id} on {v.resource_type} runs {v_range(v.tasks[0])}, "
+                     f"outside its release time and horizon")
+
+    # Overlaps: within each group, sorted by start, a range overlaps an
+    # earlier one exactly when it starts before the latest earlier end
+    report(MACHINE_OVERLAP, _overlaps(starts, ends, (machine_ids, resource_index)),
+           lambda v: f"Tasks {v.tasks[0]} and {v.tasks[1]} overlap on {v.resource_type} machine {v.machine_id}: "
+                     f"{v_range(v.tasks[0])} and {v_range(v.tasks[1])}")
+    report(JOB_OVERLAP, _overlaps(starts, ends, (job_ids,)),
+           lambda v: f"Tasks {v.tasks[0]} and {v.tasks[1]} of job {v.job_id} overlap: "
+                     f"{v_range(v.tasks[0])} and {v_range(v.tasks[1])}")
+
+    # Durations: assigned time per (job, resource type) against the table
+    width = table.width
+    required = np.frombuffer(table.durations, dtype=np.int64) if len(table) and width else np.zeros(0, dtype=np.int64)
+    cells = np.nonzero(known)[0]
+    flat = row[cells] * width + column[cells]
+    assigned = np.zeros(len(required), dtype=np.int64)
+    np.add.at(assigned, flat, (ends - starts)[cells])
+    wrong = assigned != np.where(required > 0, required, 0)
+    if not complete:
+        wrong &= assigned > 0
+    bad_cells = np.nonzero(wrong)[0]
+    if len(bad_cells):
+        if max_violations is not None:
+            bad_cells = bad_cells[:max_violations]
+        order = np.argsort(flat, kind="stable")
+        flat_sorted = flat[order]
+        lo = np.searchsorted(flat_sorted, bad_cells, side="left")
+        hi = np.searchsorted(flat_sorted, bad_cells, side="right")
+        resource_types = table.resource_types
+        for cell, a, b in zip(bad_cells.tolist(), lo.tolist(), hi.tolist()):
+            tasks = tuple(int(t) for t in cells[order[a:b]])
+            job_id = table.job_ids[cell // width]
+            resource_type = resource_types[cell % width]
+            machine_id = int(machine_ids[tasks[-1]]) if tasks else None
+            violations.append(Violation(
+                DURATION, tasks, job_id, resource_type, machine_id,
+                f"Job {job_id} has {int(assigned[cell])} of {max(int(required[cell]), 0)} units on {resource_type}",
+            ))
+    return violations
+
+def check_schedule(solution: Union[Solution, Iterable[Tuple[int, str, int, Tuple[int, int]]]],
+                   jobs: Union[List[Job], JobTable, Instance],
+                   resources: Optional[Dict[str, Resource]] = None,
+                   complete: bool = True) -> None:
+    """
+    Raise ScheduleError if a schedule is infeasible; see validate_schedule.
+
+    Args:
+        solution: Schedule to check
+        jobs: The scheduled jobs, as a list, JobTable or Instance
+        resources: Resources the schedule ran on
+        complete: Require every task to be scheduled
+    """
+    violations = validate_schedule(solution, jobs, resources, complete, max_violations=100)
+    if violations:
+        raise ScheduleError(violations)
+
+def _as_table(jobs: Union[List[Job], JobTable, Instance], resources: Optional[Dict[str, Resource]]) -> JobTable:
+    if isinstance(jobs, JobTable):
+        return jobs
+    if isinstance(jobs, Instance):
+        return jobs.build_table()
+    if resources is None:
+        raise ValueError("resources are required to validate a list of jobs.")
+    resource_types = list(resources)
+    for job in jobs:
+        for resource_type in job.task_durations:
+            if resource_type not in resources and resource_type not in resource_types:
+                resource_types.append(resource_type)
+    T = max((resource.T for resource in resources.values()), default=0)
+    return JobTable.from_jobs(jobs, T, resource_types)
+
+def _overlaps(starts: "np.ndarray", ends: "np.ndarray", keys: Tuple["np.ndarray", ...]) -> List[Tuple[int, int]]:
+    # Pairs (earlier task, task) where task starts before an earlier task of
+    # its group has ended, the earlier task being the one ending last
+    n = len(starts)
+    if n < 2:
+        return []
+    order = np.lexsort((starts,) + keys)
+    group_start = np.zeros(n, dtype=bool)
+    group_start[0] = True
+    for key in keys:
+        sorted_key = key[order]
+        group_start[1:] |= sorted_key[1:] != sorted_key[:-1]
+    group = np.cumsum(group_start) - 1
+
+    # Offset every group above the previous one so a single running maximum
+    # never carries an end across groups
+    base = min(int(starts.min()), int(ends.min()))
+    span = max(int(starts.max()), int(ends.max())) - base + 1
+    offset = group * span - base
+    s = starts[order] + offset
+    e = ends[order] + offset
+    running = np.maximum.accumulate(e)
+    holder = np.maximum.accumulate(np.where(e == running, np.arange(n), 0))
+    earlier_end = np.empty(n, dtype=np.int64)
+    earlier_end[0] = np.iinfo(np.int64).min
+    earlier_end[1:] = running[:-1]
+    clash = np.nonzero(~group_start & (s < earlier_end))[0]
+    return list(zip(order[holder[clash - 1]].tolist(), order[clash].tolist()))
@@ -1,9 +1,14 @@
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from typing import List, Tuple
+# matplotlib and NumPy are imported when plotting, so importing this module
+# (and the examples that use it) stays fast for runs that never plot
+from typing import Dict, Iterable, List, Optional, Tuple
 import colorsys
 from random import shuffle
 
+MAX_COLORS = 256  # Jobs beyond this share colors
+MAX_FIG_HEIGHT = 60  # Inches
+MAX_TICK_LABELS = 100  # Machine rows labelled on the y axis
+AGGREGATE_COLOR = '#9e9e9e'  # Color of merged sub-pixel tasks
+
 def generate_distinct_colors(n: int) -> List[str]:
     """
     Generate n visually distinct and pleasant colors using a soothing pastel palette.
@@ -62,78 +67,184 @@ def generate_distinct_colors(n: int) -> List[str]:
     
     return all_colors
 
-def plot_schedule(solution: List[Tuple[int, str, int, Tuple[int, int]]], T: int) -> None:
+def _columns(solution) -> Tuple[List[int], List[str], List[int], List[int], List[int]]:
+    """Job ids, resource types, machine ids, starts and ends of a solution, as columns."""
+    if hasattr(solution, 'resource_types') and hasattr(solution, 'starts'):
+        names = solution.resource_types
+        return (solution.job_ids, [names[index] for index in solution.resources],
+                solution.machine_ids, solution.starts, solution.ends)
+
+    job_ids, resource_types, machine_ids, starts, ends = [], [], [], [], []
+    for job_id, resource_type, machine_id, (start, end) in solution:
+        job_ids.append(job_id)
+        resource_types.append(resource_type)
+        machine_ids.append(machine_id)
+        starts.append(start)
+        ends.append(end)
+    return job_ids, resource_types, machine_ids, starts, ends
+
+def _downsample(bars: List[Tuple[int, int, int]], resolution: float) -> Tuple[List[Tuple[int, int, int]],
+                                                                          List[Tuple[float, float]]]:
+    """
+    Merge runs of tasks narrower than one pixel into aggregate spans.
+
+    Args:
+        bars: (start, end, job_id) of one row, sorted by start
+        resolution: Time units per pixel
+
+    Returns:
+        Tuple of (bars drawn individually, merged (start, end) spans)
+    """
+    kept, merged = [], []
+    span_start = span_end = None
+    for start, end, job_id in bars:
+        if end - start >= resolution:
+            kept.append((start, end, job_id))
+            continue
+        if span_end is not None and start - span_end <= resolution:
+            span_end = max(span_end, end)
+        else:
+            if span_end is not None:
+                merged.append((span_start, span_end))
+            span_start, span_end = start, end
+    if span_end is not None:
+        merged.append((span_start, span_end))
+    return kept, merged
+
+def _rectangles(rows: List[int], starts: List[float], ends: List[float]) -> "np.ndarray":
+    """Corner coordinates of bars of height 0.8, as an (n, 4, 2) array."""
+    import numpy as np
+
+    y = np.asarray(rows, dtype=float)
+    x0 = np.asarray(starts, dtype=float)
+    x1 = np.asarray(ends, dtype=float)
+    return np.stack([
+        np.column_stack([x0, y]),
+        np.column_stack([x0, y + 0.8]),
+        np.column_stack([x1, y + 0.8]),
+        np.column_stack([x1, y]),
+    ], axis=1).reshape(-1, 4, 2)
+
+def plot_schedule(solution: Iterable[Tuple[int, str, int, Tuple[int, int]]], T: int,
+                  output: Optional[str] = None, show: Optional[bool] = None,
+                  downsample: Optional[bool] = None, max_labels: int = 500,
+                  width: float = 12, dpi: int = 100) -> "Figure":
     """
     Visualize the scheduling solution.
-    
+
+    All task bars are drawn as one polygon collection. Job labels are only
+    drawn on bars wide enough to hold them, at most max_labels of them. With
+    downsampling, runs of tasks narrower than a pixel are merged into gray
+    spans. Without show, the figure is rendered without pyplot or an
+    interactive backend, so this works in headless batch jobs.
+
     Args:
-        solution: List of scheduled tasks (job_id, resource_type, machine_id, (start_time, end_time))
+        solution: Solution or list of scheduled tasks (job_id, resource_type, machine_id, (start_time, end_time))
         T: Global time limit
+        output: Optional image file to write (format from the extension, e.g. .png or .svg)
+        show: Whether to open an interactive window; defaults to True without output
+        downsample: Whether to merge sub-pixel tasks; defaults to True above 10,000 tasks
+        max_labels: Largest number of job labels to draw
+        width: Figure width in inches
+        dpi: Resolution used for rendering and for deciding what fits in a pixel
+
+    Returns:
+        The rendered figure
     """
+    import numpy as np
+    from matplotlib.collections import PolyCollection
+    from matplotlib.colors import to_rgba_array
+
+    job_ids, resource_types, machine_ids, starts, ends = _columns(solution)
+    if show is None:
+        show = output is None
+    if downsample is None:
+        downsample = len(job_ids) > 10_000
+
     # Get number of unique jobs for color generation
-    unique_jobs = len(set(job_id for job_id, _, _, _ in solution))
-    colors = generate_distinct_colors(unique_jobs)
-    
+    unique_jobs = len(set(job_ids))
+    colors = generate_distinct_colors(max(1, min(unique_jobs, MAX_COLORS)))
+
     # Group tasks by resource type first, then by machine
-    resource_machines = {}
-    for job_id, resource_type, machine_id, time_range in solution:
-        if resource_type not in resource_machines:
-            resource_machines[resource_type] = set()
-        resource_machines[resource_type].add(machine_id)
-    
-    # Calculate total height needed
-    total_machines = sum(len(machines) for machines in resource_machines.values())
-    
+    rows: Dict[Tuple[str, int], List[Tuple[int, int, int]]] = {}
+    for job_id, resource_type, machine_id, start, end in zip(job_ids, resource_types, machine_ids, starts, ends):
+        rows.setdefault((resource_type, machine_id), []).append((start, end, job_id))
+
     # Create figure with appropriate height
-    fig_height = max(6, total_machines * 0.8)  # At least 6 inches, or more for many machines
-    fig, ax = plt.subplots(figsize=(12, fig_height))
-    
-    # Create y-positions for each resource-machine combination
-    y_positions = {}
-    current_y = 0
-    for resource_type in sorted(resource_machines.keys()):
-        for machine_id in sorted(resource_machines[resource_type]):
-            y_positions[(resource_type, machine_id)] = current_y
-            current_y += 1
-            
-    # Plot tasks
-    for job_id, resource_type, machine_id, (start, end) in solution:
-        y = y_positions[(resource_type, machine_id)]
-        color = colors[job_id - 1]  # -1 because job_ids start from 1
-        
-        # Create rectangle for the task
-        rect = patches.Rectangle(
-            (start, y), 
-            end - start, 
-            0.8, 
-            facecolor=color,
-            edgecolor='black'
-        )
-        ax.add_patch(rect)
-        
-        # Add job label
-        ax.text(
-            (start + end) / 2, 
-            y + 0.4, 
-            f'J{job_id}',
-            ha='center',
-            va='center'
-        )
-    
+    fig_height = min(MAX_FIG_HEIGHT, max(6, len(rows) * 0.8))  # At least 6 inches, or more for many machines
+    if show:
+        import matplotlib.pyplot as plt
+
+        fig = plt.figure(figsize=(width, fig_height), dpi=dpi)
+    else:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=(width, fig_height), dpi=dpi)
+        FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+
+    # Time units per pixel and per label character, for culling what cannot be seen
+    resolution = (T + 0.4) / (width * dpi * 0.85)
+    char_width = 7 * resolution
+
+    bar_rows, bar_starts, bar_ends, bar_colors = [], [], [], []
+    span_rows, span_starts, span_ends = [], [], []
+    labels = []
+    for y, key in enumerate(sorted(rows)):
+        bars = sorted(rows[key])
+        if downsample:
+            bars, merged = _downsample(bars, resolution)
+            for start, end in merged:
+                span_rows.append(y)
+                span_starts.append(start)
+                span_ends.append(end)
+        for start, end, job_id in bars:
+            bar_rows.append(y)
+            bar_starts.append(start)
+            bar_ends.append(end)
+            bar_colors.append((job_id - 1) % len(colors))
+            label = f'J{job_id}'
+            if end - start >= (len(label) + 1) * char_width:
+                labels.append((end - start, (start + end) / 2, y + 0.4, label))
+
+    # Plot tasks, all rows as one collection
+    palette = to_rgba_array(colors)
+    ax.add_collection(PolyCollection(_rectangles(bar_rows, bar_starts, bar_ends),
+                                     facecolors=palette[np.asarray(bar_colors, dtype=int)],
+                                     edgecolors='black', linewidths=0.5 if len(bar_rows) > 1000 else 1),
+                      autolim=False)
+    if span_rows:
+        ax.add_collection(PolyCollection(_rectangles(span_rows, span_starts, span_ends),
+                                         facecolors=AGGREGATE_COLOR, edgecolors='none'),
+                          autolim=False)
+
+    # Add job labels, widest bars first
+    if len(labels) > max_labels:
+        labels.sort(reverse=True)
+        del labels[max_labels:]
+    for _, x, y, label in labels:
+        ax.text(x, y, label, ha='center', va='center', fontsize=8 if len(rows) > 20 else 10)
+
     # Set labels and limits with padding
-    ax.set_ylim(-0.5, current_y - 0.5 + 0.3)  # Add padding at the top
+    ax.set_ylim(-0.5, len(rows) - 0.5 + 0.3)  # Add padding at the top
     ax.set_xlim(-0.2, T + 0.2)  # Add small padding on sides
-    ax.set_yticks(range(current_y))
-    
+
     # Create labels that clearly show resource type and machine number
-    y_labels = [f'{resource_type}{machine_id}' 
-                for resource_type, machine_id in sorted(y_positions.keys())]
-    ax.set_yticklabels(y_labels)
-    
+    stride = max(1, -(-len(rows) // MAX_TICK_LABELS))
+    ticks = range(0, len(rows), stride)
+    row_keys = sorted(rows)
+    ax.set_yticks(list(ticks))
+    ax.set_yticklabels([f'{row_keys[y][0]}{row_keys[y][1]}' for y in ticks])
+
     ax.set_xlabel('Time')
     ax.set_ylabel('Resource-Machine')
     ax.set_title('Schedule Visualization')
-    
-    plt.grid(True)
-    plt.tight_layout()
-    plt.show() 
\ No newline at end of file
+
+    ax.grid(True)
+    fig.tight_layout()
+    if output:
+        fig.savefig(output, dpi=dpi)
+    if show:
+        plt.show()
+    return fig
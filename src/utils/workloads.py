@@ -0,0 +1,83 @@
+import math
+import random
+from typing import List, Optional, Sequence
+from ..core.instance import Instance
+
+DISTRIBUTIONS = ("uniform", "exponential", "lognormal", "pareto", "bimodal")
+
+def resource_names(count: int) -> List[str]:
+    """
+    Generate resource type names: A, B, ..., Z, then R26, R27, ...
+
+    Args:
+        count: Number of names needed
+
+    Returns:
+        List of resource type names
+    """
+    return [chr(ord('A') + i) if i < 26 else f"R{i}" for i in range(count)]
+
+def sample_duration(rng: random.Random, distribution: str, max_duration: int) -> int:
+    """
+    Draw one task duration in [1, max_duration].
+
+    Args:
+        rng: Random number generator
+        distribution: One of DISTRIBUTIONS
+        max_duration: Largest duration to return
+
+    Returns:
+        Task duration
+    """
+    if distribution == "uniform":
+        value = rng.uniform(1, max_duration)
+    elif distribution == "exponential":
+        value = rng.expovariate(8 / max_duration)
+    elif distribution == "lognormal":
+        value = rng.lognormvariate(math.log(max_duration / 10), 1.0)
+    elif distribution == "pareto":
+        value = rng.paretovariate(1.5) * max_duration / 20
+    elif distribution == "bimodal":
+        # Mostly short tasks, with a tail of tasks close to the maximum
+        if rng.random() < 0.8:
+            value = rng.uniform(1, max_duration / 10)
+        else:
+            value = rng.uniform(max_duration / 2, max_duration)
+    else:
+        raise ValueError(f"Unknown distribution: {distribution}")
+    return min(max_duration, max(1, int(value)))
+
+def generate_instance(num_jobs: int, num_resource_types: int = 2, T: int = 100,
+                      distribution: str = "uniform", seed: Optional[int] = 0,
+                      max_fraction: float = 0.5, task_probability: float = 1.0,
+                      resource_types: Optional[Sequence[str]] = None) -> Instance:
+    """
+    Generate a random instance. The same arguments always give the same instance.
+
+    Args:
+        num_jobs: Number of jobs
+        num_resource_types: Number of resource types, ignored if resource_types is given
+        T: Global time limit
+        distribution: Task duration distribution, one of DISTRIBUTIONS
+        seed: Random seed
+        max_fraction: Longest task as a fraction of T
+        task_probability: Probability that a job needs each resource type at all
+        resource_types: Explicit resource type names
+
+    Returns:
+        Generated instance with job ids 1..num_jobs
+    """
+    rng = random.Random(seed)
+    if resource_types is None:
+        resource_types = resource_names(num_resource_types)
+    max_duration = max(1, int(T * max_fraction))
+
+    durations = []
+    for _ in range(num_jobs):
+        row = tuple(
+            sample_duration(rng, distribution, max_duration) if rng.random() < task_probability else 0
+            for _ in resource_types
+        )
+        durations.append(row)
+
+    return Instance(T, resource_types, range(1, num_jobs + 1), durations)
@@ -0,0 +1,132 @@
+# The greedy algorithms as they were before any optimization (baseline
+# commit d710dfd), with the debug output removed. Free time is a plain list
+# of (start, end) ranges. The optimized algorithms must reproduce these
+# schedules exactly, including their quirks: intersections report
+# zero-length ranges where two ranges touch, and weak preemption keeps the
+# slots it assigned before a machine raised ValueError.
+from typing import Dict, List, Sequence, Tuple
+
+Range = Tuple[int, int]
+
+def intersection_of_time_ranges(arr1: List[Range], arr2: List[Range]) -> List[Range]:
+    result = []
+    arr1.sort(key=lambda x: x[0])
+    arr2.sort(key=lambda x: x[0])
+    i, j = 0, 0
+    while i < len(arr1) and j < len(arr2):
+        start1, end1 = arr1[i]
+        start2, end2 = arr2[j]
+        if end1 < start2:
+            i += 1
+        elif end2 < start1:
+            j += 1
+        else:
+            intersection_start = max(start1, start2)
+            intersection_end = min(end1, end2)
+            if result and result[-1][1] >= intersection_start:
+                result[-1] = (result[-1][0], max(result[-1][1], intersection_end))
+            else:
+                result.append((intersection_start, intersection_end))
+            if end1 < end2:
+                i += 1
+            else:
+                j += 1
+    return result
+
+def find_earliest_available(time_ranges: List[Range], duration: int):
+    time_ranges.sort(key=lambda x: x[0])
+    for start, end in time_ranges:
+        if end - start >= duration:
+            return (start, start + duration)
+    return None
+
+def find_earliest_availables(time_ranges: List[Range], duration: int) -> List[Range]:
+    result = []
+    remaining_duration = duration
+    time_ranges.sort(key=lambda x: x[0])
+    for start, end in time_ranges:
+        if remaining_duration <= 0:
+            break
+        slot_duration = min(end - start, remaining_duration)
+        result.append((start, start + slot_duration))
+        remaining_duration -= slot_duration
+    if remaining_duration > 0:
+        return []
+    return result
+
+def assign(available_time: List[Range], task_to_assign: Range) -> List[Range]:
+    task_start, task_end = task_to_assign
+    if not any(start <= task_start < task_end <= end for start, end in available_time):
+        raise ValueError("Task cannot be assigned within the available time ranges.")
+    updated_available_time = []
+    for start, end in available_time:
+        if end <= task_start or start >= task_end:
+            updated_available_time.append((start, end))
+        else:
+            if start < task_start:
+                updated_available_time.append((start, task_start))
+            if end > task_end:
+                updated_available_time.append((task_end, end))
+    return updated_available_time
+
+def schedule(algorithm: str, jobs: Sequence[Tuple[int, Dict[str, int]]], T: int, resource_types: Sequence[str]):
+    """
+    Run a baseline greedy algorithm.
+
+    Args:
+        algorithm: "no_preemption" or "weak_preemption"
+        jobs: (job_id, task_durations) pairs, all free over [0, T)
+        T: Global time limit
+        resource_types: Resource types, each starting without machines
+
+    Returns:
+        The solution as (job_id, resource_type, machine_id, (start, end))
+        tuples, the free time of every machine per resource type, and the
+        free time of every job
+    """
+    machines: Dict[str, List[List[Range]]] = {resource_type: [] for resource_type in resource_types}
+    job_free = {}
+    solution = []
+    for job_id, task_durations in jobs:
+        free = job_free[job_id] = [(0, T)]
+        for resource_type, duration in task_durations.items():
+            if duration <= 0:
+                continue
+            assigned = False
+            for index, machine in enumerate(machines[resource_type]):
+                try:
+                    slots = intersection_of_time_ranges(machine, free)
+                    if algorithm == "no_preemption":
+                        first = find_earliest_available(slots, duration)
+                        if first is not None:
+                            machine[:] = assign(machine, first)
+                            free = job_free[job_id] = assign(free, first)
+                            solution.append((job_id, resource_type, index + 1, first))
+                            assigned = True
+                            break
+                    elif sum(end - start for start, end in slots) >= duration:
+                        time_slots = find_earliest_availables(slots, duration)
+                        if time_slots:
+                            for time_range in time_slots:
+                                machine[:] = assign(machine, time_range)
+                                free = job_free[job_id] = assign(free, time_range)
+                                solution.append((job_id, resource_type, index + 1, time_range))
+                            assigned = True
+                            break
+                except ValueError:
+                    continue
+
+            if not assigned:
+                machine = [(0, T)]
+                machines[resource_type].append(machine)
+                slots = intersection_of_time_ranges(machine, free)
+                if algorithm == "no_preemption":
+                    first = find_earliest_available(slots, duration)
+                    time_slots = [first] if first is not None else []
+                else:
+                    time_slots = find_earliest_availables(slots, duration)
+                for time_range in time_slots:
+                    solution.append((job_id, resource_type, len(machines[resource_type]), time_range))
+                    machine[:] = assign(machine, time_range)
+                    free = job_free[job_id] = assign(free, time_range)
+    return solution, machines, [job_free[job_id] for job_id, _ in jobs]
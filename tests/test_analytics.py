@@ -0,0 +1,78 @@
+import pytest
+
+from src.core.job import Job
+from src.core.resource import Resource
+from src.utils.analytics import aggregate, analyze
+
+pytest.importorskip("numpy")
+
+SOLUTION = [
+    (1, "A", 1, (0, 3)),
+    (2, "A", 1, (5, 9)),
+    (1, "B", 1, (3, 5)),
+    (3, "A", 2, (2, 4)),
+    (3, "B", 1, (6, 8)),
+]
+
+def resources():
+    result = {"A": Resource("A", 10), "B": Resource("B", 10)}
+    result["A"].cost = 2
+    for resource_type, machines in (("A", 2), ("B", 1)):
+        for _ in range(machines):
+            result[resource_type].add_machine()
+    return result
+
+def jobs():
+    return [Job(1, {"A": 3, "B": 2}, 10), Job(2, {"A": 4}, 10, release_time=5), Job(3, {"A": 2, "B": 2}, 10)]
+
+def test_utilization_cost_and_makespan():
+    report = analyze(SOLUTION, resources(), jobs(), per_machine=True)
+
+    assert (report["tasks"], report["machines"], report["cost"]) == (5, 3, 5)
+    assert (report["makespan"], report["busy"]) == (9, 13)
+    assert report["utilization"] == pytest.approx(13 / 30)
+    a, b = report["resources"]["A"], report["resources"]["B"]
+    assert (a["machines"], a["cost"], a["busy"], a["makespan"]) == (2, 4, 9, 9)
+    assert (b["machines"], b["cost"], b["busy"], b["makespan"]) == (1, 1, 4, 8)
+    assert (a["utilization"], b["utilization"]) == pytest.approx((0.45, 0.4))
+    assert [(m["resource_type"], m["machine_id"], m["busy"]) for m in report["per_machine"]] == [
+        ("A", 1, 7), ("A", 2, 2), ("B", 1, 4)]
+    assert report["machine_utilization"]["max"] == pytest.approx(0.7)
+
+def test_idle_gaps_are_between_tasks_on_a_machine():
+    report = analyze(SOLUTION, resources(), jobs())
+
+    # A1 idles from 3 to 5 and B1 from 5 to 6; A2 has a single task
+    assert {key: report["idle_gaps"][key] for key in ("count", "min", "max", "mean")} == {
+        "count": 2, "min": 1, "max": 2, "mean": 1.5}
+    assert report["resources"]["A"]["idle_gaps"]["count"] == 1
+    assert report["resources"]["B"]["idle_gaps"]["max"] == 1
+
+def test_completion_and_stretch_use_release_times():
+    report = analyze(SOLUTION, resources(), jobs(), per_job=True)
+
+    assert report["jobs"] == 3
+    assert report["per_job"] == {
+        1: {"completion": 5, "stretch": 1.0},  # 5 units of work done by 5
+        2: {"completion": 9, "stretch": 1.0},  # Released at 5, 4 units done by 9
+        3: {"completion": 8, "stretch": 2.0},  # 4 units of work done by 8
+    }
+    # Without the jobs every job counts as released at 0
+    assert analyze(SOLUTION, resources(), per_job=True)["per_job"][2]["stretch"] == pytest.approx(9 / 4)
+
+def test_aggregate_summarizes_metrics_only():
+    reports = [
+        {"algorithm": "x", "case": 0, "params": {"seed": 1}, "T": 10, "cached": True, "makespan": 10},
+        {"algorithm": "x", "case": 1, "params": {"seed": 2}, "T": 10, "cached": False, "makespan": 20},
+        {"algorithm": "y", "case": 2, "makespan": 5, "analytics": {"resources": {"A": {"cost": 3}}}},
+    ]
+    result = aggregate(reports)
+
+    assert set(result) == {"x", "y"}
+    assert result["x"]["runs"] == 2
+    assert set(result["x"]["metrics"]) == {"makespan"}
+    assert (result["x"]["metrics"]["makespan"]["mean"], result["x"]["metrics"]["makespan"]["max"]) == (15.0, 20.0)
+    assert set(result["y"]["metrics"]) == {"makespan", "analytics.resources.A.cost"}
+
+    by_case = aggregate(reports, by="case")
+    assert set(by_case) == {0, 1, 2} and "case" not in by_case[0]["metrics"]
@@ -0,0 +1,100 @@
+import itertools
+import random
+
+import pytest
+
+from src.algorithms import ALGORITHMS
+from src.algorithms.branch_and_bound import branch_and_bound
+from src.core.job import Job
+from src.core.resource import Resource
+
+def random_instance(rng):
+    # Long tasks on short horizons, so that packing, not total work, often
+    # decides the number of machines and greedy is not always optimal
+    T = rng.randint(4, 7)
+    types = ["A", "B"][:rng.randint(1, 2)]
+    costs = {t: rng.choice([1, 1, 2, 3]) for t in types}
+    jobs = []
+    for job_id in range(1, rng.randint(3, 5) + 1):
+        durations = {}
+        budget = T  # A job's tasks run one after another, so they must fit in T together
+        for t in rng.sample(types, len(types)):
+            durations[t] = rng.randint(budget // 3, budget)
+            budget -= durations[t]
+        jobs.append((job_id, durations))
+    return jobs, T, types, costs
+
+def build(jobs, T, types, costs):
+    resources = {t: Resource(t, T) for t in types}
+    for t in types:
+        resources[t].cost = costs[t]
+    return [Job(job_id, dict(durations), T) for job_id, durations in jobs], resources
+
+def brute_force_cost(jobs, T, types, costs):
+    # Cheapest machine counts for which some schedule exists, trying every
+    # machine and every start time for every task
+    tasks = [(j, t, duration) for j, (_, durations) in enumerate(jobs) for t, duration in durations.items() if duration]
+    per_type = {t: sum(1 for _, task_type, _ in tasks if task_type == t) for t in types}
+
+    def feasible(counts):
+        machine_busy = {t: [set() for _ in range(counts[t])] for t in types}
+        job_busy = [set() for _ in jobs]
+
+        def place(index):
+            if index == len(tasks):
+                return True
+            j, t, duration = tasks[index]
+            used_empty = False
+            for busy in machine_busy[t]:
+                if not busy:
+                    if used_empty:
+                        continue  # Empty machines are interchangeable
+                    used_empty = True
+                for start in range(T - duration + 1):
+                    units = set(range(start, start + duration))
+                    if units & busy or units & job_busy[j]:
+                        continue
+                    busy |= units
+                    job_busy[j] |= units
+                    if place(index + 1):
+                        return True
+                    busy -= units
+                    job_busy[j] -= units
+            return False
+
+        return place(0)
+
+    candidates = itertools.product(*(range(1 if per_type[t] else 0, per_type[t] + 1) for t in types))
+    return min(sum(costs[t] * count for t, count in zip(types, counts))
+               for counts in candidates if feasible(dict(zip(types, counts))))
+
+@pytest.mark.parametrize("seed", range(60))
+def test_branch_and_bound_is_optimal_and_never_worse_than_greedy(seed):
+    jobs, T, types, costs = random_instance(random.Random(seed))
+
+    job_objects, resources = build(jobs, T, types, costs)
+    result = branch_and_bound(job_objects, resources, time_limit=None)
+    assert result.optimal and result.lower_bound == result.cost
+    assert result.cost == brute_force_cost(jobs, T, types, costs)
+    assert result.cost == sum(len(resource.machines) * resource.cost for resource in resources.values())
+
+    scheduled = {}
+    for job_id, resource_type, _, (start, end) in result.solution:
+        scheduled[job_id, resource_type] = scheduled.get((job_id, resource_type), 0) + end - start
+    assert scheduled == {(job_id, t): d for job_id, durations in jobs for t, d in durations.items() if d}
+
+    greedy_jobs, greedy_resources = build(jobs, T, types, costs)
+    greedy = ALGORITHMS["no_preemption"](greedy_jobs, greedy_resources)
+    if len(greedy) == len(scheduled):  # Greedy placed every task
+        assert result.cost <= sum(len(resource.machines) * resource.cost for resource in greedy_resources.values())
+
+def test_branch_and_bound_schedules_are_feasible():
+    pytest.importorskip("numpy")
+    from src.utils.validation import validate_schedule
+
+    for seed in range(20):
+        jobs, T, types, costs = random_instance(random.Random(seed))
+        job_objects, resources = build(jobs, T, types, costs)
+        fresh_jobs, _ = build(jobs, T, types, costs)
+        result = branch_and_bound(job_objects, resources, time_limit=None)
+        assert validate_schedule(result.solution, fresh_jobs, resources) == []
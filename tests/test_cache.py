@@ -0,0 +1,61 @@
+from src.utils.cache import ResultCache
+from src.utils.sweep import run_case
+from src.utils.workloads import generate_instance
+
+def machine_counts(resources):
+    return {resource_type: len(resource.machines) for resource_type, resource in resources.items()}
+
+def test_run_with_status_reports_where_the_schedule_came_from(tmp_path):
+    instance = generate_instance(100, 2, 50, seed=1)
+    cache = ResultCache(str(tmp_path))
+
+    jobs, resources = instance.build()
+    solution, cached = cache.run_with_status("no_preemption", jobs, resources)
+    assert not cached
+    expected, machines = list(solution), machine_counts(resources)
+
+    jobs, resources = instance.build()
+    solution, cached = cache.run_with_status("no_preemption", jobs, resources)
+    assert cached and list(solution) == expected and machine_counts(resources) == machines
+
+    jobs, resources = instance.build()
+    solution, cached = ResultCache(str(tmp_path)).run_with_status("no_preemption", jobs, resources)
+    assert cached and list(solution) == expected and machine_counts(resources) == machines
+
+def test_runs_on_used_resources_bypass_the_cache():
+    instance = generate_instance(100, 2, 50, seed=2)
+    cache = ResultCache()
+    jobs, resources = instance.build()
+    cache.run("no_preemption", jobs, resources)
+
+    for resource in resources.values():
+        resource.add_machine()
+    jobs, _ = instance.build()
+    _, cached = cache.run_with_status("no_preemption", jobs, resources)
+    assert not cached
+    assert cache.stats()["misses"] == 1
+
+def test_sweep_cases_report_cache_hits():
+    case = {"num_jobs": 50, "num_resource_types": 2, "T": 30, "seed": 3}
+    cache = ResultCache()
+    assert [run_case(case, "no_preemption", cache=cache)["cached"] for _ in range(2)] == [False, True]
+
+def test_hits_leave_jobs_as_a_run_would():
+    instance = generate_instance(100, 3, 50, seed=4)
+    cache = ResultCache()
+    for algorithm in ("no_preemption", "weak_preemption"):
+        missed, resources = instance.build()
+        assert not cache.run_with_status(algorithm, missed, resources)[1]
+
+        hit, resources = instance.build()
+        assert cache.run_with_status(algorithm, hit, resources)[1]
+        assert [list(job.available_time) for job in hit] == [list(job.available_time) for job in missed]
+
+def test_jobs_with_repeated_ids_bypass_the_cache():
+    instance = generate_instance(20, 2, 50, seed=5)
+    cache = ResultCache()
+    for _ in range(2):
+        jobs, resources = instance.build()
+        jobs[1].id = jobs[0].id
+        assert not cache.run_with_status("no_preemption", jobs, resources)[1]
+    assert cache.stats()["misses"] == 0
@@ -0,0 +1,83 @@
+import pytest
+
+from src.algorithms import ALGORITHMS
+from src.algorithms.full_preemption import machine_lower_bounds
+from src.core.job import Job
+from src.core.resource import Resource
+from src.utils.workloads import generate_instance
+
+def test_job_pieces_are_disjoint_across_resource_types():
+    jobs = [Job(1, {"A": 8, "B": 2}, 10)]
+    resources = {"A": Resource("A", 10), "B": Resource("B", 10)}
+    solution = ALGORITHMS["full_preemption"](jobs, resources)
+
+    assert list(solution) == [(1, "A", 1, (0, 8)), (1, "B", 1, (8, 10))]
+    assert list(jobs[0].available_time) == []
+
+def test_skips_only_the_tasks_that_no_longer_fit():
+    jobs = [Job(1, {"A": 8, "B": 8, "C": 2}, 10), Job(2, {"A": 4}, 10, release_time=3)]
+    resources = {"A": Resource("A", 10), "B": Resource("B", 10), "C": Resource("C", 10)}
+    solution = ALGORITHMS["full_preemption"](jobs, resources)
+
+    # B needs 8 of the 2 units job 1 has left; C still fits
+    assert list(solution) == [(1, "A", 1, (0, 8)), (1, "C", 1, (8, 10)), (2, "A", 1, (8, 10)), (2, "A", 2, (3, 5))]
+    assert len(resources["B"].machines) == 0
+
+def test_wraps_tasks_onto_the_next_machine():
+    jobs = [Job(1, {"A": 6}, 10), Job(2, {"A": 6}, 10), Job(3, {"A": 6}, 10)]
+    resources = {"A": Resource("A", 10)}
+    solution = ALGORITHMS["full_preemption"](jobs, resources)
+
+    assert len(resources["A"].machines) == machine_lower_bounds(jobs, 10)["A"] == 2
+    assert sorted(solution) == [
+        (1, "A", 1, (0, 6)),
+        (2, "A", 1, (6, 10)),
+        (2, "A", 2, (0, 2)),
+        (3, "A", 2, (2, 8)),
+    ]
+
+@pytest.mark.parametrize("seed", range(10))
+def test_single_task_jobs_attain_the_lower_bound(seed):
+    instance = generate_instance(300, 3, 100, seed=seed, task_probability=0.34)
+    jobs, resources = instance.build()
+    jobs = [job for job in jobs if sum(1 for duration in job.task_durations.values() if duration > 0) == 1]
+    ALGORITHMS["full_preemption"](jobs, resources)
+
+    bounds = machine_lower_bounds(jobs, 100)
+    assert {t: len(resource.machines) for t, resource in resources.items() if resource.machines} == bounds
+
+@pytest.mark.parametrize("seed", range(10))
+def test_never_below_the_lower_bound(seed):
+    # Only jobs that fit completely, so that the bound counts scheduled work
+    instance = generate_instance(300, 3, 100, seed=seed)
+    jobs, resources = instance.build()
+    jobs = [job for job in jobs if sum(job.task_durations.values()) <= job.available_time.total]
+    bounds = machine_lower_bounds(jobs, 100)
+    ALGORITHMS["full_preemption"](jobs, resources)
+
+    for resource_type, bound in bounds.items():
+        assert len(resources[resource_type].machines) >= bound
+
+@pytest.mark.parametrize("seed", range(10))
+def test_schedules_are_feasible(seed):
+    pytest.importorskip("numpy")
+    from src.utils.validation import validate_schedule
+
+    instance = generate_instance(200, 3, 100, seed=seed)
+    jobs, resources = instance.build()
+    solution = ALGORITHMS["full_preemption"](jobs, resources)
+
+    assert validate_schedule(solution, jobs, resources, complete=False) == []
+
+    # Every job whose work fits in [release_time, T) is scheduled completely
+    table = instance.build_table()
+    assigned = {}
+    for job_id, resource_type, _, (start, end) in solution:
+        assigned[job_id, resource_type] = assigned.get((job_id, resource_type), 0) + end - start
+    for job in table:
+        if sum(job.task_durations.values()) <= job.available_time.total:
+            for resource_type, duration in job.task_durations.items():
+                assert assigned.get((job.id, resource_type), 0) == max(duration, 0)
+        else:
+            assert all(assigned.get((job.id, resource_type), duration) == duration
+                       for resource_type, duration in job.task_durations.items())
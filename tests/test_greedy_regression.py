@@ -0,0 +1,91 @@
+import random
+
+import pytest
+
+from src.algorithms import ALGORITHMS
+from src.algorithms.incremental import IncrementalScheduler
+from src.algorithms.online import OnlineScheduler, schedule_stream
+from src.core.job import Job
+from src.core.job_table import JobTable
+from src.core.resource import Resource
+from src.utils.metrics import RunMetrics
+from src.utils.tracing import RingBufferTracer
+
+from .baseline_greedy import schedule as baseline_schedule
+
+ALGORITHM_NAMES = ["no_preemption", "weak_preemption"]
+SEEDS = range(40)
+INSTANCES_PER_SEED = 15
+
+def random_instances(seed):
+    # Small horizons and many full-length tasks, so that machines fill up,
+    # free time fragments and ranges touch, which exercises the quirks
+    rng = random.Random(seed)
+    for _ in range(INSTANCES_PER_SEED):
+        T = rng.randint(3, 60)
+        types = ["A", "B", "C", "D"][:rng.randint(1, 4)]
+        jobs = [(i + 1, {t: rng.choice([0, rng.randint(1, T), rng.randint(1, max(1, T // 3))]) for t in types})
+                for i in range(rng.randint(1, 40))]
+        yield jobs, T, types
+
+def build(jobs, T, types):
+    return [Job(job_id, dict(durations), T) for job_id, durations in jobs], {t: Resource(t, T) for t in types}
+
+def free_times(resources, types):
+    return {t: [list(machine.available_time) for machine in resources[t].machines] for t in types}
+
+def check(algorithm, jobs, T, types, solution, resources, job_objects=None):
+    expected, machines, job_free = baseline_schedule(algorithm, jobs, T, types)
+    assert list(solution) == expected
+    assert free_times(resources, types) == machines
+    if job_objects is not None:
+        assert [list(job.available_time) for job in job_objects] == job_free
+
+@pytest.mark.parametrize("algorithm", ALGORITHM_NAMES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_interval_engine_matches_the_baseline(algorithm, seed):
+    for jobs, T, types in random_instances(seed):
+        job_objects, resources = build(jobs, T, types)
+        solution = ALGORITHMS[algorithm](job_objects, resources)
+        check(algorithm, jobs, T, types, solution, resources, job_objects)
+
+@pytest.mark.parametrize("algorithm", ALGORITHM_NAMES)
+@pytest.mark.parametrize("seed", SEEDS[:10])
+def test_instrumented_runs_match_the_baseline(algorithm, seed):
+    # Tracing and metrics take their own branches through the placement code
+    for jobs, T, types in random_instances(seed):
+        job_objects, resources = build(jobs, T, types)
+        solution = ALGORITHMS[algorithm](job_objects, resources, tracer=RingBufferTracer(), metrics=RunMetrics())
+        check(algorithm, jobs, T, types, solution, resources, job_objects)
+
+@pytest.mark.parametrize("algorithm", ALGORITHM_NAMES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_grid_engine_matches_the_baseline(algorithm, seed):
+    pytest.importorskip("numpy")
+    for jobs, T, types in random_instances(seed):
+        job_objects, resources = build(jobs, T, types)
+        solution = ALGORITHMS[algorithm](job_objects, resources, engine="grid")
+        check(algorithm, jobs, T, types, solution, resources)
+
+@pytest.mark.parametrize("algorithm", ALGORITHM_NAMES)
+@pytest.mark.parametrize("seed", SEEDS[:10])
+def test_job_table_input_matches_the_baseline(algorithm, seed):
+    for jobs, T, types in random_instances(seed):
+        job_objects, resources = build(jobs, T, types)
+        table = JobTable.from_jobs(job_objects, T, types)
+        solution = ALGORITHMS[algorithm](table, resources)
+        check(algorithm, jobs, T, types, solution, resources)
+
+@pytest.mark.parametrize("algorithm", ALGORITHM_NAMES)
+@pytest.mark.parametrize("seed", SEEDS[:20])
+def test_online_and_incremental_schedulers_match_the_baseline(algorithm, seed):
+    for jobs, T, types in random_instances(seed):
+        for scheduler_class in (OnlineScheduler, IncrementalScheduler):
+            job_objects, resources = build(jobs, T, types)
+            scheduler = scheduler_class(resources, algorithm)
+            solution = [task for job in job_objects for task in scheduler.submit(job)]
+            check(algorithm, jobs, T, types, solution, resources, job_objects)
+
+        job_objects, resources = build(jobs, T, types)
+        solution = list(schedule_stream(iter(job_objects), resources, algorithm))
+        check(algorithm, jobs, T, types, solution, resources, job_objects)
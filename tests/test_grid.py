@@ -0,0 +1,33 @@
+import pytest
+
+from src.algorithms import grid
+from src.algorithms.grid import GRID_MAX_HORIZON, grid_memory_estimate, use_grid
+from src.core.resource import Resource
+from src.utils.workloads import generate_instance
+
+def test_auto_and_interval_never_use_the_grid():
+    _, resources = generate_instance(50, 2, 100, seed=1).build()
+    assert not use_grid("auto", resources)
+    assert not use_grid("interval", resources)
+    with pytest.raises(ValueError, match="Unknown engine"):
+        use_grid("dense", resources)
+
+def test_memory_estimate_counts_machines_and_work():
+    instance = generate_instance(200, 3, 100, seed=2)
+    jobs, resources = instance.build()
+    resources["A"].add_machine()
+    work = {t: sum(max(job.task_durations.get(t, 0), 0) for job in jobs) for t in resources}
+    expected = sum(2 * ((t == "A") + -(-work[t] // 100)) * 100 for t in resources)
+
+    assert grid_memory_estimate(resources, jobs) == expected
+    assert grid_memory_estimate(resources, instance.build_table()) == expected
+    assert grid_memory_estimate(resources, iter(jobs)) == 2 * 100  # Iterators are not consumed
+
+def test_grid_falls_back_for_long_horizons_and_large_estimates(monkeypatch):
+    pytest.importorskip("numpy")
+    jobs, resources = generate_instance(200, 2, 100, seed=3).build()
+    assert use_grid("grid", resources, jobs)
+    assert not use_grid("grid", {"A": Resource("A", GRID_MAX_HORIZON + 1)})
+
+    monkeypatch.setattr(grid, "GRID_MEMORY_BUDGET", grid_memory_estimate(resources, jobs) - 1)
+    assert not use_grid("grid", resources, jobs)
@@ -0,0 +1,86 @@
+import pytest
+
+from src.algorithms.incremental import IncrementalScheduler, ScheduleDiff
+from src.core.interval_set import IntervalSet
+from src.core.job import Job
+from src.core.resource import Resource
+
+def free_times(resource):
+    return [list(machine.available_time) for machine in resource.machines]
+
+def test_release_coalesces_with_neighbouring_free_time():
+    free = IntervalSet([(0, 2), (4, 6), (8, 10), (12, 14)])
+    free.release((2, 3))  # Touches the left neighbour only
+    free.release((7, 8))  # Touches the right neighbour only
+    free.release((6, 7))  # Joins both neighbours
+    free.release((15, 16))  # Touches neither
+    assert list(free) == [(0, 3), (4, 10), (12, 14), (15, 16)]
+    assert (free.total, free.max_length()) == (12, 6)
+
+    for time_range in [(5, 9), (1, 1), (14, 16)]:
+        with pytest.raises(ValueError, match="cannot be released"):
+            free.release(time_range)
+
+def test_remove_frees_the_jobs_time_on_every_machine():
+    resources = {"A": Resource("A", 10), "B": Resource("B", 10)}
+    scheduler = IncrementalScheduler(resources)
+    scheduler.insert(Job(1, {"A": 4, "B": 3}, 10))
+    job = Job(2, {"A": 5, "B": 2}, 10)
+    assert scheduler.insert(job) == ScheduleDiff([], [(2, "A", 1, (4, 9)), (2, "B", 1, (0, 2))])
+
+    assert scheduler.remove(2) == ScheduleDiff([(2, "A", 1, (4, 9)), (2, "B", 1, (0, 2))], [])
+    assert free_times(resources["A"]) == [[(4, 10)]]
+    assert free_times(resources["B"]) == [[(0, 4), (7, 10)]]
+    assert list(job.available_time) == [(0, 10)]
+    assert list(scheduler.solution()) == [(1, "A", 1, (0, 4)), (1, "B", 1, (4, 7))]
+    with pytest.raises(KeyError):
+        scheduler.remove(2)
+
+    # The freed time is reused by the next insertion
+    assert scheduler.insert(Job(3, {"B": 4}, 10)).added == [(3, "B", 1, (0, 4))]
+
+def test_resize_replaces_only_the_changed_tasks():
+    resources = {"A": Resource("A", 10), "B": Resource("B", 10)}
+    scheduler = IncrementalScheduler(resources)
+    scheduler.insert(Job(1, {"A": 4, "B": 3}, 10))
+    scheduler.insert(Job(2, {"A": 5}, 10))
+
+    diff = scheduler.resize(1, {"A": 3, "B": 3})
+    assert diff == ScheduleDiff([(1, "A", 1, (0, 4))], [(1, "A", 1, (0, 3))])
+    assert scheduler.assignments(1) == [(1, "B", 1, (4, 7)), (1, "A", 1, (0, 3))]
+    assert free_times(resources["A"]) == [[(3, 4), (9, 10)]]
+    assert scheduler.assignments(2) == [(2, "A", 1, (4, 9))]
+
+    # A task may move within the time it held
+    assert scheduler.resize(1, {"A": 3, "B": 4}) == ScheduleDiff([(1, "B", 1, (4, 7))], [(1, "B", 1, (3, 7))])
+    assert scheduler.resize(1, {"A": 3, "B": 4}) == ScheduleDiff([], [])
+
+def test_resize_that_cannot_be_placed_drops_the_task():
+    resources = {"A": Resource("A", 10), "B": Resource("B", 10)}
+    scheduler = IncrementalScheduler(resources)
+    job = Job(1, {"A": 4, "B": 3}, 10)
+    scheduler.insert(job)
+
+    assert scheduler.resize(1, {"A": 4, "B": 12}) == ScheduleDiff([(1, "B", 1, (4, 7))], [])
+    assert scheduler.assignments(1) == [(1, "A", 1, (0, 4))]
+    assert free_times(resources["B"]) == [[(0, 10)], [(0, 10)]]  # Greedy still opened a machine for it
+    assert list(job.available_time) == [(4, 10)]
+
+    # Shrinking it again places it in the released time
+    assert scheduler.resize(1, {"A": 4, "B": 3}).added == [(1, "B", 1, (4, 7))]
+
+def test_remove_after_advance_keeps_committed_time():
+    resources = {"A": Resource("A", 10)}
+    scheduler = IncrementalScheduler(resources)
+    job = Job(1, {"A": 6}, 10)
+    scheduler.insert(job)
+    scheduler.insert(Job(2, {"A": 2}, 10, release_time=8))
+    scheduler.advance(4)
+
+    assert scheduler.remove(1).removed == [(1, "A", 1, (0, 6))]
+    assert free_times(resources["A"]) == [[(4, 8)]]
+    assert list(job.available_time) == [(4, 10)]
+
+    scheduler.advance(9)
+    scheduler.remove(2)
+    assert free_times(resources["A"]) == [[(9, 10)]]
@@ -0,0 +1,68 @@
+import pytest
+
+from src.algorithms import ALGORITHMS
+from src.core.solution import Solution
+from src.utils.job_files import load_binary, load_jobs, write_binary, write_csv, write_jsonl
+from src.utils.workloads import generate_instance
+
+def columns(table):
+    return (table.T, tuple(table.resource_types), list(table.job_ids), list(table.release_times),
+            list(table.durations))
+
+@pytest.mark.parametrize("suffix", [".csv", ".jsonl", ".bin"])
+def test_job_files_round_trip(tmp_path, suffix):
+    table = generate_instance(300, 3, 100, seed=1).build_table()
+    path = str(tmp_path / f"jobs{suffix}")
+    {".csv": write_csv, ".jsonl": write_jsonl, ".bin": write_binary}[suffix](table, path)
+
+    assert columns(load_jobs(path, 100)) == columns(table)
+
+@pytest.mark.parametrize("mmap_mode", [True, False])
+def test_binary_files_load_in_place_or_copied(tmp_path, mmap_mode):
+    table = generate_instance(50, 2, 20, seed=2).build_table()
+    path = str(tmp_path / "jobs.bin")
+    write_binary(table, path)
+
+    assert columns(load_binary(path, mmap_mode=mmap_mode)) == columns(table)
+
+def test_header_only_text_files_load_as_empty_tables(tmp_path):
+    csv_path = tmp_path / "jobs.csv"
+    csv_path.write_text("job_id,release_time,A,B\n")
+    jsonl_path = tmp_path / "jobs.jsonl"
+    jsonl_path.write_text('{"T": 10, "resource_types": ["A", "B"]}\n')
+
+    for table in (load_jobs(str(csv_path), 10), load_jobs(str(jsonl_path))):
+        assert (table.T, tuple(table.resource_types), len(table)) == (10, ("A", "B"), 0)
+
+def test_malformed_files_raise_value_errors(tmp_path):
+    empty = tmp_path / "empty.jsonl"
+    empty.write_text("")
+    with pytest.raises(ValueError, match="expected a header object"):
+        load_jobs(str(empty))
+
+    path = str(tmp_path / "jobs.bin")
+    write_binary(generate_instance(20, 2, 20, seed=3).build_table(), path)
+    with open(path, "rb") as f:
+        data = f.read()
+    (tmp_path / "short.bin").write_bytes(data[:10])
+    (tmp_path / "truncated.bin").write_bytes(data[:-8])
+    with pytest.raises(ValueError, match="is not a job file"):
+        load_jobs(str(tmp_path / "short.bin"))
+    with pytest.raises(ValueError, match="is truncated"):
+        load_jobs(str(tmp_path / "truncated.bin"))
+
+@pytest.mark.parametrize("mmap_mode", [True, False])
+def test_solution_files_round_trip(tmp_path, mmap_mode):
+    jobs, resources = generate_instance(200, 3, 50, seed=4).build()
+    solution = ALGORITHMS["weak_preemption"](jobs, resources)
+    path = str(tmp_path / "schedule.sol")
+    solution.save(path)
+
+    loaded = Solution.load(path, mmap_mode=mmap_mode)
+    assert loaded.resource_types == solution.resource_types
+    assert list(loaded) == list(solution)
+
+    other = tmp_path / "other.sol"
+    other.write_bytes(b"SCHDJOB1" + bytes(32))
+    with pytest.raises(ValueError, match="is not a solution file"):
+        Solution.load(str(other), mmap_mode=mmap_mode)
@@ -0,0 +1,44 @@
+import pytest
+
+from src.algorithms import ALGORITHMS
+from src.algorithms.local_search import local_search
+from src.utils.workloads import generate_instance
+
+def objective(solution, instance, resources):
+    # (unplaced tasks, machine cost), the order local search minimizes
+    tasks = sum(1 for job in instance.build()[0] for duration in job.task_durations.values() if duration > 0)
+    placed = len({(job_id, resource_type) for job_id, resource_type, _, _ in solution})
+    return tasks - placed, sum(len(resource.machines) * resource.cost for resource in resources.values())
+
+@pytest.mark.parametrize("algorithm", ["no_preemption", "weak_preemption"])
+@pytest.mark.parametrize("seed", range(5))
+def test_local_search_is_never_worse_than_greedy(algorithm, seed):
+    instance = generate_instance(60, 3, 40, seed=seed)
+    jobs, resources = instance.build()
+    greedy = objective(ALGORITHMS[algorithm](jobs, resources), instance, resources)
+
+    jobs, resources = instance.build()
+    solution = local_search(jobs, resources, algorithm, time_limit=0.2, restarts=2, workers=0, seed=seed)
+    assert objective(solution, instance, resources) <= greedy
+
+# Only no_preemption: weak_preemption keeps the baseline greedy's behavior of
+# leaving slots in place when a machine fails part way, which the validator
+# reports as extra time, for greedy and local search alike
+@pytest.mark.parametrize("seed", range(5))
+def test_local_search_schedules_are_feasible(seed):
+    pytest.importorskip("numpy")
+    from src.utils.validation import validate_schedule
+
+    instance = generate_instance(60, 3, 40, seed=seed)
+    jobs, resources = instance.build()
+    solution = local_search(jobs, resources, "no_preemption", time_limit=0.2, restarts=2, workers=0, seed=seed)
+    assert validate_schedule(solution, instance.build_table(), resources, complete=False) == []
+
+def test_local_search_in_worker_processes():
+    instance = generate_instance(40, 2, 30, seed=7)
+    jobs, resources = instance.build()
+    greedy = objective(ALGORITHMS["no_preemption"](jobs, resources), instance, resources)
+
+    jobs, resources = instance.build()
+    solution = local_search(jobs, resources, time_limit=0.5, restarts=2, workers=2)
+    assert objective(solution, instance, resources) <= greedy
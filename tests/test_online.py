@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from src.algorithms import ALGORITHMS
+from src.algorithms.online import OnlineScheduler, schedule_stream
+from src.core.interval_set import IntervalSet
+from src.core.job import Job
+from src.core.resource import Resource
+
+def test_discard_before_trims_at_the_time():
+    free = IntervalSet([(0, 3), (5, 8), (10, 12)])
+    free.discard_before(5)
+    assert list(free) == [(5, 8), (10, 12)]
+    assert free.total == 5
+
+    free.discard_before(6)
+    assert list(free) == [(6, 8), (10, 12)]
+    assert (free.total, free.max_length()) == (4, 2)
+
+    free.discard_before(8)
+    assert list(free) == [(10, 12)]
+
+def test_advance_compacts_machines_and_new_machines_start_at_the_horizon():
+    resources = {"A": Resource("A", 10)}
+    scheduler = OnlineScheduler(resources)
+    scheduler.submit(Job(1, {"A": 3}, 10))
+    scheduler.advance(4)
+
+    resource = resources["A"]
+    assert list(resource.machines[0].available_time) == [(4, 10)]
+    resource.add_machine()
+    assert list(resource.machines[1].available_time) == [(4, 10)]
+
+def test_submit_rejects_jobs_free_before_the_horizon():
+    scheduler = OnlineScheduler({"A": Resource("A", 10)})
+    scheduler.advance(4)
+    with pytest.raises(ValueError, match="before the committed horizon 4"):
+        scheduler.submit(Job(1, {"A": 3}, 10, release_time=3))
+    assert scheduler.submit(Job(2, {"A": 3}, 10, release_time=4)) == [(2, "A", 1, (4, 7))]
+
+@pytest.mark.parametrize("seed", range(50))
+def test_compacted_stream_matches_the_greedy(seed):
+    rng = random.Random(seed)
+    T = rng.choice([20, 50, 100])
+    types = ["A", "B", "C"][:rng.randint(1, 3)]
+    specs = sorted(((rng.randint(0, T - 5), {t: rng.randint(0, T // 3) for t in types})
+                    for _ in range(rng.randint(5, 60))), key=lambda spec: spec[0])
+
+    def jobs():
+        return [Job(i, dict(durations), T, release_time) for i, (release_time, durations) in enumerate(specs)]
+
+    expected = list(ALGORITHMS["no_preemption"](jobs(), {t: Resource(t, T) for t in types}))
+    streamed = list(schedule_stream(jobs(), {t: Resource(t, T) for t in types}, "no_preemption",
+                                    horizon=lambda job: job.release_time, compact_every=rng.choice([1, 3])))
+    assert streamed == expected
@@ -0,0 +1,96 @@
+import asyncio
+import json
+
+import pytest
+
+from src.core.job import Job
+from src.core.resource import Resource
+from src.utils.service import SchedulingService, ServiceStopped
+
+def make_service(**kwargs) -> SchedulingService:
+    return SchedulingService({"A": Resource("A", 10), "B": Resource("B", 10)}, **kwargs)
+
+async def post(port: int, method: str, target: str, payload=None):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {target} HTTP/1.1\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+                 + body)
+    await writer.drain()
+    status = (await reader.readline()).decode().split(" ", 1)[1].strip()
+    while (await reader.readline()) not in (b"\r\n", b""):
+        pass
+    data = json.loads(await reader.read())
+    writer.close()
+    return status, data
+
+def fail_job(service: SchedulingService, job_id: int) -> None:
+    submit = service.scheduler.submit
+
+    def failing_submit(job):
+        if job.id == job_id:
+            raise ValueError(f"Job {job_id} cannot be placed")
+        return submit(job)
+
+    service.scheduler.submit = failing_submit
+
+def test_list_post_reports_each_job():
+    async def main():
+        async with make_service() as service:
+            fail_job(service, 2)
+            server = await service.serve(port=0)
+            port = server.sockets[0].getsockname()[1]
+            jobs = [{"id": 1, "durations": {"A": 4}}, {"id": 2, "durations": {"A": 4}}, {"id": 3, "durations": {"B": 2}}]
+            return await post(port, "POST", "/jobs", jobs)
+
+    status, data = asyncio.run(main())
+    assert status == "200 OK"
+    assert data == {"results": [
+        {"assignments": [[1, "A", 1, [0, 4]]]},
+        {"error": "Job 2 cannot be placed"},
+        {"assignments": [[3, "B", 1, [0, 2]]]},
+    ]}
+
+def test_single_post_error_and_internal_error():
+    async def main():
+        async with make_service() as service:
+            fail_job(service, 2)
+            server = await service.serve(port=0)
+            port = server.sockets[0].getsockname()[1]
+            failed = await post(port, "POST", "/jobs", {"id": 2, "durations": {"A": 4}})
+
+            async def broken_route(method, target, body):
+                raise RuntimeError("broken")
+
+            service._route = broken_route
+            broken = await post(port, "GET", "/stats")
+            return failed, broken
+
+    failed, broken = asyncio.run(main())
+    assert failed == ("422 Unprocessable Entity", {"error": "Job 2 cannot be placed"})
+    assert broken == ("500 Internal Server Error", {"error": "RuntimeError: broken"})
+
+def test_submit_after_stop_is_rejected():
+    async def main():
+        service = make_service()
+        await service.start()
+        placed = await service.submit(Job(1, {"A": 4}, 10))
+        stopping = asyncio.ensure_future(service.stop())
+        await asyncio.sleep(0)
+        with pytest.raises(ServiceStopped):
+            await service.submit(Job(2, {"A": 4}, 10))
+        await stopping
+        return placed
+
+    assert asyncio.run(main()) == [(1, "A", 1, (0, 4))]
+
+def test_submits_waiting_for_space_finish_when_stopped():
+    async def main():
+        service = make_service(max_pending=1, batch_window=0)
+        await service.start()
+        submits = [asyncio.ensure_future(service.submit(Job(i, {"A": 1}, 10))) for i in range(1, 6)]
+        await asyncio.sleep(0)
+        await service.stop()
+        return await asyncio.wait_for(asyncio.gather(*submits, return_exceptions=True), 5)
+
+    results = asyncio.run(main())
+    assert all(isinstance(result, (list, ServiceStopped)) for result in results)
@@ -0,0 +1,68 @@
+from src.algorithms import ALGORITHMS
+from src.core.solution import Solution
+from src.core.state import SchedulerState
+from src.utils.workloads import generate_instance
+
+def contents(state):
+    return ([(job.id, job.release_time, list(job.available_time)) for job in state.jobs],
+            {t: [list(machine.available_time) for machine in resource.machines] for t, resource in state.resources.items()},
+            list(state.solution))
+
+def schedule(state, algorithm="weak_preemption"):
+    state.solution.extend(ALGORITHMS[algorithm](state.jobs, state.resources))
+
+def test_forks_do_not_affect_each_other():
+    state = SchedulerState.from_instance(generate_instance(200, 3, 50, seed=1))
+    schedule(state, "no_preemption")
+    before = contents(state)
+
+    fork = state.fork()
+    for job in fork.jobs:
+        job.task_durations = {t: max(d // 2, 1) for t, d in job.task_durations.items()}
+    schedule(fork)
+    assert contents(state) == before
+
+    other = state.fork()
+    schedule(state)
+    assert contents(other) == before
+    assert contents(fork) != contents(state)
+
+def test_reset_restores_the_initial_instance():
+    instance = generate_instance(200, 3, 50, seed=2)
+    state = SchedulerState.from_instance(instance)
+    initial = contents(state)
+    assert initial == contents(SchedulerState.from_instance(instance))
+
+    for _ in range(2):
+        schedule(state)
+        assert contents(state) != initial
+        state.reset()
+        assert contents(state) == initial
+
+    fork = state.fork()
+    schedule(fork)
+    fork.reset()
+    assert contents(fork) == initial
+
+def test_restore_returns_to_a_snapshot_repeatedly():
+    state = SchedulerState.from_instance(generate_instance(100, 2, 50, seed=3))
+    jobs = state.jobs[:50]
+    state.solution.extend(ALGORITHMS["no_preemption"](jobs, state.resources))
+    snapshot = state.snapshot()
+    expected = contents(state)
+
+    for algorithm in ("no_preemption", "weak_preemption"):
+        schedule(state, algorithm)
+        state.restore(snapshot)
+        assert contents(state) == expected
+
+def test_solution_copies_share_columns_until_an_append():
+    solution = Solution(["A"])
+    solution.add(1, "A", 1, 0, 5)
+    copy = solution.copy()
+    assert copy.starts is solution.starts
+
+    copy.add(2, "A", 1, 5, 7)
+    solution.add(3, "B", 2, 0, 1)
+    assert list(copy) == [(1, "A", 1, (0, 5)), (2, "A", 1, (5, 7))]
+    assert list(solution) == [(1, "A", 1, (0, 5)), (3, "B", 2, (0, 1))]
@@ -0,0 +1,67 @@
+import pytest
+
+from src.core.job import Job
+from src.core.resource import Resource
+from src.utils.validation import (BOUNDS, DURATION, JOB_OVERLAP, MACHINE_OVERLAP, UNKNOWN_JOB, ScheduleError,
+                                  check_schedule, validate_schedule)
+
+pytest.importorskip("numpy")
+
+VALID = [
+    (1, "A", 1, (0, 3)),
+    (1, "B", 1, (3, 5)),
+    (2, "A", 1, (3, 7)),
+    (3, "B", 1, (5, 10)),
+]
+
+def jobs_and_resources():
+    jobs = [Job(1, {"A": 3, "B": 2}, 10), Job(2, {"A": 4}, 10, release_time=2), Job(3, {"B": 5}, 10)]
+    return jobs, {"A": Resource("A", 10), "B": Resource("B", 10)}
+
+def violations(solution, complete=True):
+    jobs, resources = jobs_and_resources()
+    return [(v.kind, v.tasks, v.job_id, v.resource_type, v.machine_id)
+            for v in validate_schedule(solution, jobs, resources, complete)]
+
+def replaced(index, task):
+    solution = list(VALID)
+    solution[index] = task
+    return solution
+
+def test_valid_schedule_has_no_violations():
+    assert violations(VALID) == []
+    jobs, resources = jobs_and_resources()
+    check_schedule(VALID, jobs, resources)
+
+def test_machine_overlap_reports_both_tasks():
+    assert violations(replaced(2, (2, "A", 1, (2, 6)))) == [(MACHINE_OVERLAP, (0, 2), 2, "A", 1)]
+
+def test_job_overlap_reports_both_tasks():
+    assert violations(replaced(1, (1, "B", 2, (2, 4)))) == [(JOB_OVERLAP, (0, 1), 1, "B", 2)]
+
+@pytest.mark.parametrize("task", [
+    (2, "A", 2, (1, 5)),  # Before the release time
+    (2, "A", 2, (7, 11)),  # Past the horizon
+])
+def test_ranges_outside_the_jobs_window_are_out_of_bounds(task):
+    assert violations(replaced(2, task)) == [(BOUNDS, (2,), 2, "A", 2)]
+
+def test_wrong_total_duration_reports_every_piece():
+    short = replaced(3, (3, "B", 1, (5, 9)))
+    assert violations(short) == [(DURATION, (3,), 3, "B", 1)]
+
+    split = VALID[1:] + [(1, "A", 1, (0, 1)), (1, "A", 2, (1, 3)), (1, "A", 2, (8, 9))]
+    assert violations(split) == [(DURATION, (3, 4, 5), 1, "A", 2)]
+
+def test_missing_tasks_only_count_for_complete_schedules():
+    assert violations(VALID[:3]) == [(DURATION, (), 3, "B", None)]
+    assert violations(VALID[:3], complete=False) == []
+
+def test_unknown_jobs_are_reported():
+    assert violations(VALID + [(4, "A", 2, (0, 1))]) == [(UNKNOWN_JOB, (4,), 4, "A", 2)]
+
+def test_check_schedule_raises_with_the_violations():
+    jobs, resources = jobs_and_resources()
+    with pytest.raises(ScheduleError, match="1 schedule violations: Tasks 0 and 2 overlap on A machine 1") as error:
+        check_schedule(replaced(2, (2, "A", 1, (2, 6))), jobs, resources)
+    assert [v.kind for v in error.value.violations] == [MACHINE_OVERLAP]